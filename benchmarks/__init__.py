@@ -0,0 +1,6 @@
+"""
+Benchmarks for Modern Python project.
+
+Run a benchmark from the repository root, e.g.
+``python -m benchmarks.bench_group_stats``.
+"""
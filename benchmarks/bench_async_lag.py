@@ -0,0 +1,98 @@
+"""
+Benchmark event-loop lag under mixed cheap and expensive calculator load.
+
+A ticker task sleeps for a fixed interval and records how late it wakes up.
+The same workload runs once calling Calculator directly inside coroutines
+and once through AsyncCalculator, which offloads the expensive operations.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from src.async_calculator import AsyncCalculator
+from src.example_calculator import Calculator
+
+
+TICK = 0.005
+
+
+async def ticker(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late each tick wakes up."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def measure(
+    operations: list[Callable[[], Awaitable[Any]]],
+) -> tuple[float, list[float]]:
+    """Run operations concurrently with a ticker and return (elapsed, lags)."""
+    lags: list[float] = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(operation() for operation in operations))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await tick_task
+    return elapsed, lags
+
+
+def build_workload(
+    calc: Any,
+    args: argparse.Namespace,
+) -> list[Callable[[], Awaitable[Any]]]:
+    """Build a shuffled mix of cheap and expensive coroutine factories."""
+    rng = random.Random(0)
+    numbers = [rng.random() for _ in range(args.list_size)]
+
+    async def call(method: str, *call_args: Any) -> Any:
+        result = getattr(calc, method)(*call_args)
+        if asyncio.iscoroutine(result):
+            return await result
+        return result
+
+    operations: list[Callable[[], Awaitable[Any]]] = [
+        lambda: call("add", 1, 2) for _ in range(args.cheap)
+    ]
+    operations += [lambda: call("factorial", args.factorial_n)] * args.heavy
+    operations += [lambda: call("median", numbers)] * args.heavy
+    rng.shuffle(operations)
+    return operations
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cheap", type=int, default=1000)
+    parser.add_argument("--heavy", type=int, default=4)
+    parser.add_argument("--factorial-n", type=int, default=200_000)
+    parser.add_argument("--list-size", type=int, default=10**6)
+    args = parser.parse_args()
+
+    with ProcessPoolExecutor() as processes:
+        calculators: dict[str, Any] = {
+            "Calculator": Calculator(),
+            "Async (threads)": AsyncCalculator(),
+            "Async (processes)": AsyncCalculator(executor=processes),
+        }
+        for name, calc in calculators.items():
+            elapsed, lags = asyncio.run(measure(build_workload(calc, args)))
+            lags.sort()
+            worst = lags[-1] if lags else elapsed
+            p99 = lags[int(len(lags) * 0.99)] if lags else elapsed
+            print(
+                f"{name:<18} elapsed={elapsed:.2f}s ticks={len(lags)} "
+                f"lag p99={p99 * 1000:.1f}ms max={worst * 1000:.1f}ms",
+            )
+
+
+if __name__ == "__main__":
+    main()
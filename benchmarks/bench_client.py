@@ -0,0 +1,72 @@
+"""
+Benchmark CalculatorClient against a new connection per request.
+
+Runs ``add`` calls against an in-process stand-in server: one fresh HTTP
+connection per call, sequential client calls over a pooled keep-alive
+connection, many threads calling the client at once (batched
+automatically), and ``map`` (batched and pipelined).
+"""
+
+import argparse
+import http.client
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from src.client import CalculatorClient
+from src.server import start_server
+
+
+def new_connection_per_call(url: str, count: int) -> None:
+    """Open, use and close one connection per call."""
+    parts = urlsplit(url)
+    for i in range(count):
+        connection = http.client.HTTPConnection(parts.hostname or "", parts.port)
+        connection.request("POST", "/add", body=json.dumps({"args": [i, 1]}))
+        connection.getresponse().read()
+        connection.close()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=32)
+    args = parser.parse_args()
+
+    server, url = start_server()
+    timings = {}
+    start = time.perf_counter()
+    new_connection_per_call(url, args.calls)
+    timings["new connection per call"] = time.perf_counter() - start
+
+    with CalculatorClient(url) as calc:
+        calc.add(0, 0)  # open a pooled connection
+        start = time.perf_counter()
+        for i in range(args.calls):
+            calc.add(i, 1)
+        timings["client, sequential"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.threads) as pool:
+            list(pool.map(calc.add, range(args.calls), [1] * args.calls))
+        timings[f"client, {args.threads} threads"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        calc.map("add", [(i, 1) for i in range(args.calls)])
+        timings["client.map"] = time.perf_counter() - start
+    server.shutdown()
+    server.server_close()
+
+    baseline = timings["new connection per call"]
+    print(f"{args.calls} add calls")
+    for name, elapsed in timings.items():
+        print(
+            f"  {name:<26} {elapsed / args.calls * 1e6:8.1f}us/call"
+            f"  ({baseline / elapsed:.1f}x)",
+        )
+
+
+if __name__ == "__main__":
+    main()
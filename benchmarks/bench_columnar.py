@@ -0,0 +1,85 @@
+"""
+Benchmark repeated queries over a text file against a column file.
+
+The text baseline parses every line and runs Calculator methods on the whole
+list for each query, as when datasets are kept as one number per line.
+"""
+
+import argparse
+import math
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from src.columnar import ColumnReader, write_column
+from src.example_calculator import Calculator
+
+
+def timed(func: Callable[[], Any]) -> tuple[Any, float]:
+    """Return func's result and its run time in seconds."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=2_000_000)
+    parser.add_argument("--chunk-size", type=int, default=65_536)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # Slowly drifting series, like a historical measurement log
+    level = 0.0
+    values = []
+    for _ in range(args.size):
+        level += rng.gauss(0, 1)
+        values.append(round(level, 1))
+    low, high = sorted(rng.sample(values, 2))
+    calc = Calculator()
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = Path(directory) / "values.txt"
+        column_path = Path(directory) / "values.col"
+        text_path.write_text("".join(f"{v!r}\n" for v in values))
+        write_column(column_path, values, chunk_size=args.chunk_size)
+
+        def load_text() -> list[float]:
+            return [float(line) for line in text_path.read_text().splitlines()]
+
+        text_queries: dict[str, Callable[[], Any]] = {
+            "mean": lambda: calc.mean(load_text()),
+            "mode": lambda: calc.mode(load_text()),
+            "count_between": lambda: sum(low <= v <= high for v in load_text()),
+        }
+        with ColumnReader(column_path) as reader:
+            column_queries: dict[str, Callable[[], Any]] = {
+                "mean": reader.mean,
+                "mode": reader.mode,
+                "count_between": lambda: reader.count_between(low, high),
+            }
+            print(
+                f"size={args.size} text={text_path.stat().st_size / 1e6:.1f}MB "
+                f"column={column_path.stat().st_size / 1e6:.1f}MB "
+                f"chunks={len(reader.chunks)}",
+            )
+            for name, query in text_queries.items():
+                expected, text_time = timed(query)
+                reader.chunks_read = 0
+                result, column_time = timed(column_queries[name])
+                assert math.isclose(result, expected)
+                print(
+                    f"  {name:<14} text {text_time * 1000:8.1f}ms"
+                    f"  column {column_time * 1000:8.1f}ms"
+                    f"  ({reader.chunks_read} chunks read)"
+                    f"  {text_time / column_time:8.1f}x",
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark binomial coefficients against dividing full factorials.
+"""
+
+import argparse
+import random
+import time
+
+from src.combinatorics import ModularCombinatorics, combinations
+from src.example_calculator import Calculator
+
+
+MOD = 1_000_000_007
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=5000)
+    parser.add_argument("--exact-queries", type=int, default=1000)
+    parser.add_argument("--modular-queries", type=int, default=10**6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    calc = Calculator()
+    pairs = [
+        (n, rng.randint(0, n))
+        for n in (rng.randint(0, args.n) for _ in range(args.exact_queries))
+    ]
+
+    start = time.perf_counter()
+    for n, k in pairs:
+        calc.factorial(n) // (calc.factorial(k) * calc.factorial(n - k))
+    factorial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for n, k in pairs:
+        combinations(n, k)
+    comb_time = time.perf_counter() - start
+
+    ns = [rng.randint(0, args.n) for _ in range(args.modular_queries)]
+    ks = [rng.randint(0, n) for n in ns]
+    start = time.perf_counter()
+    table = ModularCombinatorics(MOD, args.n)
+    table.combinations_many(ns, ks)
+    modular_time = time.perf_counter() - start
+
+    print(f"{args.exact_queries} exact queries, n <= {args.n}")
+    print(f"  factorial division: {factorial_time * 1000:.1f}ms")
+    print(f"  combinations:       {comb_time * 1000:.1f}ms")
+    print(f"{args.modular_queries} queries mod {MOD} (including table build)")
+    print(f"  combinations_many:  {modular_time * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark counting-based median and mode against sorting and dict tallies.
+
+Sweeps list size and value range for integer data to show where the
+counting path in Calculator.median takes over from a comparison sort.
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from src.example_calculator import Calculator
+
+
+def sort_median(numbers: list[int]) -> float:
+    """Median by comparison sort, as before the counting path."""
+    set(map(type, numbers))  # same type check Calculator does
+    ordered = sorted(numbers)
+    n = len(ordered)
+    if n % 2 == 0:
+        return (ordered[n // 2 - 1] + ordered[n // 2]) / 2
+    return ordered[n // 2]
+
+
+def dict_mode(numbers: list[int]) -> int:
+    """Mode by per-element dict updates, as before the Counter path."""
+    set(map(type, numbers))  # same type check Calculator does
+    frequency: dict[int, int] = {}
+    for num in numbers:
+        frequency[num] = frequency.get(num, 0) + 1
+    max_count = max(frequency.values())
+    return next(num for num, count in frequency.items() if count == max_count)
+
+
+def best_of(func: Callable[[Any], Any], numbers: list[int], repeat: int) -> float:
+    """Return the fastest of several timed calls, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(numbers)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1_000, 10_000, 100_000, 1_000_000],
+    )
+    parser.add_argument(
+        "--ranges",
+        type=int,
+        nargs="+",
+        default=[10, 1_000, 10_000, 100_000],
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    calc = Calculator()
+
+    print(
+        f"{'size':>9} {'range':>8} {'sort':>10} {'median':>10} {'speedup':>8}"
+        f" {'dict':>10} {'mode':>10} {'speedup':>8}",
+    )
+    for size in args.sizes:
+        for value_range in args.ranges:
+            numbers = [rng.randrange(value_range) for _ in range(size)]
+            sort_time = best_of(sort_median, numbers, args.repeat)
+            median_time = best_of(calc.median, numbers, args.repeat)
+            dict_time = best_of(dict_mode, numbers, args.repeat)
+            mode_time = best_of(calc.mode, numbers, args.repeat)
+            print(
+                f"{size:>9} {value_range:>8}"
+                f" {sort_time * 1000:>8.3f}ms {median_time * 1000:>8.3f}ms"
+                f" {sort_time / median_time:>7.2f}x"
+                f" {dict_time * 1000:>8.3f}ms {mode_time * 1000:>8.3f}ms"
+                f" {dict_time / mode_time:>7.2f}x",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark Dataset storage widths against a list of Python numbers.
+
+For each storage mode this reports bytes per stored value, the time and
+peak extra memory of mean, median and mode, and the error introduced by
+storing the values (float32 rounding; integer data is stored exactly).
+"""
+
+import argparse
+import pickle
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from src.dataset import Dataset
+from src.example_calculator import Calculator
+
+
+def measure(func: Callable[[], Any]) -> tuple[Any, float, int]:
+    """
+    Return func's result, run time and peak traced allocation in bytes.
+
+    Time and memory come from separate calls, since tracing every allocation
+    slows boxing-heavy code far more than the rest.
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    floats = [round(rng.gauss(500.0, 100.0), 2) for _ in range(args.size)]
+    ints = [rng.randint(-30_000, 30_000) for _ in range(args.size)]
+    calc = Calculator()
+    cases: list[tuple[str, list[Any], str | None]] = [
+        ("list[float]", floats, None),
+        ("float64", floats, "float64"),
+        ("float32", floats, "float32"),
+        ("list[int]", ints, None),
+        ("int32", ints, "int32"),
+        ("int16", ints, "int16"),
+    ]
+
+    print(f"{args.size} values; time / peak extra memory per statistic")
+    print(
+        f"{'storage':<12} {'bytes/value':>11}"
+        f" {'mean':>16} {'median':>16} {'mode':>16} {'max rel error':>14}",
+    )
+    for name, values, dtype in cases:
+        # A list copy shares its number objects; unpickling makes new ones
+        # so they are counted
+        encoded = pickle.dumps(values)
+        data, _, stored = measure(
+            lambda encoded=encoded, values=values, dtype=dtype: (
+                pickle.loads(encoded) if dtype is None else Dataset(values, dtype)
+            ),
+        )
+        cells = []
+        for method in (calc.mean, calc.median, calc.mode):
+            _, elapsed, peak = measure(lambda method=method, data=data: method(data))
+            cells.append(f"{elapsed * 1000:6.0f}ms/{peak / 2**20:5.1f}MB")
+        error = max(
+            abs(stored_value - value) / abs(value) if value else 0.0
+            for stored_value, value in zip(data, values, strict=True)
+        )
+        print(
+            f"{name:<12} {stored / args.size:>11.1f} {' '.join(cells)} {error:>14.2e}",
+        )
+
+
+if __name__ == "__main__":
+    main()
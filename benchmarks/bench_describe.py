@@ -0,0 +1,43 @@
+"""
+Benchmark Calculator.describe against back-to-back mean/median/mode calls.
+"""
+
+import argparse
+import random
+import time
+
+from src.example_calculator import Calculator
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    numbers = [rng.gauss(0, 100) for _ in range(args.size)]
+    calc = Calculator()
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        calc.mean(numbers)
+        calc.median(numbers)
+        calc.mode(numbers)
+    separate_time = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        calc.describe(numbers)
+    describe_time = (time.perf_counter() - start) / args.repeat
+
+    print(f"size={args.size}")
+    print(f"mean+median+mode: {separate_time * 1000:.1f}ms")
+    print(f"describe:         {describe_time * 1000:.1f}ms")
+    print(f"speedup:          {separate_time / describe_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark Calculator.group_stats against per-group statistics calls.
+
+The baseline splits rows into per-group Python lists and calls
+``mean``/``median``/``mode`` on each, validating every group three times.
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+
+from src.example_calculator import Calculator, Number
+
+
+def make_rows(rows: int, groups: int, seed: int) -> tuple[list[int], list[float]]:
+    """Generate random group keys and values."""
+    rng = random.Random(seed)
+    keys = [rng.randrange(groups) for _ in range(rows)]
+    values = [float(rng.randrange(1000)) for _ in range(rows)]
+    return keys, values
+
+
+def baseline(calc: Calculator, keys: list[int], values: list[float]) -> int:
+    """Split rows into lists and call the single-list methods per group."""
+    split: defaultdict[int, list[Number]] = defaultdict(list)
+    for key, value in zip(keys, values, strict=True):
+        split[key].append(value)
+    for group in split.values():
+        calc.mean(group)
+        calc.median(group)
+        calc.mode(group)
+    return len(split)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10**7)
+    parser.add_argument("--groups", type=int, default=10**5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    calc = Calculator()
+    keys, values = make_rows(args.rows, args.groups, args.seed)
+
+    start = time.perf_counter()
+    baseline(calc, keys, values)
+    baseline_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calc.group_stats(keys, values, aggs=["mean", "median", "mode"])
+    grouped_time = time.perf_counter() - start
+
+    print(f"rows={args.rows} groups={args.groups}")
+    print(f"per-group methods: {baseline_time:.3f}s")
+    print(f"group_stats:       {grouped_time:.3f}s")
+    print(f"speedup:           {baseline_time / grouped_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
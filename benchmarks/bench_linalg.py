@@ -0,0 +1,50 @@
+"""
+Benchmark tiled matrix multiply against a naive triple loop.
+"""
+
+import argparse
+import random
+import time
+
+from src.linalg import Matrix, matmul
+
+
+def naive(a: list[list[float]], b: list[list[float]]) -> list[list[float]]:
+    """Multiply with nested Python loops over lists of rows."""
+    n = len(b)
+    cols = len(b[0])
+    return [[sum(row[k] * b[k][j] for k in range(n)) for j in range(cols)] for row in a]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--block-size", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    rows_a = [[rng.random() for _ in range(args.size)] for _ in range(args.size)]
+    rows_b = [[rng.random() for _ in range(args.size)] for _ in range(args.size)]
+    a = Matrix.from_rows(rows_a)
+    b = Matrix.from_rows(rows_b)
+
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    naive(rows_a, rows_b)
+    timings["naive"] = time.perf_counter() - start
+    for parallel in (None, "thread", "process"):
+        start = time.perf_counter()
+        matmul(
+            a, b, block_size=args.block_size, parallel=parallel, workers=args.workers
+        )
+        timings[f"matmul ({parallel or 'serial'})"] = time.perf_counter() - start
+
+    print(f"{args.size}x{args.size} matrices")
+    for name, seconds in timings.items():
+        print(f"  {name:<20} {seconds * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
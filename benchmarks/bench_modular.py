@@ -0,0 +1,67 @@
+"""
+Benchmark batched modular exponentiation and inversion against builtin pow.
+"""
+
+import argparse
+import math
+import random
+import time
+
+from src.modular import Modulus
+
+
+def bench(bits: int, count: int, rng: random.Random) -> None:
+    """Time one base to many exponents, and many inverses, for one size."""
+    m = rng.getrandbits(bits) | 1 | 1 << (bits - 1)
+    modulus = Modulus(m)
+    base = rng.randrange(2, m)
+    exponents = [rng.getrandbits(bits) for _ in range(count)]
+    values = [
+        v for v in (rng.randrange(1, m) for _ in range(count)) if math.gcd(v, m) == 1
+    ]
+
+    start = time.perf_counter()
+    expected = [pow(base, e, m) for e in exponents]
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = modulus.pow_exponents(base, exponents)
+    batch_time = time.perf_counter() - start
+    assert result == expected
+
+    start = time.perf_counter()
+    expected = [pow(v, -1, m) for v in values]
+    inv_loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = modulus.inverse_many(values)
+    inv_batch_time = time.perf_counter() - start
+    assert result == expected
+
+    print(f"{bits}-bit modulus and exponents, {count} values")
+    print(f"  pow loop, one base:  {loop_time * 1000:9.1f}ms")
+    print(
+        f"  pow_exponents:       {batch_time * 1000:9.1f}ms"
+        f"  ({loop_time / batch_time:.1f}x)",
+    )
+    print(f"  pow(v, -1, m) loop:  {inv_loop_time * 1000:9.1f}ms")
+    print(
+        f"  inverse_many:        {inv_batch_time * 1000:9.1f}ms"
+        f"  ({inv_loop_time / inv_batch_time:.1f}x)",
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bits", type=int, nargs="+", default=[64, 256, 2048])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for bits in args.bits:
+        # Keep the run time roughly level as operations get more expensive
+        bench(bits, max(args.count * 64 // bits, 20), rng)
+
+
+if __name__ == "__main__":
+    main()
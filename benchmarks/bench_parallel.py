@@ -0,0 +1,56 @@
+"""
+Benchmark batch kernels from 1 to N threads.
+
+Scaling beyond one thread needs a free-threaded build (python3.13t); with
+the GIL enabled every thread count runs serially and the table is flat.
+"""
+
+import argparse
+import random
+import time
+
+from src import batch
+from src.parallel import default_workers, gil_enabled
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=2_000_000)
+    parser.add_argument("--max-threads", type=int, default=default_workers())
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    numbers = [rng.uniform(0, 1000) for _ in range(args.size)]
+    divisors = [rng.uniform(1, 10) for _ in range(args.size)]
+    kernels = {
+        "divide": lambda workers: batch.divide(numbers, divisors, workers=workers),
+        "sqrt": lambda workers: batch.sqrt(numbers, workers=workers),
+        "factorial": lambda workers: batch.factorial(
+            [int(n) % 50 for n in numbers[: args.size // 10]], workers=workers
+        ),
+        "mean": lambda workers: batch.mean(numbers, workers=workers),
+        "median": lambda workers: batch.median(numbers, workers=workers),
+        "mode": lambda workers: batch.mode(numbers, workers=workers),
+    }
+
+    print(f"size={args.size} gil_enabled={gil_enabled()}")
+    thread_counts = sorted({1, *range(2, args.max_threads + 1, 2), args.max_threads})
+    print(f"{'kernel':<10}" + "".join(f"{f'{n} threads':>16}" for n in thread_counts))
+    for name, kernel in kernels.items():
+        baseline = 0.0
+        cells = []
+        for workers in thread_counts:
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                kernel(workers)
+                best = min(best, time.perf_counter() - start)
+            baseline = baseline or best
+            cells.append(f"{best * 1000:>7.0f}ms {baseline / best:>4.1f}x")
+        print(f"{name:<10}" + "".join(f" {cell}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
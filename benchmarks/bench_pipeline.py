@@ -0,0 +1,67 @@
+"""
+Benchmark a fused Pipeline against stage-by-stage intermediate lists.
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from src.example_calculator import Calculator
+from src.pipeline import Pipeline
+
+
+def measure(func: Callable[[], Any]) -> tuple[Any, float, int]:
+    """Return func's result, run time in seconds and peak traced bytes."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    readings = [rng.uniform(-100, 1000) for _ in range(args.size)]
+    calc = Calculator()
+
+    def by_hand() -> float:
+        scaled = [calc.multiply(r, 1.8) for r in readings]
+        shifted = [calc.add(s, 32) for s in scaled]
+        positive = [s for s in shifted if s > 0]
+        ratios = [calc.divide(p, 100) for p in positive]
+        return calc.mean(ratios)
+
+    def pipeline() -> float:
+        return (
+            Pipeline(readings, calc)
+            .map("multiply", 1.8)
+            .map("add", 32)
+            .filter((0.0).__lt__)
+            .map("divide", 100)
+            .reduce("mean")
+        )
+
+    expected, hand_time, hand_peak = measure(by_hand)
+    result, pipe_time, pipe_peak = measure(pipeline)
+    assert abs(result - expected) < abs(expected) * 1e-9
+
+    print(f"size={args.size}")
+    print(f"by hand:  {hand_time * 1000:8.1f}ms  peak {hand_peak / 1e6:6.1f}MB")
+    print(f"pipeline: {pipe_time * 1000:8.1f}ms  peak {pipe_peak / 1e6:6.1f}MB")
+    print(f"speedup:  {hand_time / pipe_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark Polynomial.evaluate_many against chaining Calculator operations.
+"""
+
+import argparse
+import random
+import time
+from array import array
+
+from src.example_calculator import Calculator
+from src.polynomial import Polynomial
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=10**6)
+    parser.add_argument("--degree", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    coefficients = [rng.uniform(-1, 1) for _ in range(args.degree + 1)]
+    xs = array("d", (rng.uniform(-1, 1) for _ in range(args.points)))
+    calc = Calculator()
+
+    start = time.perf_counter()
+    for x in xs:
+        total = 0.0
+        for power, coefficient in enumerate(coefficients):
+            total = calc.add(total, calc.multiply(coefficient, calc.power(x, power)))
+    calculator_time = time.perf_counter() - start
+
+    poly = Polynomial(coefficients)
+    start = time.perf_counter()
+    poly.evaluate_many(xs)
+    horner_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    poly.evaluate_many_with_derivative(xs)
+    derivative_time = time.perf_counter() - start
+
+    print(f"{args.points} points, degree {args.degree}")
+    print(f"  Calculator power/multiply/add: {calculator_time:.3f}s")
+    print(f"  evaluate_many:                 {horner_time:.3f}s")
+    print(f"  evaluate_many_with_derivative: {derivative_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark summation modes for speed and accuracy.
+
+Values span sixteen orders of magnitude with mixed signs, so the sum is far
+smaller than its terms and rounding errors show. For each mode this reports
+the time and relative error of a whole-input sum (``sum_of``) over a list
+and a float64 Dataset, and of a running total (``Accumulator``), against
+the correctly rounded sum.
+"""
+
+import argparse
+import math
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from src.dataset import Dataset
+from src.summation import MODES, Accumulator, sum_of
+
+
+def timed(func: Callable[[], Any]) -> tuple[Any, float]:
+    """Return func's result and run time."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def running_total(values: list[float], mode: str) -> float:
+    """Sum values one at a time."""
+    accumulator = Accumulator(mode)
+    for value in values:
+        accumulator.add(value)
+    return accumulator.value
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    values = [
+        rng.choice((-1, 1)) * rng.random() * 10.0 ** rng.randint(-8, 8)
+        for _ in range(args.size)
+    ]
+    dataset = Dataset(values)
+    exact = math.fsum(values)
+
+    def error(total: float) -> str:
+        return f"{abs(total - exact) / abs(exact):.1e}"
+
+    print(f"{args.size} values; time and relative error per mode")
+    print(
+        f"{'mode':<10} {'list':>10} {'error':>9} {'Dataset':>10} {'error':>9}"
+        f" {'running':>10} {'error':>9}",
+    )
+    for mode in MODES:
+        listed, list_time = timed(lambda mode=mode: sum_of(values, mode))
+        stored, dataset_time = timed(lambda mode=mode: sum_of(dataset, mode))
+        running, running_time = timed(
+            lambda mode=mode: running_total(values, mode),
+        )
+        print(
+            f"{mode:<10} {list_time * 1e3:>8.1f}ms {error(listed):>9}"
+            f" {dataset_time * 1e3:>8.1f}ms {error(stored):>9}"
+            f" {running_time * 1e3:>8.1f}ms {error(running):>9}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Asyncio front end for Calculator.
+
+This module provides an AsyncCalculator whose methods mirror Calculator's as
+coroutines. Cheap operations run inline on the event loop, where a thread
+hop would cost more than the work itself. Operations whose input size
+crosses a threshold (large factorials, big-integer powers, statistics over
+long lists) are sent to an executor so they do not stall other tasks. Pass a
+ProcessPoolExecutor to run them outside the GIL entirely.
+
+Operations that accept ``budget`` check it on the event loop, against the
+wrapped calculator's cost model, before anything is offloaded.
+"""
+
+import asyncio
+import functools
+from collections.abc import Hashable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+
+from src.example_calculator import Calculator, Number
+
+
+def _call(settings: dict[str, Any], method: str, *args: Any) -> Any:
+    """
+    Run a stateless Calculator operation.
+
+    Module-level so that process pools can pickle it. A fresh Calculator
+    built from the wrapped one's settings is used in the worker because
+    offloaded operations never touch memory or chain state.
+    """
+    return getattr(Calculator(**settings), method)(*args)
+
+
+class AsyncCalculator:
+    """
+    Awaitable wrapper around a Calculator.
+
+    Attributes:
+        calculator: Calculator holding memory and chain state
+        executor: Executor for expensive operations; the loop default if None
+        factorial_threshold: Factorials of larger n are offloaded
+        power_bits_threshold: Integer powers with more estimated result bits
+            are offloaded
+        list_threshold: Statistics over longer lists are offloaded
+    """
+
+    def __init__(
+        self,
+        calculator: Calculator | None = None,
+        *,
+        executor: Executor | None = None,
+        factorial_threshold: int = 2_000,
+        power_bits_threshold: int = 100_000,
+        list_threshold: int = 10_000,
+    ):
+        """
+        Initialize the async calculator.
+
+        Args:
+            calculator: Calculator to wrap; a new one by default
+            executor: Executor for expensive operations
+            factorial_threshold: Factorials of larger n are offloaded
+            power_bits_threshold: Integer powers with more estimated result
+                bits are offloaded
+            list_threshold: Statistics over longer lists are offloaded
+        """
+        self.calculator = calculator or Calculator()
+        self.executor = executor
+        self.factorial_threshold = factorial_threshold
+        self.power_bits_threshold = power_bits_threshold
+        self.list_threshold = list_threshold
+
+    # Basic arithmetic operations
+
+    async def add(self, a: Number, b: Number) -> float:
+        """Add two numbers."""
+        return self.calculator.add(a, b)
+
+    async def subtract(self, a: Number, b: Number) -> float:
+        """Subtract b from a."""
+        return self.calculator.subtract(a, b)
+
+    async def multiply(self, a: Number, b: Number) -> float:
+        """Multiply two numbers."""
+        return self.calculator.multiply(a, b)
+
+    async def divide(self, a: Number, b: Number) -> float:
+        """Divide a by b."""
+        return self.calculator.divide(a, b)
+
+    # Advanced mathematical operations
+
+    async def power(
+        self,
+        base: Number,
+        exponent: Number,
+        *,
+        budget: float | None = None,
+    ) -> float:
+        """Raise base to the power of exponent, offloading big integer powers."""
+        # Negative exponents give a float, cheap however large the base
+        heavy = (
+            isinstance(base, int)
+            and isinstance(exponent, int)
+            and exponent > 0
+            and exponent * base.bit_length() > self.power_bits_threshold
+        )
+        return await self._run(heavy, budget, "power", base, exponent)
+
+    async def sqrt(self, n: Number) -> float:
+        """Calculate square root of a number."""
+        return self.calculator.sqrt(n)
+
+    async def factorial(self, n: Number, *, budget: float | None = None) -> int:
+        """Calculate factorial, offloading large n."""
+        # Non-numbers do not compare; run them inline so the calculator's
+        # validation reports them
+        try:
+            heavy = n > self.factorial_threshold
+        except TypeError:
+            heavy = False
+        return await self._run(heavy, budget, "factorial", n)
+
+    # Memory operations
+
+    async def memory_store(self, value: Number) -> None:
+        """Store a value in memory."""
+        self.calculator.memory_store(value)
+
+    async def memory_recall(self) -> float:
+        """Recall value from memory."""
+        return self.calculator.memory_recall()
+
+    async def memory_add(self, value: Number) -> None:
+        """Add value to memory."""
+        self.calculator.memory_add(value)
+
+    async def memory_subtract(self, value: Number) -> None:
+        """Subtract value from memory."""
+        self.calculator.memory_subtract(value)
+
+    async def memory_clear(self) -> None:
+        """Clear memory (set to 0)."""
+        self.calculator.memory_clear()
+
+    # Chain operations
+
+    async def chain(self, initial: Number) -> "AsyncCalculator":
+        """Start a chain of operations with an initial value."""
+        self.calculator.chain(initial)
+        return self
+
+    async def chain_add(self, value: Number) -> "AsyncCalculator":
+        """Add value in chain operation."""
+        self.calculator.chain_add(value)
+        return self
+
+    async def chain_subtract(self, value: Number) -> "AsyncCalculator":
+        """Subtract value in chain operation."""
+        self.calculator.chain_subtract(value)
+        return self
+
+    async def chain_multiply(self, value: Number) -> "AsyncCalculator":
+        """Multiply by value in chain operation."""
+        self.calculator.chain_multiply(value)
+        return self
+
+    async def chain_divide(self, value: Number) -> "AsyncCalculator":
+        """Divide by value in chain operation."""
+        self.calculator.chain_divide(value)
+        return self
+
+    async def chain_power(self, value: Number) -> "AsyncCalculator":
+        """Raise to power in chain operation."""
+        self.calculator.chain_power(value)
+        return self
+
+    async def get_result(self) -> float:
+        """Get the result of chain operations."""
+        return self.calculator.get_result()
+
+    async def reset_chain(self) -> None:
+        """Reset chain operations."""
+        self.calculator.reset_chain()
+
+    # Statistical operations
+
+    async def mean(
+        self,
+        numbers: list[Number],
+        *,
+        budget: float | None = None,
+    ) -> float:
+        """Calculate arithmetic mean, offloading long lists."""
+        return await self._run(self._is_long(numbers), budget, "mean", numbers)
+
+    async def median(
+        self,
+        numbers: list[Number],
+        *,
+        budget: float | None = None,
+    ) -> float:
+        """Calculate median, offloading long lists."""
+        return await self._run(self._is_long(numbers), budget, "median", numbers)
+
+    async def mode(
+        self,
+        numbers: list[Number],
+        *,
+        budget: float | None = None,
+    ) -> Number:
+        """Calculate mode, offloading long lists."""
+        return await self._run(self._is_long(numbers), budget, "mode", numbers)
+
+    async def describe(
+        self,
+        numbers: list[Number],
+        *,
+        budget: float | None = None,
+    ) -> dict[str, Number]:
+        """Calculate summary statistics, offloading long lists."""
+        return await self._run(self._is_long(numbers), budget, "describe", numbers)
+
+    async def group_stats(
+        self,
+        keys: Sequence[Hashable],
+        values: Sequence[Number],
+        aggs: Sequence[str] = ("mean", "median", "mode"),
+    ) -> dict[Hashable, dict[str, Number]]:
+        """Calculate grouped aggregates, offloading long inputs."""
+        return await self._run(
+            self._is_long(values),
+            None,
+            "group_stats",
+            keys,
+            values,
+            aggs,
+        )
+
+    # Helper methods
+
+    def _is_long(self, numbers: Sequence[Any]) -> bool:
+        """Return whether a list is long enough to offload."""
+        return len(numbers) > self.list_threshold
+
+    async def _run(
+        self,
+        heavy: bool,
+        budget: float | None,
+        method: str,
+        *args: Any,
+    ) -> Any:
+        """
+        Run an operation inline, or in the executor when heavy.
+
+        Inline calls check budget themselves; heavy calls are checked here,
+        so an over-budget call is rejected before it is offloaded.
+        """
+        if not heavy:
+            kwargs = {} if budget is None else {"budget": budget}
+            return getattr(self.calculator, method)(*args, **kwargs)
+        self.calculator.check_budget(budget, method, *args)
+        if isinstance(self.executor, ProcessPoolExecutor):
+            settings = {
+                "cost_model": self.calculator.cost_model,
+                "summation": self.calculator.summation,
+            }
+            func = functools.partial(_call, settings, method, *args)
+        else:
+            func = functools.partial(getattr(self.calculator, method), *args)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func)
@@ -0,0 +1,563 @@
+"""
+Batch operations with a configurable error policy.
+
+This module applies calculator operations to whole sequences. Instead of
+raising on the first bad element, each function follows an ErrorPolicy:
+
+- ``raise``: raise the usual calculator exception for the first bad element
+- ``nan``: put NaN in place of each bad element (or return NaN for statistics)
+- ``skip``: leave bad elements out of the result
+- ``mask``: like ``nan``, plus a byte mask marking the bad positions
+
+Bad elements are detected with explicit checks, so no exception is created
+per failure. Every error is recorded with its element index in a compact
+BatchErrors log. When the whole input is valid, the work runs through
+C-level ``map`` without a per-element Python loop.
+
+Every function takes a ``workers`` count. On free-threaded builds large
+inputs are split into contiguous chunks processed on that many threads (see
+``src.parallel``); with the GIL enabled the work stays on the calling thread.
+"""
+
+import math
+import operator
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from enum import IntEnum, StrEnum
+from typing import Any
+
+from src.example_calculator import (
+    DivisionByZeroError,
+    InvalidOperationError,
+    Number,
+)
+from src.kernels import NUMBER_TYPES, median_of_runs
+from src.parallel import run_chunks
+
+
+class ErrorPolicy(StrEnum):
+    """How batch operations handle elements that would raise."""
+
+    RAISE = "raise"
+    NAN = "nan"
+    SKIP = "skip"
+    MASK = "mask"
+
+
+class ErrorCode(IntEnum):
+    """Reasons an element could not be processed."""
+
+    INVALID_TYPE = 1
+    DIVISION_BY_ZERO = 2
+    NEGATIVE_SQRT = 3
+    NEGATIVE_FACTORIAL = 4
+    NON_INTEGER_FACTORIAL = 5
+    NAN_VALUE = 6
+
+
+_ERRORS: dict[ErrorCode, tuple[type[Exception], str]] = {
+    ErrorCode.INVALID_TYPE: (TypeError, "Expected number"),
+    ErrorCode.DIVISION_BY_ZERO: (DivisionByZeroError, "Cannot divide by zero"),
+    ErrorCode.NEGATIVE_SQRT: (
+        InvalidOperationError,
+        "Cannot calculate square root of negative number",
+    ),
+    ErrorCode.NEGATIVE_FACTORIAL: (
+        InvalidOperationError,
+        "Factorial is not defined for negative numbers",
+    ),
+    ErrorCode.NON_INTEGER_FACTORIAL: (
+        InvalidOperationError,
+        "Factorial is only defined for integers",
+    ),
+    ErrorCode.NAN_VALUE: (InvalidOperationError, "Value is NaN"),
+}
+
+
+class BatchErrors:
+    """
+    Compact log of failed elements.
+
+    Attributes:
+        indices: Input index of each failed element
+        codes: ErrorCode of each failed element
+    """
+
+    def __init__(self):
+        """Initialize an empty error log."""
+        self.indices = array("q")
+        self.codes = array("B")
+
+    def __len__(self) -> int:
+        """Return the number of recorded errors."""
+        return len(self.indices)
+
+    def __iter__(self) -> Iterator[tuple[int, ErrorCode]]:
+        """Iterate over (index, error code) pairs."""
+        for index, code in zip(self.indices, self.codes, strict=True):
+            yield index, ErrorCode(code)
+
+    def append(self, index: int, code: ErrorCode) -> None:
+        """
+        Record a failed element.
+
+        Args:
+            index: Input index of the element
+            code: Reason for the failure
+        """
+        self.indices.append(index)
+        self.codes.append(code)
+
+    def extend(self, other: "BatchErrors") -> None:
+        """
+        Append every error from another log.
+
+        Args:
+            other: Log whose errors follow this one's
+        """
+        self.indices.extend(other.indices)
+        self.codes.extend(other.codes)
+
+
+class BatchResult:
+    """
+    Result of an element-wise batch operation.
+
+    Attributes:
+        values: Results; bad elements are NaN or left out, per policy
+        errors: Log of failed elements
+        mask: For the mask policy, 1 at each failed position, else None
+    """
+
+    def __init__(
+        self,
+        values: "array[float] | list[Number]",
+        errors: BatchErrors,
+        mask: bytearray | None = None,
+    ):
+        """Initialize a batch result."""
+        self.values = values
+        self.errors = errors
+        self.mask = mask
+
+
+class StatisticResult:
+    """
+    Result of a statistic computed under an error policy.
+
+    Attributes:
+        value: Statistic of the valid elements, or NaN per policy
+        errors: Log of failed elements
+        mask: For the mask policy, 1 at each failed position, else None
+    """
+
+    def __init__(
+        self,
+        value: Number,
+        errors: BatchErrors,
+        mask: bytearray | None = None,
+    ):
+        """Initialize a statistic result."""
+        self.value = value
+        self.errors = errors
+        self.mask = mask
+
+
+def divide(
+    dividends: Sequence[Any],
+    divisors: Sequence[Any],
+    policy: ErrorPolicy | str = ErrorPolicy.RAISE,
+    *,
+    workers: int | None = 1,
+) -> BatchResult:
+    """
+    Divide element-wise.
+
+    Args:
+        dividends: Dividends
+        divisors: Divisors
+        policy: Error policy
+        workers: Threads to split the work across; CPUs available if None
+
+    Returns:
+        Quotients with errors recorded per policy
+
+    Raises:
+        InvalidOperationError: If lengths differ or workers is not positive
+        TypeError: If an element is not a number under the raise policy
+        DivisionByZeroError: If a divisor is zero under the raise policy
+    """
+    if len(dividends) != len(divisors):
+        raise InvalidOperationError("Dividends and divisors must have the same length")
+    policy = ErrorPolicy(policy)
+
+    def chunk(start: int, stop: int) -> BatchResult:
+        return _divide(
+            _slice(dividends, start, stop), _slice(divisors, start, stop), policy, start
+        )
+
+    return _concatenate(run_chunks(chunk, len(dividends), workers))
+
+
+def _divide(
+    dividends: Sequence[Any],
+    divisors: Sequence[Any],
+    policy: ErrorPolicy,
+    offset: int,
+) -> BatchResult:
+    """Divide one chunk whose first element has input index offset."""
+    if (
+        NUMBER_TYPES.issuperset(map(type, dividends))
+        and NUMBER_TYPES.issuperset(map(type, divisors))
+        and 0 not in divisors
+    ):
+        values = array("d", map(operator.truediv, dividends, divisors))
+        return BatchResult(values, BatchErrors(), _empty_mask(policy, len(values)))
+
+    errors = _ErrorCollector(policy, len(dividends), offset)
+    values = array("d")
+    for index, (a, b) in enumerate(zip(dividends, divisors, strict=True)):
+        if not isinstance(a, int | float) or not isinstance(b, int | float):
+            errors.add(index, ErrorCode.INVALID_TYPE, values)
+        elif b == 0:
+            errors.add(index, ErrorCode.DIVISION_BY_ZERO, values)
+        else:
+            values.append(a / b)
+    return errors.result(values)
+
+
+def sqrt(
+    numbers: Sequence[Any],
+    policy: ErrorPolicy | str = ErrorPolicy.RAISE,
+    *,
+    workers: int | None = 1,
+) -> BatchResult:
+    """
+    Calculate square roots element-wise.
+
+    Args:
+        numbers: Numbers
+        policy: Error policy
+        workers: Threads to split the work across; CPUs available if None
+
+    Returns:
+        Square roots with errors recorded per policy
+
+    Raises:
+        TypeError: If an element is not a number under the raise policy
+        InvalidOperationError: If an element is negative under the raise policy,
+            or workers is not positive
+    """
+    policy = ErrorPolicy(policy)
+
+    def chunk(start: int, stop: int) -> BatchResult:
+        return _sqrt(_slice(numbers, start, stop), policy, start)
+
+    return _concatenate(run_chunks(chunk, len(numbers), workers))
+
+
+def _sqrt(numbers: Sequence[Any], policy: ErrorPolicy, offset: int) -> BatchResult:
+    """Calculate square roots of one chunk starting at input index offset."""
+    if NUMBER_TYPES.issuperset(map(type, numbers)) and (
+        not numbers or min(numbers) >= 0
+    ):
+        values = array("d", map(math.sqrt, numbers))
+        return BatchResult(values, BatchErrors(), _empty_mask(policy, len(values)))
+
+    errors = _ErrorCollector(policy, len(numbers), offset)
+    values = array("d")
+    for index, n in enumerate(numbers):
+        if not isinstance(n, int | float):
+            errors.add(index, ErrorCode.INVALID_TYPE, values)
+        elif n < 0:
+            errors.add(index, ErrorCode.NEGATIVE_SQRT, values)
+        else:
+            values.append(math.sqrt(n))
+    return errors.result(values)
+
+
+def factorial(
+    numbers: Sequence[Any],
+    policy: ErrorPolicy | str = ErrorPolicy.RAISE,
+    *,
+    workers: int | None = 1,
+) -> BatchResult:
+    """
+    Calculate factorials element-wise.
+
+    Results are exact integers, so values is a list rather than an array;
+    failed positions hold NaN under the nan and mask policies.
+
+    Args:
+        numbers: Non-negative integers
+        policy: Error policy
+        workers: Threads to split the work across; CPUs available if None
+
+    Returns:
+        Factorials with errors recorded per policy
+
+    Raises:
+        TypeError: If an element is not a number under the raise policy
+        InvalidOperationError: If an element is negative or not an integer
+            under the raise policy, or workers is not positive
+    """
+    policy = ErrorPolicy(policy)
+
+    def chunk(start: int, stop: int) -> BatchResult:
+        return _factorial(_slice(numbers, start, stop), policy, start)
+
+    return _concatenate(run_chunks(chunk, len(numbers), workers))
+
+
+def _factorial(
+    numbers: Sequence[Any],
+    policy: ErrorPolicy,
+    offset: int,
+) -> BatchResult:
+    """Calculate factorials of one chunk starting at input index offset."""
+    errors = _ErrorCollector(policy, len(numbers), offset)
+    values: list[Number] = []
+    for index, n in enumerate(numbers):
+        if not isinstance(n, int | float):
+            errors.add(index, ErrorCode.INVALID_TYPE, values)
+        elif n < 0:
+            errors.add(index, ErrorCode.NEGATIVE_FACTORIAL, values)
+        elif not isinstance(n, int) and not n.is_integer():
+            errors.add(index, ErrorCode.NON_INTEGER_FACTORIAL, values)
+        else:
+            values.append(math.factorial(int(n)))
+    return errors.result(values)
+
+
+def mean(
+    numbers: Sequence[Any],
+    policy: ErrorPolicy | str = ErrorPolicy.RAISE,
+    *,
+    workers: int | None = 1,
+) -> StatisticResult:
+    """
+    Calculate the arithmetic mean of the valid elements.
+
+    Non-numbers and NaN values are errors.
+
+    Args:
+        numbers: Numbers
+        policy: Error policy
+        workers: Threads to split the work across; CPUs available if None
+
+    Returns:
+        Mean with errors recorded per policy
+
+    Raises:
+        TypeError: If an element is not a number under the raise policy
+        InvalidOperationError: If an element is NaN or no element is valid
+            under the raise policy, or workers is not positive
+    """
+    return _statistic("mean", numbers, policy, workers)
+
+
+def median(
+    numbers: Sequence[Any],
+    policy: ErrorPolicy | str = ErrorPolicy.RAISE,
+    *,
+    workers: int | None = 1,
+) -> StatisticResult:
+    """
+    Calculate the median of the valid elements.
+
+    Non-numbers and NaN values are errors.
+
+    Args:
+        numbers: Numbers
+        policy: Error policy
+        workers: Threads to split the work across; CPUs available if None
+
+    Returns:
+        Median with errors recorded per policy
+
+    Raises:
+        TypeError: If an element is not a number under the raise policy
+        InvalidOperationError: If an element is NaN or no element is valid
+            under the raise policy, or workers is not positive
+    """
+    return _statistic("median", numbers, policy, workers)
+
+
+def mode(
+    numbers: Sequence[Any],
+    policy: ErrorPolicy | str = ErrorPolicy.RAISE,
+    *,
+    workers: int | None = 1,
+) -> StatisticResult:
+    """
+    Calculate the mode of the valid elements.
+
+    Non-numbers and NaN values are errors.
+
+    Args:
+        numbers: Numbers
+        policy: Error policy
+        workers: Threads to split the work across; CPUs available if None
+
+    Returns:
+        Mode with errors recorded per policy
+
+    Raises:
+        TypeError: If an element is not a number under the raise policy
+        InvalidOperationError: If an element is NaN or no element is valid
+            under the raise policy, or workers is not positive
+    """
+    return _statistic("mode", numbers, policy, workers)
+
+
+class _ErrorCollector:
+    """Apply an error policy while a batch result is being built."""
+
+    def __init__(self, policy: ErrorPolicy, size: int, offset: int = 0):
+        # offset is the input index of element 0, for chunked inputs
+        self.policy = policy
+        self.offset = offset
+        self.errors = BatchErrors()
+        self.mask = bytearray(size) if policy is ErrorPolicy.MASK else None
+
+    def add(
+        self,
+        index: int,
+        code: ErrorCode,
+        values: "array[float] | list[Number] | None" = None,
+    ) -> None:
+        """Record a failed element and pad values, if given, per policy."""
+        if self.policy is ErrorPolicy.RAISE:
+            raise _exception(self.offset + index, code)
+        self.errors.append(self.offset + index, code)
+        if self.mask is not None:
+            self.mask[index] = 1
+        if values is not None and self.policy is not ErrorPolicy.SKIP:
+            values.append(math.nan)
+
+    def result(self, values: "array[float] | list[Number]") -> BatchResult:
+        """Wrap values with the collected errors."""
+        return BatchResult(values, self.errors, self.mask)
+
+
+def _statistic(
+    name: str,
+    numbers: Sequence[Any],
+    policy: ErrorPolicy | str,
+    workers: int | None,
+) -> StatisticResult:
+    """Compute a statistic of the valid elements under an error policy."""
+    policy = ErrorPolicy(policy)
+    summarize, combine = _STATISTICS[name]
+
+    def chunk(start: int, stop: int) -> tuple[Any, int, _ErrorCollector]:
+        valid, errors = _valid_values(_slice(numbers, start, stop), policy, start)
+        return summarize(valid), len(valid), errors
+
+    chunks = run_chunks(chunk, len(numbers), workers)
+    count = sum(valid_count for _, valid_count, _ in chunks)
+    errors, mask = _join_errors(
+        [(collector.errors, collector.mask) for _, _, collector in chunks],
+    )
+
+    if not count:
+        if policy is ErrorPolicy.RAISE:
+            raise InvalidOperationError(f"Cannot calculate {name} of empty list")
+        value: Number = math.nan
+    elif policy is ErrorPolicy.NAN and errors:
+        value = math.nan
+    else:
+        value = combine([summary for summary, _, _ in chunks], count)
+    return StatisticResult(value, errors, mask)
+
+
+def _valid_values(
+    numbers: Sequence[Any],
+    policy: ErrorPolicy,
+    offset: int,
+) -> tuple["array[float]", _ErrorCollector]:
+    """Collect the valid elements of one chunk starting at input index offset."""
+    errors = _ErrorCollector(policy, len(numbers), offset)
+    if NUMBER_TYPES.issuperset(map(type, numbers)) and not any(
+        map(math.isnan, numbers),
+    ):
+        return array("d", numbers), errors
+    valid = array("d")
+    for index, n in enumerate(numbers):
+        if not isinstance(n, int | float):
+            errors.add(index, ErrorCode.INVALID_TYPE)
+        elif math.isnan(n):
+            errors.add(index, ErrorCode.NAN_VALUE)
+        else:
+            valid.append(n)
+    return valid, errors
+
+
+def _sorted(values: "array[float]") -> "array[float]":
+    return array("d", sorted(values))
+
+
+def _combine_mean(sums: list[float], count: int) -> float:
+    return sum(sums) / count
+
+
+def _combine_mode(counters: list[Counter[float]], _count: int) -> float:
+    # Merging in chunk order keeps keys in first-seen order, so most_common
+    # breaks ties the same way Calculator.mode does
+    merged: Counter[float] = Counter()
+    for counter in counters:
+        merged.update(counter)
+    return merged.most_common(1)[0][0]
+
+
+# Per-chunk summary and how chunk summaries combine, for each statistic
+_STATISTICS: dict[
+    str, tuple[Callable[[Any], Any], Callable[[list[Any], int], Number]]
+] = {
+    "mean": (sum, _combine_mean),
+    "median": (_sorted, median_of_runs),
+    "mode": (Counter, _combine_mode),
+}
+
+
+def _concatenate(results: list[BatchResult]) -> BatchResult:
+    """Join chunk results, in order, into one result."""
+    if len(results) == 1:
+        return results[0]
+    values = results[0].values[:0]
+    for result in results:
+        values.extend(result.values)  # type: ignore[arg-type]
+    errors, mask = _join_errors([(result.errors, result.mask) for result in results])
+    return BatchResult(values, errors, mask)
+
+
+def _join_errors(
+    parts: list[tuple[BatchErrors, bytearray | None]],
+) -> tuple[BatchErrors, bytearray | None]:
+    """Join chunk error logs and masks, in order."""
+    if len(parts) == 1:
+        return parts[0]
+    errors = BatchErrors()
+    for log, _ in parts:
+        errors.extend(log)
+    masks = [mask for _, mask in parts if mask is not None]
+    return errors, bytearray().join(masks) if masks else None
+
+
+def _slice(values: Sequence[Any], start: int, stop: int) -> Sequence[Any]:
+    """Return values[start:stop] without copying when it spans everything."""
+    if start == 0 and stop == len(values):
+        return values
+    return values[start:stop]
+
+
+def _empty_mask(policy: ErrorPolicy, size: int) -> bytearray | None:
+    """Return an all-clear mask for the mask policy."""
+    return bytearray(size) if policy is ErrorPolicy.MASK else None
+
+
+def _exception(index: int, code: ErrorCode) -> Exception:
+    """Build the exception raised for the first error under the raise policy."""
+    exception_type, message = _ERRORS[code]
+    return exception_type(f"{message} (index {index})")
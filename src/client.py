@@ -0,0 +1,404 @@
+"""
+Client for a remote Calculator service speaking the ``src.server`` protocol.
+
+This module provides a CalculatorClient whose methods mirror Calculator's
+stateless operations. Calls never open a connection of their own: they are
+queued, and a fixed pool of sender threads, each owning one keep-alive
+connection, takes them off the queue. A sender that finds a single call
+waiting sends it as ``POST /<operation>``; when more are queued, it takes up
+to ``max_batch * pipeline_depth`` of them, packs them into ``POST /batch``
+requests of at most ``max_batch`` calls, writes all of those requests before
+reading any response (HTTP/1.1 pipelining), then reads the responses in
+order. A single caller therefore pays one round trip per call on a warm
+connection, and many concurrent callers, or ``map``/``submit``, share round
+trips.
+
+Errors the service reports are raised as the matching Calculator exception
+(DivisionByZeroError, InvalidOperationError, TypeError, ...), so a client
+can stand in for a local Calculator.
+
+Example:
+    with CalculatorClient("http://127.0.0.1:8000") as calc:
+        calc.add(2, 3)
+        calc.map("sqrt", [(n,) for n in range(1000)])
+"""
+
+import json
+import queue
+import socket
+import threading
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future
+from typing import Any
+from urllib.parse import urlsplit
+
+from src.example_calculator import (
+    CalculatorError,
+    DivisionByZeroError,
+    InvalidOperationError,
+    Number,
+)
+
+
+# Exceptions re-raised by name; other reported errors become CalculatorError
+_ERRORS: dict[str, type[Exception]] = {
+    "DivisionByZeroError": DivisionByZeroError,
+    "InvalidOperationError": InvalidOperationError,
+    "NotFound": InvalidOperationError,
+    "TypeError": TypeError,
+    "ValueError": ValueError,
+    "OverflowError": OverflowError,
+}
+
+_Call = tuple[str, tuple[Any, ...], "Future[Any]"]
+
+
+class CalculatorClient:
+    """
+    Remote Calculator over pooled keep-alive connections.
+
+    Methods are safe to call from many threads at once; concurrent calls are
+    what lets the client batch. Close the client, or use it as a context
+    manager, to stop its sender threads and close its connections.
+
+    Attributes:
+        url: Base URL of the service
+        connections: Number of pooled connections and sender threads
+        max_batch: Most calls packed into one batch request
+        pipeline_depth: Most requests in flight on one connection
+        timeout: Socket timeout in seconds
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        connections: int = 4,
+        max_batch: int = 256,
+        pipeline_depth: int = 4,
+        timeout: float = 30.0,
+    ):
+        """
+        Initialize the client and start its sender threads.
+
+        Args:
+            url: Base URL, e.g. ``http://127.0.0.1:8000``
+            connections: Number of pooled connections and sender threads
+            max_batch: Most calls packed into one batch request
+            pipeline_depth: Most requests in flight on one connection
+            timeout: Socket timeout in seconds
+
+        Raises:
+            InvalidOperationError: If a count is not positive
+        """
+        if min(connections, max_batch, pipeline_depth) < 1:
+            raise InvalidOperationError(
+                "connections, max_batch and pipeline_depth must be positive",
+            )
+        parts = urlsplit(url)
+        self.url = url
+        self.connections = connections
+        self.max_batch = max_batch
+        self.pipeline_depth = pipeline_depth
+        self.timeout = timeout
+        self._host = parts.hostname or "127.0.0.1"
+        self._port = parts.port or 80
+        self._prefix = parts.path.rstrip("/")
+        self._queue: queue.SimpleQueue[_Call | None] = queue.SimpleQueue()
+        self._closed = False
+        # Held while checking _closed and queueing, so no call can land
+        # behind the senders' stop sentinels
+        self._lock = threading.Lock()
+        self._senders = [
+            threading.Thread(target=self._send_loop, daemon=True)
+            for _ in range(connections)
+        ]
+        for sender in self._senders:
+            sender.start()
+
+    def __enter__(self) -> "CalculatorClient":
+        """Return the client."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the client."""
+        self.close()
+
+    def close(self) -> None:
+        """Finish queued calls, then stop senders and close connections."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for _ in self._senders:
+                self._queue.put(None)
+        for sender in self._senders:
+            sender.join()
+
+    # Basic arithmetic operations
+
+    def add(self, a: Number, b: Number) -> float:
+        """Add two numbers."""
+        return self.call("add", a, b)
+
+    def subtract(self, a: Number, b: Number) -> float:
+        """Subtract b from a."""
+        return self.call("subtract", a, b)
+
+    def multiply(self, a: Number, b: Number) -> float:
+        """Multiply two numbers."""
+        return self.call("multiply", a, b)
+
+    def divide(self, a: Number, b: Number) -> float:
+        """Divide a by b."""
+        return self.call("divide", a, b)
+
+    # Advanced mathematical operations
+
+    def power(self, base: Number, exponent: Number) -> float:
+        """Raise base to the power of exponent."""
+        return self.call("power", base, exponent)
+
+    def sqrt(self, n: Number) -> float:
+        """Calculate square root of a number."""
+        return self.call("sqrt", n)
+
+    def factorial(self, n: Number) -> int:
+        """Calculate factorial."""
+        return self.call("factorial", n)
+
+    # Statistical operations
+
+    def mean(self, numbers: Sequence[Number]) -> float:
+        """Calculate arithmetic mean."""
+        return self.call("mean", list(numbers))
+
+    def median(self, numbers: Sequence[Number]) -> float:
+        """Calculate median."""
+        return self.call("median", list(numbers))
+
+    def mode(self, numbers: Sequence[Number]) -> Number:
+        """Calculate mode."""
+        return self.call("mode", list(numbers))
+
+    def describe(self, numbers: Sequence[Number]) -> dict[str, Number]:
+        """Calculate summary statistics."""
+        return self.call("describe", list(numbers))
+
+    # Generic calls
+
+    def call(self, operation: str, *args: Any) -> Any:
+        """
+        Run one operation remotely and wait for its result.
+
+        Args:
+            operation: Calculator method name
+            *args: Method arguments; must be JSON-serializable
+
+        Returns:
+            The operation's result
+
+        Raises:
+            CalculatorError: Or the specific error the service reported
+            TypeError: If the service reported a type error
+            OSError: If the service cannot be reached
+        """
+        return self.submit(operation, *args).result()
+
+    def submit(self, operation: str, *args: Any) -> "Future[Any]":
+        """
+        Queue one operation without waiting.
+
+        Calls submitted back to back are batched and pipelined together.
+
+        Returns:
+            Future resolving to the result, or to the error ``call`` raises
+
+        Raises:
+            InvalidOperationError: If the client is closed
+        """
+        future: Future[Any] = Future()
+        with self._lock:
+            if self._closed:
+                raise InvalidOperationError("Client is closed")
+            self._queue.put((operation, args, future))
+        return future
+
+    def map(self, operation: str, args: Iterable[Sequence[Any]]) -> list[Any]:
+        """
+        Run one operation over many argument tuples.
+
+        Args:
+            operation: Calculator method name
+            args: Argument tuple for each call
+
+        Returns:
+            Results in argument order
+
+        Raises:
+            CalculatorError: The first error in argument order, as ``call``
+        """
+        futures = [self.submit(operation, *call_args) for call_args in args]
+        return [future.result() for future in futures]
+
+    def _send_loop(self) -> None:
+        """Take queued calls and send them over this thread's connection."""
+        connection: _Connection | None = None
+        limit = self.max_batch * self.pipeline_depth
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            calls = [item]
+            while len(calls) < limit:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                calls.append(item)
+            encoded = self._encode(
+                [call for call in calls if call[2].set_running_or_notify_cancel()],
+            )
+            if not encoded:
+                continue
+            try:
+                if connection is None:
+                    connection = _Connection(self._host, self._port, self.timeout)
+                self._exchange(connection, encoded)
+            except Exception as exc:
+                # Any failure leaves the connection mid-exchange; no future
+                # may be left waiting on it
+                if connection is not None:
+                    connection.close()
+                    connection = None
+                for _, _, future in encoded:
+                    if not future.done():
+                        future.set_exception(exc)
+        if connection is not None:
+            connection.close()
+
+    @staticmethod
+    def _encode(calls: list[_Call]) -> list[tuple[str, str, "Future[Any]"]]:
+        """
+        Encode each call's arguments as JSON.
+
+        A call whose arguments cannot be encoded fails on its own future
+        and is dropped, so it cannot take its batch down with it.
+
+        Returns:
+            (operation, JSON arguments, future) for each encodable call
+        """
+        encoded = []
+        for operation, args, future in calls:
+            try:
+                encoded.append((operation, json.dumps(list(args)), future))
+            except (TypeError, ValueError) as exc:
+                future.set_exception(exc)
+        return encoded
+
+    def _exchange(
+        self,
+        connection: "_Connection",
+        calls: list[tuple[str, str, "Future[Any]"]],
+    ) -> None:
+        """Send encoded calls as pipelined requests and resolve their futures."""
+        groups = [
+            calls[start : start + self.max_batch]
+            for start in range(0, len(calls), self.max_batch)
+        ]
+        requests = []
+        for group in groups:
+            if len(group) == 1:
+                operation, args, _ = group[0]
+                requests.append(self._request(operation, f'{{"args": {args}}}'))
+            else:
+                batch = ", ".join(
+                    f'{{"operation": {json.dumps(operation)}, "args": {args}}}'
+                    for operation, args, _ in group
+                )
+                requests.append(self._request("batch", f'{{"calls": [{batch}]}}'))
+        connection.send(b"".join(requests))
+        for group in groups:
+            status, payload = connection.read_response()
+            if len(group) == 1:
+                _resolve(group[0][2], status, payload)
+            elif status != 200:  # noqa: PLR2004
+                for _, _, future in group:
+                    _resolve(future, status, payload)
+            else:
+                for (_, _, future), result in zip(
+                    group,
+                    payload["results"],
+                    strict=True,
+                ):
+                    _resolve(future, 400 if "error" in result else 200, result)
+
+    def _request(self, operation: str, payload: str) -> bytes:
+        """Encode one POST request with a JSON body."""
+        body = payload.encode()
+        head = (
+            f"POST {self._prefix}/{operation} HTTP/1.1\r\n"
+            f"Host: {self._host}:{self._port}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        )
+        return head.encode() + body
+
+
+class _Connection:
+    """
+    One keep-alive HTTP/1.1 connection that allows pipelining.
+
+    http.client sends the next request only after reading the previous
+    response, so requests are written and responses parsed here directly.
+    Responses from the service always carry Content-Length.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float):
+        self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self._socket.makefile("rb")
+
+    def send(self, data: bytes) -> None:
+        """Write request bytes."""
+        self._socket.sendall(data)
+
+    def read_response(self) -> tuple[int, dict[str, Any]]:
+        """
+        Read the next response.
+
+        Returns:
+            HTTP status and decoded JSON body
+
+        Raises:
+            ConnectionError: If the server closed the connection
+            ValueError: If the response is malformed
+        """
+        status_line = self._file.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by server")
+        status = int(status_line.split()[1])
+        length = 0
+        while (line := self._file.readline()) not in {b"\r\n", b"\n", b""}:
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                length = int(value)
+        return status, json.loads(self._file.read(length))
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._file.close()
+        self._socket.close()
+
+
+def _resolve(future: "Future[Any]", status: int, payload: dict[str, Any]) -> None:
+    """Complete a future from one call's status and response object."""
+    if status == 200:  # noqa: PLR2004
+        future.set_result(payload["result"])
+        return
+    error = _ERRORS.get(payload.get("error", ""), CalculatorError)
+    future.set_exception(error(payload.get("message", "Request failed")))
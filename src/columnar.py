@@ -0,0 +1,463 @@
+"""
+Chunked binary column files with per-chunk zone maps.
+
+This module provides a ColumnWriter that stores a column of floats as raw
+little-endian float64 chunks of a fixed size, and a ColumnReader that
+queries it. Each chunk has a summary (count, sum, min, max and a small
+equal-width histogram over [min, max]) kept in a footer table at the end of
+the file, so count, sum, mean, min and max are answered from the footers
+alone, and range queries skip every chunk whose min/max or histogram shows
+it cannot hold a matching value. Only mode, and chunks that partly overlap a
+range, need the raw values.
+
+File layout::
+
+    MAGIC
+    chunk 0 values, chunk 1 values, ...   (float64, little-endian)
+    chunk summaries                        (one footer record per chunk)
+    trailer                                (footer offset, chunk count,
+                                            chunk size, MAGIC)
+
+Store one column per file; files written with the same chunk size keep rows
+aligned chunk for chunk.
+"""
+
+import math
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import repeat
+from operator import mul, sub
+from pathlib import Path
+
+from src.example_calculator import InvalidOperationError, Number
+
+
+MAGIC = b"CALCCOL1"
+
+HISTOGRAM_BINS = 16
+
+_FOOTER = struct.Struct(f"<QIddd{HISTOGRAM_BINS}I")
+_TRAILER = struct.Struct("<QQI8s")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class ChunkSummary:
+    """
+    Zone map of one chunk.
+
+    Attributes:
+        offset: Byte offset of the chunk's values in the file
+        count: Number of values
+        total: Sum of the values
+        minimum: Smallest value
+        maximum: Largest value
+        histogram: Value counts in HISTOGRAM_BINS equal-width bins spanning
+            [minimum, maximum]
+    """
+
+    def __init__(
+        self,
+        offset: int,
+        count: int,
+        total: float,
+        minimum: float,
+        maximum: float,
+        histogram: tuple[int, ...],
+    ):
+        """Initialize a chunk summary."""
+        self.offset = offset
+        self.count = count
+        self.total = total
+        self.minimum = minimum
+        self.maximum = maximum
+        self.histogram = histogram
+
+    @classmethod
+    def of(cls, values: Sequence[float], offset: int) -> "ChunkSummary":
+        """
+        Summarize a non-empty chunk.
+
+        Args:
+            values: Chunk values
+            offset: Byte offset of the values in the file
+
+        Returns:
+            Summary of values
+        """
+        minimum = min(values)
+        maximum = max(values)
+        counts = Counter(_bin_indices(values, minimum, maximum))
+        # The maximum itself scales to HISTOGRAM_BINS; it belongs in the last bin
+        counts[HISTOGRAM_BINS - 1] += counts.pop(HISTOGRAM_BINS, 0)
+        histogram = tuple(counts[i] for i in range(HISTOGRAM_BINS))
+        return cls(offset, len(values), sum(values), minimum, maximum, histogram)
+
+    def may_contain(self, low: Number, high: Number) -> bool:
+        """
+        Return whether the chunk may hold a value in [low, high].
+
+        Args:
+            low: Lower bound (inclusive)
+            high: Upper bound (inclusive)
+
+        Returns:
+            False only if no value can be in range
+        """
+        if high < self.minimum or low > self.maximum:
+            return False
+        first, last = (
+            min(index, HISTOGRAM_BINS - 1)
+            for index in _bin_indices(
+                (max(low, self.minimum), min(high, self.maximum)),
+                self.minimum,
+                self.maximum,
+            )
+        )
+        return any(self.histogram[first : last + 1])
+
+    def within(self, low: Number, high: Number) -> bool:
+        """Return whether every value of the chunk is in [low, high]."""
+        return low <= self.minimum and self.maximum <= high
+
+
+class ColumnWriter:
+    """
+    Writes a column file chunk by chunk.
+
+    Attributes:
+        path: Column file path
+        chunk_size: Values per chunk; the last chunk may be shorter
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, chunk_size: int = 65_536):
+        """
+        Create or truncate a column file.
+
+        Args:
+            path: Column file path
+            chunk_size: Values per chunk
+
+        Raises:
+            InvalidOperationError: If chunk_size is not positive
+        """
+        if chunk_size <= 0:
+            raise InvalidOperationError("Chunk size must be positive")
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self._pending = array("d")
+        self._summaries: list[ChunkSummary] = []
+        self._file = self.path.open("wb")
+        self._file.write(MAGIC)
+
+    def append(self, value: Number) -> None:
+        """Append one value."""
+        self.extend((value,))
+
+    def extend(self, values: Iterable[Number]) -> None:
+        """
+        Append values, writing every chunk that fills up.
+
+        Args:
+            values: Values to append
+
+        Raises:
+            TypeError: If values contain non-numbers
+            InvalidOperationError: If values contain NaN or the writer is
+                closed
+        """
+        if self._file.closed:
+            raise InvalidOperationError("Column writer is closed")
+        batch = array("d", values)
+        if any(map(math.isnan, batch)):
+            raise InvalidOperationError("Cannot store NaN in a column")
+        self._pending.extend(batch)
+        full = len(self._pending) - len(self._pending) % self.chunk_size
+        for start in range(0, full, self.chunk_size):
+            self._write_chunk(self._pending[start : start + self.chunk_size])
+        del self._pending[:full]
+
+    def close(self) -> None:
+        """Write the last partial chunk, the chunk summaries and the trailer."""
+        if self._file.closed:
+            return
+        if self._pending:
+            self._write_chunk(self._pending)
+            self._pending = array("d")
+        footer_offset = self._file.tell()
+        for summary in self._summaries:
+            self._file.write(
+                _FOOTER.pack(
+                    summary.offset,
+                    summary.count,
+                    summary.total,
+                    summary.minimum,
+                    summary.maximum,
+                    *summary.histogram,
+                ),
+            )
+        self._file.write(
+            _TRAILER.pack(footer_offset, len(self._summaries), self.chunk_size, MAGIC),
+        )
+        self._file.close()
+
+    def __enter__(self) -> "ColumnWriter":
+        """Return the writer for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the writer on context exit."""
+        self.close()
+
+    def _write_chunk(self, values: "array[float]") -> None:
+        """Write one chunk of values and remember its summary."""
+        self._summaries.append(ChunkSummary.of(values, self._file.tell()))
+        if not _LITTLE_ENDIAN:
+            values = array("d", values)
+            values.byteswap()
+        self._file.write(values.tobytes())
+
+
+class ColumnReader:
+    """
+    Answers queries over a column file.
+
+    Raw chunk values are read only when the chunk summaries cannot answer.
+
+    Attributes:
+        path: Column file path
+        chunk_size: Values per chunk the file was written with
+        chunks: Summary of each chunk, in file order
+        chunks_read: Number of chunks whose values have been read
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """
+        Open a column file and load its chunk summaries.
+
+        Args:
+            path: Column file path
+
+        Raises:
+            InvalidOperationError: If the file is not a complete column file
+        """
+        self.path = Path(path)
+        self._file = self.path.open("rb")
+        try:
+            self.chunks = self._read_summaries()
+        except Exception:
+            self._file.close()
+            raise
+        self.chunks_read = 0
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return sum(chunk.count for chunk in self.chunks)
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over all values in order."""
+        for index in range(len(self.chunks)):
+            yield from self.read_chunk(index)
+
+    def __enter__(self) -> "ColumnReader":
+        """Return the reader for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the reader on context exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the column file."""
+        self._file.close()
+
+    def read_chunk(self, index: int) -> "array[float]":
+        """
+        Read the values of one chunk.
+
+        Args:
+            index: Chunk index
+
+        Returns:
+            Chunk values
+        """
+        chunk = self.chunks[index]
+        self._file.seek(chunk.offset)
+        values = array("d")
+        values.frombytes(self._file.read(chunk.count * values.itemsize))
+        if not _LITTLE_ENDIAN:
+            values.byteswap()
+        self.chunks_read += 1
+        return values
+
+    def sum(self) -> float:
+        """Return the sum of all values, from chunk summaries."""
+        return sum(chunk.total for chunk in self.chunks)
+
+    def mean(self) -> float:
+        """
+        Return the arithmetic mean, from chunk summaries.
+
+        Raises:
+            InvalidOperationError: If the column is empty
+        """
+        self._ensure_not_empty("mean")
+        return self.sum() / len(self)
+
+    def min(self) -> float:
+        """
+        Return the smallest value, from chunk summaries.
+
+        Raises:
+            InvalidOperationError: If the column is empty
+        """
+        self._ensure_not_empty("min")
+        return min(chunk.minimum for chunk in self.chunks)
+
+    def max(self) -> float:
+        """
+        Return the largest value, from chunk summaries.
+
+        Raises:
+            InvalidOperationError: If the column is empty
+        """
+        self._ensure_not_empty("max")
+        return max(chunk.maximum for chunk in self.chunks)
+
+    def mode(self) -> float:
+        """
+        Return the most frequent value; ties go to the first value seen.
+
+        Summaries cannot answer this, so every chunk is read.
+
+        Raises:
+            InvalidOperationError: If the column is empty
+        """
+        self._ensure_not_empty("mode")
+        counts: Counter[float] = Counter()
+        for index in range(len(self.chunks)):
+            counts.update(self.read_chunk(index))
+        return counts.most_common(1)[0][0]
+
+    def count_between(self, low: Number, high: Number) -> int:
+        """
+        Count values in the closed interval [low, high].
+
+        Chunks entirely inside the interval are counted from their summary
+        and chunks that cannot overlap it are skipped.
+
+        Args:
+            low: Lower bound (inclusive)
+            high: Upper bound (inclusive)
+
+        Returns:
+            Number of values between low and high
+        """
+        count = 0
+        for index, chunk in enumerate(self.chunks):
+            if chunk.within(low, high):
+                count += chunk.count
+            elif chunk.may_contain(low, high):
+                count += sum(low <= v <= high for v in self.read_chunk(index))
+        return count
+
+    def values_between(self, low: Number, high: Number) -> "array[float]":
+        """
+        Return values in the closed interval [low, high], in file order.
+
+        Args:
+            low: Lower bound (inclusive)
+            high: Upper bound (inclusive)
+
+        Returns:
+            Matching values
+        """
+        result = array("d")
+        for index, chunk in enumerate(self.chunks):
+            if chunk.within(low, high):
+                result.extend(self.read_chunk(index))
+            elif chunk.may_contain(low, high):
+                result.extend(v for v in self.read_chunk(index) if low <= v <= high)
+        return result
+
+    def _read_summaries(self) -> list[ChunkSummary]:
+        """Validate the file and read its footer table."""
+        if self._file.read(len(MAGIC)) != MAGIC:
+            raise InvalidOperationError(f"Not a column file: {self.path}")
+        size = self._file.seek(0, os.SEEK_END)
+        if size < len(MAGIC) + _TRAILER.size:
+            raise InvalidOperationError(f"Truncated column file: {self.path}")
+        self._file.seek(size - _TRAILER.size)
+        footer_offset, chunk_count, self.chunk_size, magic = _TRAILER.unpack(
+            self._file.read(_TRAILER.size),
+        )
+        if magic != MAGIC:
+            raise InvalidOperationError(f"Truncated column file: {self.path}")
+        self._file.seek(footer_offset)
+        footers = self._file.read(chunk_count * _FOOTER.size)
+        return [
+            ChunkSummary(offset, count, total, minimum, maximum, tuple(histogram))
+            for offset, count, total, minimum, maximum, *histogram in (
+                _FOOTER.iter_unpack(footers)
+            )
+        ]
+
+    def _ensure_not_empty(self, name: str) -> None:
+        """Raise if the column holds no values."""
+        if not self.chunks:
+            raise InvalidOperationError(f"Cannot calculate {name} of empty column")
+
+
+def write_column(
+    path: str | os.PathLike[str],
+    values: Iterable[Number],
+    *,
+    chunk_size: int = 65_536,
+) -> None:
+    """
+    Write values to a new column file.
+
+    Args:
+        path: Column file path
+        values: Values to store
+        chunk_size: Values per chunk
+
+    Raises:
+        TypeError: If values contain non-numbers
+        InvalidOperationError: If values contain NaN or chunk_size is not
+            positive
+    """
+    with ColumnWriter(path, chunk_size=chunk_size) as writer:
+        writer.extend(values)
+
+
+def _bin_indices(
+    values: Sequence[float],
+    minimum: float,
+    maximum: float,
+) -> Iterator[int]:
+    """
+    Map values in [minimum, maximum] to histogram bin indices.
+
+    The arithmetic runs through C-level ``map``. The maximum maps to
+    HISTOGRAM_BINS, one past the last bin, which callers fold into the last
+    bin. The same function bins stored values and query bounds, so a value
+    in [low, high] always lands in a bin between theirs.
+
+    With an infinite bound there is no finite width to divide, so every
+    value goes in the first bin and pruning rests on minimum and maximum
+    alone. Finite bounds whose difference overflows are binned at half scale.
+    """
+    if maximum == minimum or math.isinf(minimum) or math.isinf(maximum):
+        return repeat(0, len(values))
+    if math.isinf(maximum - minimum):
+        return _bin_indices(
+            array("d", map(mul, values, repeat(0.5))),
+            minimum * 0.5,
+            maximum * 0.5,
+        )
+    scale = HISTOGRAM_BINS / (maximum - minimum)
+    return map(math.floor, map(mul, map(sub, values, repeat(minimum)), repeat(scale)))
@@ -0,0 +1,264 @@
+"""
+Combinatorics module for counting combinations and permutations.
+
+This module provides exact binomial coefficients, permutation counts and
+multinomial coefficients without dividing full factorials, and a
+ModularCombinatorics class that answers the same queries modulo a fixed
+modulus in O(1) from precomputed factorial and inverse-factorial tables.
+"""
+
+import math
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+from src.example_calculator import InvalidOperationError
+
+
+def combinations(n: int, k: int) -> int:
+    """
+    Calculate the binomial coefficient n choose k.
+
+    Uses ``math.comb``, which multiplies and divides incrementally, so no
+    intermediate value is larger than the result needs.
+
+    Args:
+        n: Number of items
+        k: Number of items chosen
+
+    Returns:
+        Number of ways to choose k of n items, 0 if k > n
+
+    Raises:
+        TypeError: If arguments are not numbers
+        InvalidOperationError: If arguments are negative or not integers
+    """
+    return math.comb(_to_count(n), _to_count(k))
+
+
+def permutations(n: int, k: int) -> int:
+    """
+    Calculate the number of ordered arrangements of k of n items.
+
+    Args:
+        n: Number of items
+        k: Number of items arranged
+
+    Returns:
+        n! / (n - k)!, or 0 if k > n
+
+    Raises:
+        TypeError: If arguments are not numbers
+        InvalidOperationError: If arguments are negative or not integers
+    """
+    return math.perm(_to_count(n), _to_count(k))
+
+
+def multinomial(*counts: int) -> int:
+    """
+    Calculate the multinomial coefficient (k1 + k2 + ...)! / (k1! k2! ...).
+
+    Computed as a product of binomial coefficients over running totals.
+
+    Args:
+        *counts: Group sizes
+
+    Returns:
+        Number of ways to split the items into groups of the given sizes
+
+    Raises:
+        TypeError: If arguments are not numbers
+        InvalidOperationError: If arguments are negative or not integers
+    """
+    result = 1
+    total = 0
+    for count in map(_to_count, counts):
+        total += count
+        result *= math.comb(total, count)
+    return result
+
+
+class ModularCombinatorics:
+    """
+    Combinatorics modulo a fixed modulus with precomputed tables.
+
+    Factorials and inverse factorials up to max_n are tabulated once in
+    O(max_n), after which every query is a few table lookups and modular
+    multiplications. The modulus must make 1..max_n invertible, which holds
+    for any prime larger than max_n.
+
+    Attributes:
+        modulus: Modulus of every result
+        max_n: Largest n that can be queried
+    """
+
+    def __init__(self, modulus: int, max_n: int):
+        """
+        Precompute factorial tables.
+
+        Args:
+            modulus: Modulus, between 2 and 2**63 - 1
+            max_n: Largest n that will be queried
+
+        Raises:
+            TypeError: If arguments are not numbers
+            InvalidOperationError: If the modulus is out of range or shares a
+                factor with a number up to max_n
+        """
+        modulus = _to_count(modulus)
+        max_n = _to_count(max_n)
+        if not 1 < modulus < 2**63:
+            raise InvalidOperationError("Modulus must be between 2 and 2**63 - 1")
+        self.modulus = modulus
+        self.max_n = max_n
+
+        fact = array("q", [1]) * (max_n + 1)
+        for i in range(1, max_n + 1):
+            fact[i] = fact[i - 1] * i % modulus
+        try:
+            inverse = pow(fact[max_n], -1, modulus)
+        except ValueError:
+            raise InvalidOperationError(
+                f"Factorials up to {max_n} are not invertible modulo {modulus}",
+            ) from None
+        inv_fact = array("q", [inverse]) * (max_n + 1)
+        for i in range(max_n, 0, -1):
+            inv_fact[i - 1] = inv_fact[i] * i % modulus
+        self._fact = fact
+        self._inv_fact = inv_fact
+
+    def factorial(self, n: int) -> int:
+        """
+        Calculate n! modulo the modulus.
+
+        Raises:
+            TypeError: If n is not a number
+            InvalidOperationError: If n is negative, not an integer or > max_n
+        """
+        return self._fact[self._check_n(n)]
+
+    def combinations(self, n: int, k: int) -> int:
+        """
+        Calculate n choose k modulo the modulus.
+
+        Raises:
+            TypeError: If arguments are not numbers
+            InvalidOperationError: If arguments are negative, not integers or
+                n > max_n
+        """
+        n = self._check_n(n)
+        k = _to_count(k)
+        if k > n:
+            return 0
+        m = self.modulus
+        return self._fact[n] * self._inv_fact[k] % m * self._inv_fact[n - k] % m
+
+    def permutations(self, n: int, k: int) -> int:
+        """
+        Calculate n! / (n - k)! modulo the modulus.
+
+        Raises:
+            TypeError: If arguments are not numbers
+            InvalidOperationError: If arguments are negative, not integers or
+                n > max_n
+        """
+        n = self._check_n(n)
+        k = _to_count(k)
+        if k > n:
+            return 0
+        return self._fact[n] * self._inv_fact[n - k] % self.modulus
+
+    def multinomial(self, *counts: int) -> int:
+        """
+        Calculate a multinomial coefficient modulo the modulus.
+
+        Raises:
+            TypeError: If arguments are not numbers
+            InvalidOperationError: If arguments are negative, not integers or
+                their sum exceeds max_n
+        """
+        m = self.modulus
+        inv_fact = self._inv_fact
+        result = 1
+        total = 0
+        for count in map(_to_count, counts):
+            total += count
+            result = result * inv_fact[self._check_n(count)] % m
+        return result * self._fact[self._check_n(total)] % m
+
+    def combinations_many(self, ns: Sequence[int], ks: Sequence[int]) -> "array[int]":
+        """
+        Calculate n choose k modulo the modulus for many (n, k) pairs.
+
+        Arguments are validated for the whole batch up front, then each pair
+        is answered from the tables without further checks.
+
+        Args:
+            ns: Values of n
+            ks: Values of k
+
+        Returns:
+            Array of results, 0 where k > n
+
+        Raises:
+            TypeError: If elements are not integers
+            InvalidOperationError: If lengths differ or an element is negative
+                or n > max_n
+        """
+        if len(ns) != len(ks):
+            raise InvalidOperationError("ns and ks must have the same length")
+        if not ns:
+            return array("q")
+        if not {int}.issuperset(map(type, ns)) or not {int}.issuperset(map(type, ks)):
+            raise TypeError("Expected integers")
+        if min(ns) < 0 or min(ks) < 0:
+            raise InvalidOperationError("Counts must be non-negative")
+        if max(ns) > self.max_n:
+            raise InvalidOperationError(f"n must not exceed {self.max_n}")
+
+        fact = self._fact
+        inv_fact = self._inv_fact
+        m = self.modulus
+        return array(
+            "q",
+            [
+                fact[n] * inv_fact[k] % m * inv_fact[n - k] % m if k <= n else 0
+                for n, k in zip(ns, ks, strict=True)
+            ],
+        )
+
+    def _check_n(self, n: Any) -> int:
+        """
+        Validate a table index.
+
+        Raises:
+            TypeError: If n is not a number
+            InvalidOperationError: If n is negative, not an integer or > max_n
+        """
+        n = _to_count(n)
+        if n > self.max_n:
+            raise InvalidOperationError(f"n must not exceed {self.max_n}")
+        return n
+
+
+def _to_count(value: Any) -> int:
+    """
+    Validate a non-negative integer argument.
+
+    Args:
+        value: Value to validate
+
+    Returns:
+        Value as an int
+
+    Raises:
+        TypeError: If value is not a number
+        InvalidOperationError: If value is negative or not an integer
+    """
+    if not isinstance(value, int | float):
+        raise TypeError(f"Expected number, got {type(value).__name__}")
+    if value < 0:
+        raise InvalidOperationError("Counts must be non-negative")
+    if not isinstance(value, int) and not value.is_integer():
+        raise InvalidOperationError("Counts must be integers")
+    return int(value)
@@ -0,0 +1,171 @@
+"""
+Cost model for estimating the run time of calculator operations.
+
+This module provides a CostModel that predicts how long a Calculator call
+will take from its arguments alone, before doing any of the work. Each
+operation maps its arguments to abstract work units (for example the bit
+length of a factorial's result, or n log n for a median), and a per-operation
+coefficient converts units to seconds. The default coefficients are rough
+figures for a typical CPython build; ``calibrate()`` re-measures them on the
+current machine.
+"""
+
+import contextlib
+import math
+import time
+from collections.abc import Callable, Sized
+from typing import Any
+
+
+# Exponent of Karatsuba multiplication, which dominates big-integer products
+_KARATSUBA = math.log2(3)
+
+
+def _multiplication_units(bits: float) -> float:
+    """Cost of a product of the given size; inf past the float range."""
+    try:
+        return max(bits**_KARATSUBA, 1.0)
+    except OverflowError:
+        return math.inf
+
+
+def _factorial_units(n: Any, *_args: Any) -> float:
+    """Work for n!: product size in bits, raised to the multiplication cost."""
+    if n < 2:  # noqa: PLR2004
+        return 1.0
+    try:
+        bits = math.lgamma(n + 1) / math.log(2)
+    except OverflowError:
+        return math.inf
+    return _multiplication_units(bits)
+
+
+def _power_units(base: Any, exponent: Any, *_args: Any) -> float:
+    """Work for base**exponent: big-integer result size, else constant."""
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0:
+        return _multiplication_units(exponent * max(base.bit_length(), 1))
+    return 1.0
+
+
+def _linear_units(numbers: Sized, *_args: Any) -> float:
+    """Work for a single pass over a list."""
+    return max(len(numbers), 1)
+
+
+def _sort_units(numbers: Sized, *_args: Any) -> float:
+    """Work for sorting a list: n log n."""
+    n = max(len(numbers), 2)
+    return n * math.log2(n)
+
+
+def _constant_units(*_args: Any) -> float:
+    """Work for constant-time operations."""
+    return 1.0
+
+
+UNITS: dict[str, Callable[..., float]] = {
+    "add": _constant_units,
+    "subtract": _constant_units,
+    "multiply": _constant_units,
+    "divide": _constant_units,
+    "sqrt": _constant_units,
+    "power": _power_units,
+    "factorial": _factorial_units,
+    "mean": _linear_units,
+    "mode": _linear_units,
+    "median": _sort_units,
+    "describe": _sort_units,
+}
+
+DEFAULT_SECONDS_PER_UNIT: dict[str, float] = {
+    "add": 1e-7,
+    "subtract": 1e-7,
+    "multiply": 1e-7,
+    "divide": 1e-7,
+    "sqrt": 1e-7,
+    "power": 1.5e-11,
+    "factorial": 5e-11,
+    "mean": 3.5e-7,
+    "mode": 3.5e-7,
+    "median": 1.5e-8,
+    "describe": 3.5e-8,
+}
+
+# Arguments used by calibrate(), large enough to dwarf call overhead
+_CALIBRATION_ARGS: dict[str, Callable[[], tuple[Any, ...]]] = {
+    "power": lambda: (3, 200_000),
+    "factorial": lambda: (20_000,),
+    "mean": lambda: ([float(i % 1000) for i in range(200_000)],),
+    "mode": lambda: ([float(i % 1000) for i in range(200_000)],),
+    "median": lambda: ([float((i * 7919) % 200_000) for i in range(200_000)],),
+    "describe": lambda: ([float((i * 7919) % 200_000) for i in range(200_000)],),
+}
+
+
+class CostModel:
+    """
+    Estimates operation run time in seconds from operation arguments.
+
+    Attributes:
+        seconds_per_unit: Seconds per work unit for each operation
+    """
+
+    def __init__(self, seconds_per_unit: dict[str, float] | None = None):
+        """
+        Initialize the model.
+
+        Args:
+            seconds_per_unit: Coefficients overriding the defaults
+        """
+        self.seconds_per_unit = dict(DEFAULT_SECONDS_PER_UNIT)
+        if seconds_per_unit:
+            self.seconds_per_unit.update(seconds_per_unit)
+
+    def units(self, operation: str, *args: Any) -> float:
+        """
+        Estimate abstract work units for an operation.
+
+        Args:
+            operation: Calculator method name
+            *args: Arguments the method will be called with
+
+        Returns:
+            Work units; unknown operations count as constant, and work too
+            large to represent as a float is inf
+        """
+        return UNITS.get(operation, _constant_units)(*args)
+
+    def estimate(self, operation: str, *args: Any) -> float:
+        """
+        Estimate the run time of an operation in seconds.
+
+        Args:
+            operation: Calculator method name
+            *args: Arguments the method will be called with
+
+        Returns:
+            Estimated seconds
+        """
+        coefficient = self.seconds_per_unit.get(operation, 1e-7)
+        return coefficient * self.units(operation, *args)
+
+    def calibrate(self, calculator: Any) -> "CostModel":
+        """
+        Measure coefficients on this machine.
+
+        Args:
+            calculator: Calculator whose methods are timed
+
+        Returns:
+            Self, with updated coefficients
+        """
+        for operation, make_args in _CALIBRATION_ARGS.items():
+            args = make_args()
+            method = getattr(calculator, operation)
+            start = time.perf_counter()
+            # Big-integer powers overflow float only after doing the work
+            with contextlib.suppress(OverflowError):
+                method(*args)
+            elapsed = time.perf_counter() - start
+            self.seconds_per_unit[operation] = elapsed / self.units(operation, *args)
+        return self
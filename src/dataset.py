@@ -0,0 +1,171 @@
+"""
+Compact typed storage for large numeric datasets.
+
+A Python list of floats costs about 32 bytes per value: an 8-byte pointer
+plus a 24-byte float object (ints of 2**30 and above take 28 bytes or more,
+only -5..256 are shared). A Dataset keeps values unboxed in an
+``array.array`` of a chosen width instead:
+
+=========  ========  =====================================================
+dtype      bytes     stores
+=========  ========  =====================================================
+float64    8         any float exactly (the default)
+float32    4         floats rounded to 24 significant bits, about 7
+                     decimal digits; integers above 2**24 lose their low
+                     bits and magnitudes above about 3.4e38 become inf
+int32      4         integers in [-2**31, 2**31 - 1]
+int16      2         integers in [-32768, 32767]
+=========  ========  =====================================================
+
+Rounding happens once, when a value is stored. Calculator statistics read
+stored values back as Python floats and ints, so sums and means are still
+accumulated in double precision. Calculator's mean, median, mode and
+describe accept a Dataset directly and skip their per-element type checks,
+since every element of a typed array is a number.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any, overload
+
+
+Number = int | float
+
+DTYPES = {"float64": "d", "float32": "f", "int32": "i", "int16": "h"}
+
+_DTYPE_NAMES = {typecode: dtype for dtype, typecode in DTYPES.items()}
+
+
+class Dataset:
+    """
+    A sequence of numbers stored in a typed array.
+
+    Supports ``len``, iteration and indexing like a list; slicing returns a
+    typed array.
+
+    Attributes:
+        dtype: Storage type: float64, float32, int32 or int16
+        values: The underlying array
+    """
+
+    def __init__(self, values: Iterable[Number] = (), dtype: str = "float64"):
+        """
+        Create a dataset.
+
+        Args:
+            values: Initial values
+            dtype: Storage type: float64, float32, int32 or int16
+
+        Raises:
+            ValueError: If dtype is unknown
+            TypeError: If a value is not a number, or a float is stored in
+                an integer dtype
+            OverflowError: If an integer is out of range for its dtype
+        """
+        if dtype not in DTYPES:
+            raise ValueError(
+                f"Unknown dtype: {dtype}; expected one of {', '.join(DTYPES)}",
+            )
+        self.dtype = dtype
+        self.values = array(DTYPES[dtype])
+        self.extend(values)
+
+    @classmethod
+    def from_array(cls, values: "array[Any]") -> "Dataset":
+        """
+        Wrap an existing array without copying it.
+
+        Args:
+            values: Array with typecode d, f, i or h
+
+        Returns:
+            Dataset sharing values
+
+        Raises:
+            ValueError: If the typecode is not supported
+        """
+        if values.typecode not in _DTYPE_NAMES:
+            raise ValueError(f"Unsupported array typecode: {values.typecode}")
+        dataset = cls(dtype=_DTYPE_NAMES[values.typecode])
+        dataset.values = values
+        return dataset
+
+    @property
+    def itemsize(self) -> int:
+        """Return the bytes used per value."""
+        return self.values.itemsize
+
+    @property
+    def nbytes(self) -> int:
+        """Return the bytes used by the stored values."""
+        return len(self.values) * self.values.itemsize
+
+    def append(self, value: Number) -> None:
+        """
+        Append one value.
+
+        Raises:
+            TypeError: If value is not a number, or is a float stored in an
+                integer dtype
+            OverflowError: If an integer is out of range for the dtype
+        """
+        self.extend((value,))
+
+    def extend(self, values: Iterable[Number]) -> None:
+        """
+        Append values; nothing is appended if any value is rejected.
+
+        Conversion runs in C with no per-value Python call.
+
+        Raises:
+            TypeError: If a value is not a number, or is a float stored in
+                an integer dtype
+            OverflowError: If an integer is out of range for the dtype
+        """
+        start = len(self.values)
+        if not isinstance(values, array | list | tuple):
+            values = list(values)
+        # array.extend only accepts arrays of its own typecode as such;
+        # others convert element by element through the iterator path
+        source = values
+        if isinstance(values, array) and values.typecode != self.values.typecode:
+            source = iter(values)
+        try:
+            self.values.extend(source)  # type: ignore[arg-type]
+        except TypeError:
+            del self.values[start:]
+            raise self._type_error(values) from None
+        except OverflowError:
+            del self.values[start:]
+            raise
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Number]:
+        """Iterate over the values."""
+        return iter(self.values)
+
+    @overload
+    def __getitem__(self, index: int) -> Number: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "array[Any]": ...
+
+    def __getitem__(self, index: int | slice) -> "Number | array[Any]":
+        """Return a value, or a slice as a typed array."""
+        return self.values[index]
+
+    def __repr__(self) -> str:
+        """Return a short representation of the dataset."""
+        return f"Dataset(<{len(self.values)} values>, dtype={self.dtype!r})"
+
+    def _type_error(self, values: Iterable[Any]) -> TypeError:
+        """Describe the first value array.extend rejected."""
+        for value in values:
+            if not isinstance(value, int | float):
+                return TypeError(f"Expected number, got {type(value).__name__}")
+            if isinstance(value, float) and self.values.typecode in "ih":
+                return TypeError(f"{self.dtype} dataset stores integers, got float")
+        return TypeError("Expected numbers")
@@ -7,11 +7,78 @@ statistical calculations.
 """
 
 import math
-from typing import Any
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Callable, Hashable, Sequence
+from functools import partial
+from itertools import accumulate, repeat
+from typing import Any, Protocol
+
+from src.cost import CostModel
+from src.dataset import Dataset
+from src.kernels import (
+    FLOAT_TYPES,
+    INT_TYPES,
+    NUMBER_TYPES,
+    group_aggregates,
+    median_of_runs,
+    quantile_ranked,
+    select,
+    sorted_runs,
+)
+from src.summation import Accumulator, check_mode, sum_of
 
 
 Number = int | float
 
+# Integer data is ranked by counting rather than sorting when it has at
+# least this many values and its range is under 1/_COUNTING_RANGE_DIVISOR of
+# its length; below either bound sorting in C is faster
+_COUNTING_MIN_SIZE = 1_000
+_COUNTING_RANGE_DIVISOR = 4
+
+# Typed arrays with these typecodes hold only numbers; others, such as "u"
+# unicode arrays, are validated element by element
+_INT_TYPECODES = frozenset("bBhHiIlLqQ")
+_FLOAT_TYPECODES = frozenset("fd")
+
+# Typed arrays longer than this are sorted for median and describe in chunks
+# of this size, so only one chunk at a time is boxed into Python objects
+_COMPACT_SORT_CHUNK = 1 << 18
+
+
+def _counting_median(numbers: Sequence[Number] | Dataset) -> Number | None:
+    # Bounded-range integer data is ranked with a cumulative count array in
+    # O(n + range) instead of an O(n log n) sort; callers pass only ints.
+    # Returns None when the input is too short or its range too wide for
+    # that to pay off.
+    n = len(numbers)
+    if n < _COUNTING_MIN_SIZE:
+        return None
+    # A prefix's range bounds the full range from below, so wide data is
+    # rejected without a full min/max pass
+    head = numbers[:64]
+    if (max(head) - min(head)) * _COUNTING_RANGE_DIVISOR >= n:
+        return None
+    lowest = int(min(numbers))
+    highest = int(max(numbers))
+    if (highest - lowest) * _COUNTING_RANGE_DIVISOR >= n:
+        return None
+    counts = Counter(numbers)
+    cumulative = array(
+        "q",
+        accumulate(map(counts.get, range(lowest, highest + 1), repeat(0))),
+    )
+    upper = lowest + bisect_right(cumulative, n // 2)
+    if n % 2:
+        return upper
+    return (lowest + bisect_right(cumulative, n // 2 - 1) + upper) / 2
+
+
+def _compact_median(values: "array[Any]") -> Number:
+    return median_of_runs(sorted_runs(values, _COMPACT_SORT_CHUNK), len(values))
+
 
 class CalculatorError(Exception):
     """Base exception for calculator-related errors."""
@@ -25,6 +92,35 @@ class InvalidOperationError(CalculatorError):
     """Exception raised for invalid mathematical operations."""
 
 
+class BudgetExceededError(CalculatorError):
+    """Exception raised when an operation is estimated to exceed its budget."""
+
+    def __init__(self, operation: str, estimate: float, budget: float):
+        """
+        Initialize with the operation, its estimated cost and the budget.
+
+        Args:
+            operation: Rejected operation
+            estimate: Estimated run time in seconds
+            budget: Allowed run time in seconds
+        """
+        super().__init__(
+            f"{operation} estimated to take {estimate:.3g}s, "
+            f"exceeding budget of {budget:.3g}s",
+        )
+        self.operation = operation
+        self.estimate = estimate
+        self.budget = budget
+
+
+class Journal(Protocol):
+    """Recorder of memory and chain operations, e.g. OperationJournal."""
+
+    def record(self, operation: str, operand: float, result: float) -> None:
+        """Record an operation with its operand and resulting value."""
+        ...
+
+
 class Calculator:
     """
     A calculator class providing various mathematical operations.
@@ -32,15 +128,74 @@ class Calculator:
     This class implements basic arithmetic operations, advanced mathematical
     functions, memory operations, and method chaining for complex calculations.
 
+    Arithmetic and statistical methods do not touch instance state and may be
+    called from several threads at once. Memory and chain methods read and
+    update ``memory``/``chain_value`` without locking, so concurrent calls on
+    one instance can lose updates; on free-threaded builds this is not even
+    masked by the GIL. Give each thread its own Calculator, or guard a shared
+    one with a lock.
+
+    Sums in ``mean`` and ``describe``, and the running totals of
+    ``memory_add``/``memory_subtract`` and ``chain_add``/``chain_subtract``,
+    use the ``summation`` mode (see ``src.summation``). The default, naive,
+    adds values in order; pairwise, kahan and exact trade speed for accuracy
+    on long or ill-conditioned sequences.
+
     Attributes:
         memory: Stores a value for memory operations
         chain_value: Current value in chain operations
+        journal: Optional journal recording every memory and chain operation
+        cost_model: Estimates run time for calls given a budget
+        summation: Summation mode: naive, pairwise, kahan or exact
     """
 
-    def __init__(self):
-        """Initialize calculator with memory and chain value."""
-        self.memory: float = 0
-        self.chain_value: float | None = None
+    def __init__(
+        self,
+        journal: Journal | None = None,
+        cost_model: CostModel | None = None,
+        summation: str = "naive",
+    ):
+        """
+        Initialize calculator with memory and chain value.
+
+        Args:
+            journal: Optional journal to record memory and chain operations
+            cost_model: Cost model for budget checks; defaults to CostModel()
+            summation: Summation mode: naive, pairwise, kahan or exact
+
+        Raises:
+            ValueError: If summation is unknown
+        """
+        self.summation = check_mode(summation)
+        self._memory = Accumulator(summation)
+        self._chain: Accumulator | None = None
+        self.journal = journal
+        self.cost_model = cost_model or CostModel()
+
+    @property
+    def memory(self) -> float:
+        """Return the value stored in memory."""
+        return self._memory.value
+
+    @memory.setter
+    def memory(self, value: float) -> None:
+        """Replace the value stored in memory."""
+        self._memory.reset(value)
+
+    @property
+    def chain_value(self) -> float | None:
+        """Return the current chain value, or None outside a chain."""
+        return None if self._chain is None else self._chain.value
+
+    @chain_value.setter
+    def chain_value(self, value: float | None) -> None:
+        """Replace the current chain value; None ends the chain."""
+        if value is None:
+            self._chain = None
+        elif self._chain is None:
+            self._chain = Accumulator(self.summation, value)
+        else:
+            self._chain.reset(value)
 
     # Basic arithmetic operations
 
@@ -117,21 +272,30 @@ class Calculator:
 
     # Advanced mathematical operations
 
-    def power(self, base: Number, exponent: Number) -> float:
+    def power(
+        self,
+        base: Number,
+        exponent: Number,
+        *,
+        budget: float | None = None,
+    ) -> float:
         """
         Raise base to the power of exponent.
 
         Args:
             base: Base number
             exponent: Exponent
+            budget: Maximum estimated run time in seconds
 
         Returns:
             base raised to the power of exponent
 
         Raises:
             TypeError: If arguments are not numbers
+            BudgetExceededError: If the estimated run time exceeds budget
         """
         self._validate_numbers(base, exponent)
+        self.check_budget(budget, "power", base, exponent)
         return float(base**exponent)
 
     def sqrt(self, n: Number) -> float:
@@ -155,12 +319,13 @@ class Calculator:
             )
         return math.sqrt(n)
 
-    def factorial(self, n: Number) -> int:
+    def factorial(self, n: Number, *, budget: float | None = None) -> int:
         """
         Calculate factorial of a non-negative integer.
 
         Args:
             n: Non-negative integer
+            budget: Maximum estimated run time in seconds
 
         Returns:
             Factorial of n
@@ -168,12 +333,14 @@ class Calculator:
         Raises:
             TypeError: If argument is not a number
             InvalidOperationError: If n is negative or not an integer
+            BudgetExceededError: If the estimated run time exceeds budget
         """
         self._validate_number(n)
         if n < 0:
             raise InvalidOperationError("Factorial is not defined for negative numbers")
         if not isinstance(n, int) and not n.is_integer():
             raise InvalidOperationError("Factorial is only defined for integers")
+        self.check_budget(budget, "factorial", n)
         return math.factorial(int(n))
 
     # Memory operations
@@ -190,6 +357,8 @@ class Calculator:
         """
         self._validate_number(value)
         self.memory = float(value)
+        if self.journal is not None:
+            self.journal.record("memory_store", value, self.memory)
 
     def memory_recall(self) -> float:
         """
@@ -211,7 +380,9 @@ class Calculator:
             TypeError: If value is not a number
         """
         self._validate_number(value)
-        self.memory += value
+        self._memory.add(value)
+        if self.journal is not None:
+            self.journal.record("memory_add", value, self.memory)
 
     def memory_subtract(self, value: Number) -> None:
         """
@@ -224,11 +395,15 @@ class Calculator:
             TypeError: If value is not a number
         """
         self._validate_number(value)
-        self.memory -= value
+        self._memory.add(-value)
+        if self.journal is not None:
+            self.journal.record("memory_subtract", value, self.memory)
 
     def memory_clear(self) -> None:
         """Clear memory (set to 0)."""
         self.memory = 0
+        if self.journal is not None:
+            self.journal.record("memory_clear", 0, self.memory)
 
     # Chain operations
 
@@ -247,6 +422,8 @@ class Calculator:
         """
         self._validate_number(initial)
         self.chain_value = float(initial)
+        if self.journal is not None:
+            self.journal.record("chain", initial, self.chain_value)
         return self
 
     def chain_add(self, value: Number) -> "Calculator":
@@ -263,9 +440,11 @@ class Calculator:
             TypeError: If value is not a number
             InvalidOperationError: If chain not initialized
         """
-        self._ensure_chain_initialized()
+        chain = self._ensure_chain_initialized()
         self._validate_number(value)
-        self.chain_value += value
+        chain.add(value)
+        if self.journal is not None:
+            self.journal.record("chain_add", value, chain.value)
         return self
 
     def chain_subtract(self, value: Number) -> "Calculator":
@@ -282,9 +461,11 @@ class Calculator:
             TypeError: If value is not a number
             InvalidOperationError: If chain not initialized
         """
-        self._ensure_chain_initialized()
+        chain = self._ensure_chain_initialized()
         self._validate_number(value)
-        self.chain_value -= value
+        chain.add(-value)
+        if self.journal is not None:
+            self.journal.record("chain_subtract", value, chain.value)
         return self
 
     def chain_multiply(self, value: Number) -> "Calculator":
@@ -301,9 +482,11 @@ class Calculator:
             TypeError: If value is not a number
             InvalidOperationError: If chain not initialized
         """
-        self._ensure_chain_initialized()
+        chain = self._ensure_chain_initialized()
         self._validate_number(value)
-        self.chain_value *= value
+        chain.reset(chain.value * value)
+        if self.journal is not None:
+            self.journal.record("chain_multiply", value, chain.value)
         return self
 
     def chain_divide(self, value: Number) -> "Calculator":
@@ -321,11 +504,13 @@ class Calculator:
             DivisionByZeroError: If value is zero
             InvalidOperationError: If chain not initialized
         """
-        self._ensure_chain_initialized()
+        chain = self._ensure_chain_initialized()
         self._validate_number(value)
         if value == 0:
             raise DivisionByZeroError("Cannot divide by zero")
-        self.chain_value /= value
+        chain.reset(chain.value / value)
+        if self.journal is not None:
+            self.journal.record("chain_divide", value, chain.value)
         return self
 
     def chain_power(self, value: Number) -> "Calculator":
@@ -342,9 +527,11 @@ class Calculator:
             TypeError: If value is not a number
             InvalidOperationError: If chain not initialized
         """
-        self._ensure_chain_initialized()
+        chain = self._ensure_chain_initialized()
         self._validate_number(value)
-        self.chain_value **= value
+        chain.reset(chain.value**value)
+        if self.journal is not None:
+            self.journal.record("chain_power", value, chain.value)
         return self
 
     def get_result(self) -> float:
@@ -357,12 +544,13 @@ class Calculator:
         Raises:
             InvalidOperationError: If chain not initialized
         """
-        self._ensure_chain_initialized()
-        return self.chain_value
+        return self._ensure_chain_initialized().value
 
     def reset_chain(self) -> None:
         """Reset chain operations."""
         self.chain_value = None
+        if self.journal is not None:
+            self.journal.record("reset_chain", 0, math.nan)
 
     # Mathematical constants
 
@@ -388,12 +576,18 @@ class Calculator:
 
     # Statistical operations
 
-    def mean(self, numbers: list[Number]) -> float:
+    def mean(
+        self,
+        numbers: list[Number] | Dataset,
+        *,
+        budget: float | None = None,
+    ) -> float:
         """
         Calculate arithmetic mean of a list of numbers.
 
         Args:
-            numbers: List of numbers
+            numbers: List of numbers, or a Dataset
+            budget: Maximum estimated run time in seconds
 
         Returns:
             Arithmetic mean
@@ -401,19 +595,26 @@ class Calculator:
         Raises:
             InvalidOperationError: If list is empty
             TypeError: If list contains non-numbers
+            BudgetExceededError: If the estimated run time exceeds budget
         """
         if not numbers:
             raise InvalidOperationError("Cannot calculate mean of empty list")
-        for num in numbers:
-            self._validate_number(num)
-        return sum(numbers) / len(numbers)
+        self.check_budget(budget, "mean", numbers)
+        self._validate_sequence(numbers)
+        return sum_of(numbers, self.summation) / len(numbers)
 
-    def median(self, numbers: list[Number]) -> float:
+    def median(
+        self,
+        numbers: list[Number] | Dataset,
+        *,
+        budget: float | None = None,
+    ) -> float:
         """
         Calculate median of a list of numbers.
 
         Args:
-            numbers: List of numbers
+            numbers: List of numbers, or a Dataset
+            budget: Maximum estimated run time in seconds
 
         Returns:
             Median value
@@ -421,11 +622,18 @@ class Calculator:
         Raises:
             InvalidOperationError: If list is empty
             TypeError: If list contains non-numbers
+            BudgetExceededError: If the estimated run time exceeds budget
         """
         if not numbers:
             raise InvalidOperationError("Cannot calculate median of empty list")
-        for num in numbers:
-            self._validate_number(num)
+        self.check_budget(budget, "median", numbers)
+        if self._validate_sequence(numbers) == INT_TYPES:
+            counted = _counting_median(numbers)
+            if counted is not None:
+                return counted
+        values = numbers.values if isinstance(numbers, Dataset) else numbers
+        if isinstance(values, array) and len(values) > _COMPACT_SORT_CHUNK:
+            return _compact_median(values)
 
         sorted_numbers = sorted(numbers)
         n = len(sorted_numbers)
@@ -434,12 +642,18 @@ class Calculator:
             return (sorted_numbers[n // 2 - 1] + sorted_numbers[n // 2]) / 2
         return sorted_numbers[n // 2]
 
-    def mode(self, numbers: list[Number]) -> Number:
+    def mode(
+        self,
+        numbers: list[Number] | Dataset,
+        *,
+        budget: float | None = None,
+    ) -> Number:
         """
         Calculate mode of a list of numbers.
 
         Args:
-            numbers: List of numbers
+            numbers: List of numbers, or a Dataset
+            budget: Maximum estimated run time in seconds
 
         Returns:
             Most frequent value
@@ -447,20 +661,135 @@ class Calculator:
         Raises:
             InvalidOperationError: If list is empty
             TypeError: If list contains non-numbers
+            BudgetExceededError: If the estimated run time exceeds budget
         """
         if not numbers:
             raise InvalidOperationError("Cannot calculate mode of empty list")
-        for num in numbers:
-            self._validate_number(num)
+        self.check_budget(budget, "mode", numbers)
+        self._validate_sequence(numbers)
+
+        # Counter tallies in C; most_common keeps the first-seen mode on ties
+        return Counter(numbers).most_common(1)[0][0]
+
+    def describe(
+        self,
+        numbers: list[Number] | Dataset,
+        *,
+        budget: float | None = None,
+    ) -> dict[str, Number]:
+        """
+        Calculate summary statistics of a list of numbers at once.
+
+        The list is validated once and sorted once. Order statistics come
+        from the sorted copy; sum and variance stream over it twice, once for
+        the mean and once for squared deviations from it, which keeps the
+        variance free of the cancellation a one-pass sum of squares suffers;
+        mode counts the original order so ties resolve like ``mode``.
+        Variance is the population variance and quartiles use linear
+        interpolation between closest ranks.
+
+        Typed data longer than the compact sort chunk is sorted chunk by
+        chunk into typed arrays instead, with order statistics selected
+        across the sorted runs, and sum and variance streamed over the typed
+        input, so it is never boxed into a full-length list.
 
-        frequency = {}
-        for num in numbers:
-            frequency[num] = frequency.get(num, 0) + 1
+        Args:
+            numbers: List of numbers, or a Dataset
+            budget: Maximum estimated run time in seconds
+
+        Returns:
+            Mapping with count, sum, mean, variance, min, q1, median, q3,
+            max and mode
+
+        Raises:
+            InvalidOperationError: If list is empty
+            TypeError: If list contains non-numbers
+            BudgetExceededError: If the estimated run time exceeds budget
+        """
+        if not numbers:
+            raise InvalidOperationError("Cannot describe empty list")
+        self.check_budget(budget, "describe", numbers)
+        self._validate_sequence(numbers)
+
+        values = numbers.values if isinstance(numbers, Dataset) else numbers
+        count = len(values)
+        rank: Callable[[int], Number]
+        if isinstance(values, array) and count > _COMPACT_SORT_CHUNK:
+            rank = partial(select, sorted_runs(values, _COMPACT_SORT_CHUNK))
+            ordered: Sequence[Number] = values
+        else:
+            ordered = sorted(values)
+            rank = ordered.__getitem__
+        total = sum_of(ordered, self.summation)
+        mean = total / count
+        deviations = ((x - mean) * (x - mean) for x in ordered)
+        variance = sum_of(deviations, self.summation) / count
+        if count % 2 == 0:
+            median = (rank(count // 2 - 1) + rank(count // 2)) / 2
+        else:
+            median = rank(count // 2)
+
+        return {
+            "count": count,
+            "sum": total,
+            "mean": mean,
+            "variance": variance,
+            "min": rank(0),
+            "q1": quantile_ranked(rank, count, 0.25),
+            "median": median,
+            "q3": quantile_ranked(rank, count, 0.75),
+            "max": rank(count - 1),
+            "mode": Counter(numbers).most_common(1)[0][0],
+        }
+
+    def group_stats(
+        self,
+        keys: Sequence[Hashable],
+        values: Sequence[Number],
+        aggs: Sequence[str] = ("mean", "median", "mode"),
+    ) -> dict[Hashable, dict[str, Number]]:
+        """
+        Calculate aggregates of values grouped by key in a single pass.
+
+        Values are validated once while streaming into a compact ``array('d')``
+        per group, then each requested aggregate is computed per group.
+        Groups appear in the order their keys are first seen.
 
-        max_count = max(frequency.values())
-        modes = [num for num, count in frequency.items() if count == max_count]
+        Args:
+            keys: Group key for each value
+            values: List of numbers
+            aggs: Aggregates to compute; any of count, sum, mean, min, max,
+                median and mode
+
+        Returns:
+            Mapping of group key to a mapping of aggregate name to value
 
-        return modes[0]  # Return first mode if multiple exist
+        Raises:
+            InvalidOperationError: If lengths differ or an aggregate is unknown
+            TypeError: If values contain non-numbers
+        """
+        if len(keys) != len(values):
+            raise InvalidOperationError("Keys and values must have the same length")
+        available = group_aggregates(self.summation)
+        for agg in aggs:
+            if agg not in available:
+                raise InvalidOperationError(f"Unknown aggregate: {agg}")
+        aggregators = [(agg, available[agg]) for agg in aggs]
+
+        groups: dict[Hashable, array[float]] = {}
+        get_group = groups.get
+        for key, value in zip(keys, values, strict=True):
+            if type(value) is not float and type(value) is not int:
+                self._validate_number(value)
+            group = get_group(key)
+            if group is None:
+                group = groups[key] = array("d")
+            group.append(value)
+
+        return {
+            key: {agg: aggregate(group) for agg, aggregate in aggregators}
+            for key, group in groups.items()
+        }
 
     # Helper methods
 
@@ -490,12 +819,69 @@ class Calculator:
         for value in values:
             self._validate_number(value)
 
-    def _ensure_chain_initialized(self) -> None:
+    def _validate_sequence(
+        self,
+        numbers: Sequence[Any] | Dataset,
+    ) -> frozenset[type]:
+        """
+        Validate that every element of a sequence is a number.
+
+        Checks the set of element types first so that homogeneous int/float
+        input needs no per-element Python call. Typed arrays and Datasets
+        with a numeric typecode hold only numbers and are not scanned at all.
+
+        Args:
+            numbers: Values to validate
+
+        Returns:
+            The set of element types, so callers can pick type-specific paths
+
+        Raises:
+            TypeError: If any value is not a number
+        """
+        if isinstance(numbers, Dataset):
+            numbers = numbers.values
+        if isinstance(numbers, array):
+            if numbers.typecode in _FLOAT_TYPECODES:
+                return FLOAT_TYPES
+            if numbers.typecode in _INT_TYPECODES:
+                return INT_TYPES
+        types = frozenset(map(type, numbers))
+        if types <= NUMBER_TYPES:
+            return types
+        for num in numbers:
+            self._validate_number(num)
+        return types
+
+    def check_budget(self, budget: float | None, operation: str, *args: Any) -> None:
+        """
+        Reject an operation up front if it is estimated to exceed its budget.
+
+        Args:
+            budget: Maximum estimated run time in seconds, or None for no limit
+            operation: Operation name
+            *args: Operation arguments
+
+        Raises:
+            BudgetExceededError: If the estimated run time exceeds budget
+        """
+        if budget is None:
+            return
+        estimate = self.cost_model.estimate(operation, *args)
+        # Written so that a NaN estimate is rejected too
+        if not estimate <= budget:
+            raise BudgetExceededError(operation, estimate, budget)
+
+    def _ensure_chain_initialized(self) -> Accumulator:
         """
         Ensure chain operations have been initialized.
 
+        Returns:
+            The running chain value
+
         Raises:
             InvalidOperationError: If chain not initialized
         """
-        if self.chain_value is None:
+        if self._chain is None:
             raise InvalidOperationError("Chain not initialized. Call chain() first.")
+        return self._chain
@@ -0,0 +1,276 @@
+"""
+Append-only binary journal of Calculator memory and chain operations.
+
+This module provides an OperationJournal that records each ``memory_*`` and
+``chain*`` operation as a fixed-width binary record (opcode, operand, result).
+Records are packed into a preallocated buffer that is written and fsynced as
+one group commit when it fills up or when the flush interval has elapsed;
+a background flusher thread commits records left waiting by an idle
+journal.
+A journal file can be read back with read_journal and replayed to rebuild
+memory and chain state.
+"""
+
+import math
+import os
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from enum import IntEnum
+from pathlib import Path
+
+from src.example_calculator import Calculator, InvalidOperationError
+
+
+MAGIC = b"CALCJNL1"
+
+_RECORD = struct.Struct("<Bdd")
+
+
+class Opcode(IntEnum):
+    """Operation codes stored in journal records."""
+
+    MEMORY_STORE = 1
+    MEMORY_ADD = 2
+    MEMORY_SUBTRACT = 3
+    MEMORY_CLEAR = 4
+    CHAIN = 5
+    CHAIN_ADD = 6
+    CHAIN_SUBTRACT = 7
+    CHAIN_MULTIPLY = 8
+    CHAIN_DIVIDE = 9
+    CHAIN_POWER = 10
+    RESET_CHAIN = 11
+
+
+_OPCODES = {opcode.name.lower(): opcode for opcode in Opcode}
+
+_MEMORY_OPCODES = frozenset(
+    {
+        Opcode.MEMORY_STORE,
+        Opcode.MEMORY_ADD,
+        Opcode.MEMORY_SUBTRACT,
+        Opcode.MEMORY_CLEAR,
+    },
+)
+
+
+class OperationJournal:
+    """
+    A buffered, append-only journal of calculator operations.
+
+    Recording, flushing and closing are serialised by a lock, so one journal
+    can be shared by calculators on different threads. A daemon thread
+    commits buffered records once flush_interval has passed since the last
+    commit, even if no further records arrive; close the journal to stop it.
+
+    Attributes:
+        path: Journal file path
+        capacity: Number of records buffered before a forced flush
+        flush_interval: Maximum seconds between group commits
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        capacity: int = 4096,
+        flush_interval: float = 1.0,
+    ):
+        """
+        Open a journal file for appending, creating it if needed.
+
+        A trailing partial record left by an interrupted write is cut off,
+        so new records stay aligned.
+
+        Args:
+            path: Journal file path
+            capacity: Number of records buffered before a forced flush
+            flush_interval: Maximum seconds between group commits
+
+        Raises:
+            InvalidOperationError: If capacity or flush_interval is not
+                positive, or the file is not a journal
+        """
+        if capacity <= 0:
+            raise InvalidOperationError("Journal capacity must be positive")
+        if not flush_interval > 0:
+            raise InvalidOperationError("Journal flush interval must be positive")
+        self.path = Path(path)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._buffer = bytearray(capacity * _RECORD.size)
+        self._count = 0
+        self._lock = threading.Lock()
+        if self.path.exists() and self.path.stat().st_size:
+            _check_magic(self.path)
+            _truncate_partial_record(self.path)
+        self._file = self.path.open("ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+            self._sync()
+        self._last_sync = time.monotonic()
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+    def record(self, operation: str, operand: float, result: float) -> None:
+        """
+        Append one operation record.
+
+        Args:
+            operation: Calculator method name, e.g. ``"chain_add"``
+            operand: Operation argument
+            result: Memory or chain value after the operation
+
+        Raises:
+            InvalidOperationError: If operation is unknown or journal is closed
+        """
+        opcode = _OPCODES.get(operation)
+        if opcode is None:
+            raise InvalidOperationError(f"Unknown journal operation: {operation}")
+        with self._lock:
+            if self._file.closed:
+                raise InvalidOperationError("Journal is closed")
+            _RECORD.pack_into(
+                self._buffer,
+                self._count * _RECORD.size,
+                opcode,
+                operand,
+                result,
+            )
+            self._count += 1
+            if (
+                self._count == self.capacity
+                or time.monotonic() - self._last_sync >= self.flush_interval
+            ):
+                self._flush()
+
+    def flush(self) -> None:
+        """Write buffered records and fsync them as one group commit."""
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        """Flush pending records and close the journal file."""
+        with self._lock:
+            if not self._file.closed:
+                self._flush()
+                self._file.close()
+        self._closing.set()
+        if self._flusher is not threading.current_thread():
+            self._flusher.join()
+
+    def __enter__(self) -> "OperationJournal":
+        """Return the journal for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the journal on context exit."""
+        self.close()
+
+    def _flush_loop(self) -> None:
+        """Commit buffered records whenever flush_interval has elapsed."""
+        while True:
+            with self._lock:
+                if self._file.closed:
+                    return
+                wait = self._last_sync + self.flush_interval - time.monotonic()
+                if wait <= 0:
+                    self._flush()
+                    wait = self.flush_interval
+            if self._closing.wait(wait if math.isfinite(wait) else None):
+                return
+
+    def _flush(self) -> None:
+        """Write and fsync buffered records; the caller holds the lock."""
+        if self._count:
+            self._file.write(memoryview(self._buffer)[: self._count * _RECORD.size])
+            self._count = 0
+            self._sync()
+        self._last_sync = time.monotonic()
+
+    def _sync(self) -> None:
+        """Flush Python buffers and fsync the file."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+def read_journal(
+    path: str | os.PathLike[str],
+) -> Iterator[tuple[Opcode, float, float]]:
+    """
+    Read the records of a journal file.
+
+    A trailing partial record left by an interrupted write is ignored.
+
+    Args:
+        path: Journal file path
+
+    Returns:
+        Iterator of (opcode, operand, result) records
+
+    Raises:
+        InvalidOperationError: If the file is not a journal
+    """
+    data = Path(path).read_bytes()
+    if not data.startswith(MAGIC):
+        raise InvalidOperationError(f"Not a calculator journal: {path}")
+    body = memoryview(data)[len(MAGIC) :]
+    body = body[: len(body) - len(body) % _RECORD.size]
+    for opcode, operand, result in _RECORD.iter_unpack(body):
+        yield Opcode(opcode), operand, result
+
+
+def replay(
+    path: str | os.PathLike[str],
+    calculator: Calculator | None = None,
+) -> Calculator:
+    """
+    Rebuild memory and chain state from a journal.
+
+    Args:
+        path: Journal file path
+        calculator: Calculator to restore into; a new one by default
+
+    Returns:
+        Calculator with the journaled memory and chain state
+
+    Raises:
+        InvalidOperationError: If the file is not a journal
+    """
+    if calculator is None:
+        calculator = Calculator()
+    memory = calculator.memory
+    chain_value = calculator.chain_value
+    for opcode, _operand, result in read_journal(path):
+        if opcode in _MEMORY_OPCODES:
+            memory = result
+        elif opcode is Opcode.RESET_CHAIN:
+            chain_value = None
+        else:
+            chain_value = result
+    calculator.memory = memory
+    calculator.chain_value = chain_value
+    return calculator
+
+
+def _check_magic(path: Path) -> None:
+    """
+    Ensure an existing file starts with the journal header.
+
+    Raises:
+        InvalidOperationError: If the file is not a journal
+    """
+    with path.open("rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise InvalidOperationError(f"Not a calculator journal: {path}")
+
+
+def _truncate_partial_record(path: Path) -> None:
+    """Cut a journal file back to its last whole record."""
+    size = path.stat().st_size
+    whole = size - (size - len(MAGIC)) % _RECORD.size
+    if whole != size:
+        os.truncate(path, whole)
@@ -0,0 +1,133 @@
+"""
+Order-statistic and group-aggregate kernels shared across modules.
+
+These work on plain sequences and on sorted typed-array runs, and are used
+by Calculator, the batch and pipeline front ends and SortedSample alike.
+Group sums and means follow the caller's summation mode.
+"""
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from src.summation import check_mode, sum_of
+
+
+Number = int | float
+
+# Element type sets for one-pass validation with set(map(type, ...))
+NUMBER_TYPES = frozenset({int, float})
+INT_TYPES = frozenset({int})
+FLOAT_TYPES = frozenset({float})
+
+
+def quantile_sorted(ordered: Sequence[Number], q: float) -> float:
+    """Return the q-th quantile of already sorted values."""
+    return quantile_ranked(ordered.__getitem__, len(ordered), q)
+
+
+def quantile_ranked(rank: Callable[[int], Number], count: int, q: float) -> float:
+    """
+    Return the q-th quantile of count values given by rank.
+
+    rank(k) returns the k-th smallest value (0-based). Quantiles interpolate
+    linearly between closest ranks, so q=0.5 agrees with the median.
+    """
+    position = (count - 1) * q
+    lower = math.floor(position)
+    low = rank(lower)
+    return low + (rank(min(lower + 1, count - 1)) - low) * (position - lower)
+
+
+def sorted_runs(values: "array[Any]", chunk: int) -> list["array[Any]"]:
+    """
+    Sort a typed array chunk by chunk into runs of its own typecode.
+
+    Only one chunk at a time is boxed into Python objects; order statistics
+    are then selected across the runs with ``select``.
+    """
+    return [
+        array(values.typecode, sorted(values[start : start + chunk]))
+        for start in range(0, len(values), chunk)
+    ]
+
+
+def median_of_runs(runs: list["array[Any]"], count: int) -> Number:
+    """Return the median of count values held in sorted runs."""
+    upper = select(runs, count // 2)
+    if count % 2:
+        return upper
+    return (select(runs, count // 2 - 1) + upper) / 2
+
+
+def select(runs: list["array[Any]"], k: int) -> Number:
+    """
+    Return the k-th smallest value (0-based) across sorted runs.
+
+    Each step takes the middle of the widest remaining window as a pivot and
+    narrows every window by binary search, so the widest window halves and
+    the selection costs O(runs * log(n)) bisections rather than a merge.
+    """
+    windows = [(0, len(run)) for run in runs]
+    while True:
+        run, (low, high) = max(
+            zip(runs, windows, strict=True),
+            key=lambda item: item[1][1] - item[1][0],
+        )
+        pivot = run[(low + high) // 2]
+        starts = sum(lo for lo, _ in windows)
+        below = [
+            bisect_left(r, pivot, lo, hi)
+            for r, (lo, hi) in zip(runs, windows, strict=True)
+        ]
+        through = [
+            bisect_right(r, pivot, lo, hi)
+            for r, (lo, hi) in zip(runs, windows, strict=True)
+        ]
+        if k < sum(below) - starts:
+            windows = [(lo, b) for (lo, _), b in zip(windows, below, strict=True)]
+        elif k < sum(through) - starts:
+            return pivot
+        else:
+            k -= sum(through) - starts
+            windows = [(t, hi) for (_, hi), t in zip(windows, through, strict=True)]
+
+
+def _group_median(values: "array[float]") -> float:
+    ordered = sorted(values)
+    n = len(ordered)
+    if n % 2 == 0:
+        return (ordered[n // 2 - 1] + ordered[n // 2]) / 2
+    return ordered[n // 2]
+
+
+def _group_mode(values: "array[float]") -> float:
+    # most_common keeps first-seen order among ties, matching Calculator.mode
+    return Counter(values).most_common(1)[0][0]
+
+
+def group_aggregates(
+    summation: str = "naive",
+) -> dict[str, Callable[["array[float]"], Number]]:
+    """
+    Return the per-group aggregates by name, each over one group's values.
+
+    Args:
+        summation: Summation mode for sum and mean, as in ``sum_of``
+
+    Raises:
+        ValueError: If summation is unknown
+    """
+    check_mode(summation)
+    return {
+        "count": len,
+        "sum": lambda values: sum_of(values, summation),
+        "mean": lambda values: sum_of(values, summation) / len(values),
+        "min": min,
+        "max": max,
+        "median": _group_median,
+        "mode": _group_mode,
+    }
@@ -0,0 +1,266 @@
+"""
+Vector and matrix operations on typed arrays.
+
+This module provides a Matrix class stored as a flat row-major ``array('d')``
+buffer, and dot product, matrix-vector and matrix-matrix product kernels.
+Products transpose the right-hand matrix once so that every inner product
+runs over two contiguous buffers through C-level ``map``, and the output is
+computed tile by tile so each tile's rows and columns stay cache-resident.
+Large products can be split by row blocks across a thread or process pool.
+"""
+
+import operator
+from array import array
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.example_calculator import InvalidOperationError, Number
+
+
+# Products with fewer multiply-adds than this always run serially
+PARALLEL_THRESHOLD = 64**3
+
+
+class Matrix:
+    """
+    A dense matrix of floats in row-major order.
+
+    Attributes:
+        rows: Number of rows
+        cols: Number of columns
+        data: Flat row-major buffer of rows * cols values
+    """
+
+    def __init__(self, rows: int, cols: int, data: Iterable[Number] | None = None):
+        """
+        Create a matrix, zero-filled unless data is given.
+
+        Args:
+            rows: Number of rows
+            cols: Number of columns
+            data: Row-major values
+
+        Raises:
+            TypeError: If data contains non-numbers
+            InvalidOperationError: If the shape is negative or does not match
+                the number of values
+        """
+        if rows < 0 or cols < 0:
+            raise InvalidOperationError("Matrix dimensions must be non-negative")
+        self.rows = rows
+        self.cols = cols
+        if data is None:
+            self.data = array("d", bytes(8 * rows * cols))
+        else:
+            self.data = array("d", data)
+            if len(self.data) != rows * cols:
+                raise InvalidOperationError(
+                    f"Expected {rows * cols} values for a {rows}x{cols} matrix, "
+                    f"got {len(self.data)}",
+                )
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[Number]]) -> "Matrix":
+        """
+        Create a matrix from a list of rows.
+
+        Raises:
+            TypeError: If rows contain non-numbers
+            InvalidOperationError: If rows have different lengths
+        """
+        cols = len(rows[0]) if rows else 0
+        if any(len(row) != cols for row in rows):
+            raise InvalidOperationError("All rows must have the same length")
+        data = array("d")
+        for row in rows:
+            data.extend(array("d", row))
+        return cls(len(rows), cols, data)
+
+    @classmethod
+    def identity(cls, size: int) -> "Matrix":
+        """Create a size x size identity matrix."""
+        matrix = cls(size, size)
+        matrix.data[:: size + 1] = array("d", [1.0]) * size
+        return matrix
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Return (rows, cols)."""
+        return self.rows, self.cols
+
+    def __getitem__(self, index: tuple[int, int]) -> float:
+        """Return the element at (row, col)."""
+        row, col = index
+        return self.data[row * self.cols + col]
+
+    def __setitem__(self, index: tuple[int, int], value: Number) -> None:
+        """Set the element at (row, col)."""
+        row, col = index
+        self.data[row * self.cols + col] = value
+
+    def __eq__(self, other: object) -> bool:
+        """Compare shape and values."""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.shape == other.shape and self.data == other.data
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """Return a developer representation."""
+        return f"Matrix({self.rows}, {self.cols}, {self.to_rows()!r})"
+
+    def row(self, index: int) -> "array[float]":
+        """Return a copy of one row."""
+        start = index * self.cols
+        return self.data[start : start + self.cols]
+
+    def to_rows(self) -> list[list[float]]:
+        """Return the matrix as a list of rows."""
+        return [self.row(i).tolist() for i in range(self.rows)]
+
+    def transpose(self) -> "Matrix":
+        """Return the transposed matrix."""
+        result = Matrix(self.cols, self.rows)
+        for col in range(self.cols):
+            result.data[col * self.rows : (col + 1) * self.rows] = self.data[
+                col :: self.cols
+            ]
+        return result
+
+
+def dot(a: Sequence[Number], b: Sequence[Number]) -> float:
+    """
+    Calculate the dot product of two vectors.
+
+    Raises:
+        InvalidOperationError: If lengths differ
+        TypeError: If vectors contain non-numbers
+    """
+    if len(a) != len(b):
+        raise InvalidOperationError(
+            f"Cannot take dot product of vectors of length {len(a)} and {len(b)}",
+        )
+    return float(sum(map(operator.mul, a, b)))
+
+
+def matvec(matrix: Matrix, vector: Sequence[Number]) -> "array[float]":
+    """
+    Multiply a matrix by a vector.
+
+    Raises:
+        InvalidOperationError: If the vector length differs from matrix cols
+        TypeError: If the vector contains non-numbers
+    """
+    if len(vector) != matrix.cols:
+        raise InvalidOperationError(
+            f"Cannot multiply {matrix.rows}x{matrix.cols} matrix by vector "
+            f"of length {len(vector)}",
+        )
+    data = matrix.data
+    cols = matrix.cols
+    return array(
+        "d",
+        [
+            sum(map(operator.mul, data[i * cols : (i + 1) * cols], vector))
+            for i in range(matrix.rows)
+        ],
+    )
+
+
+def matmul(
+    a: Matrix,
+    b: Matrix,
+    *,
+    block_size: int = 64,
+    parallel: str | None = None,
+    workers: int | None = None,
+) -> Matrix:
+    """
+    Multiply two matrices.
+
+    Args:
+        a: Left matrix (m x n)
+        b: Right matrix (n x p)
+        block_size: Edge length of the output tiles
+        parallel: ``"thread"`` or ``"process"`` to split row blocks across a
+            pool when the product is large enough; serial if None
+        workers: Pool size; the executor default if None
+
+    Returns:
+        Product matrix (m x p)
+
+    Raises:
+        InvalidOperationError: If inner dimensions differ, block_size is not
+            positive or parallel is unknown
+    """
+    if a.cols != b.rows:
+        raise InvalidOperationError(
+            f"Cannot multiply {a.rows}x{a.cols} matrix by {b.rows}x{b.cols} matrix",
+        )
+    if block_size <= 0:
+        raise InvalidOperationError("Block size must be positive")
+    if parallel not in {None, "thread", "process"}:
+        raise InvalidOperationError(f"Unknown parallel mode: {parallel}")
+
+    inner = a.cols
+    b_columns = b.transpose().data
+    if parallel is None or a.rows * inner * b.cols < PARALLEL_THRESHOLD:
+        data = _multiply_rows(a.data, a.rows, b_columns, inner, b.cols, block_size)
+        return Matrix(a.rows, b.cols, data)
+
+    pool: type[Executor] = (
+        ThreadPoolExecutor if parallel == "thread" else ProcessPoolExecutor
+    )
+    with pool(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _multiply_rows,
+                a.data[start * inner : (start + block_size) * inner],
+                min(block_size, a.rows - start),
+                b_columns,
+                inner,
+                b.cols,
+                block_size,
+            )
+            for start in range(0, a.rows, block_size)
+        ]
+        data = array("d")
+        for future in futures:
+            data.extend(future.result())
+    return Matrix(a.rows, b.cols, data)
+
+
+def _multiply_rows(
+    a_data: "array[float]",
+    rows: int,
+    b_columns: "array[float]",
+    inner: int,
+    cols: int,
+    block_size: int,
+) -> "array[float]":
+    """
+    Multiply row-major rows by a column-major right matrix, tile by tile.
+
+    Module-level so that process pools can pickle it.
+    """
+    result = array("d", bytes(8 * rows * cols))
+    mul = operator.mul
+    for row_start in range(0, rows, block_size):
+        a_rows = [
+            a_data[i * inner : (i + 1) * inner]
+            for i in range(row_start, min(row_start + block_size, rows))
+        ]
+        for col_start in range(0, cols, block_size):
+            col_end = min(col_start + block_size, cols)
+            b_cols = [
+                b_columns[j * inner : (j + 1) * inner]
+                for j in range(col_start, col_end)
+            ]
+            for offset, a_row in enumerate(a_rows):
+                base = (row_start + offset) * cols
+                result[base + col_start : base + col_end] = array(
+                    "d",
+                    [sum(map(mul, a_row, b_col)) for b_col in b_cols],
+                )
+    return result
@@ -0,0 +1,341 @@
+"""
+Open-loop load generator for Calculator-backed services.
+
+This module replays a weighted mix of calculator operations against the
+in-process Calculator API or a localhost HTTP endpoint speaking the protocol
+of ``src.server``. Requests arrive on a fixed schedule at the target rate
+(constant or Poisson spacing) regardless of how fast earlier requests
+complete, and each latency is measured from the request's scheduled arrival,
+so queueing delay under overload is reported instead of hidden. The report
+is a JSON-serializable dict with throughput and p50/p95/p99/p999 latency,
+overall and per operation, for comparing library versions.
+
+Example:
+    python -m src.loadtest --mix add=35,multiply=35,median=20,factorial=10 \\
+        --rate 500 --duration 10 --output report.json
+"""
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from src.example_calculator import Calculator, InvalidOperationError
+from src.sorted_sample import SortedSample
+
+
+ArgsFactory = Callable[[random.Random], tuple[Any, ...]]
+
+PERCENTILES = {"p50": 0.5, "p95": 0.95, "p99": 0.99, "p999": 0.999}
+
+
+def default_workloads(
+    list_size: int = 10_000,
+    factorial_n: int = 500,
+) -> dict[str, ArgsFactory]:
+    """
+    Build argument generators for each supported operation.
+
+    List arguments are drawn from a pool generated up front so that argument
+    generation does not dominate the measured latency.
+
+    Args:
+        list_size: Length of lists passed to statistics operations
+        factorial_n: Argument passed to factorial
+
+    Returns:
+        Mapping of operation name to argument generator
+    """
+    pool_rng = random.Random(0)
+    pool = [[pool_rng.random() for _ in range(list_size)] for _ in range(4)]
+
+    def pair(rng: random.Random) -> tuple[Any, ...]:
+        return rng.uniform(-1e6, 1e6), rng.uniform(1, 1e6)
+
+    def single(rng: random.Random) -> tuple[Any, ...]:
+        return (rng.uniform(0, 1e6),)
+
+    def numbers(rng: random.Random) -> tuple[Any, ...]:
+        return (rng.choice(pool),)
+
+    return {
+        "add": pair,
+        "subtract": pair,
+        "multiply": pair,
+        "divide": pair,
+        "power": lambda rng: (rng.uniform(0, 10), rng.uniform(0, 5)),
+        "sqrt": single,
+        "factorial": lambda _rng: (factorial_n,),
+        "mean": numbers,
+        "median": numbers,
+        "mode": numbers,
+        "describe": numbers,
+    }
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """
+    Parse an operation mix such as ``"add=70,median=20,factorial=10"``.
+
+    Args:
+        spec: Comma-separated operation=weight pairs
+
+    Returns:
+        Mapping of operation name to weight
+
+    Raises:
+        InvalidOperationError: If the spec is malformed or has no weight
+    """
+    mix: dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, sep, weight = item.partition("=")
+        try:
+            mix[name.strip()] = float(weight) if sep else 1.0
+        except ValueError:
+            raise InvalidOperationError(f"Invalid mix entry: {item}") from None
+    if not mix or sum(mix.values()) <= 0:
+        raise InvalidOperationError("Operation mix must have a positive weight")
+    return mix
+
+
+class InProcessTarget:
+    """Send operations to a Calculator in this process."""
+
+    def __init__(self, calculator: Calculator | None = None):
+        """
+        Initialize the target.
+
+        Args:
+            calculator: Calculator to call; a new one by default
+        """
+        self.calculator = calculator or Calculator()
+
+    def __call__(self, operation: str, args: Sequence[Any]) -> Any:
+        """Run one operation."""
+        return getattr(self.calculator, operation)(*args)
+
+    def __str__(self) -> str:
+        """Describe the target for reports."""
+        return "in-process"
+
+
+class HttpTarget:
+    """Send operations to an HTTP endpoint speaking the src.server protocol."""
+
+    def __init__(self, url: str, timeout: float = 30.0):
+        """
+        Initialize the target.
+
+        Args:
+            url: Base URL, e.g. ``http://127.0.0.1:8000``
+            timeout: Socket timeout in seconds
+        """
+        parts = urlsplit(url)
+        self.url = url
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def __call__(self, operation: str, args: Sequence[Any]) -> Any:
+        """
+        Run one operation over a keep-alive connection owned by this thread.
+
+        Raises:
+            InvalidOperationError: If the server reports an error
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = http.client.HTTPConnection(
+                self.host,
+                self.port,
+                timeout=self.timeout,
+            )
+            self._local.connection = connection
+        body = json.dumps({"args": list(args)})
+        try:
+            connection.request(
+                "POST",
+                f"{self.prefix}/{operation}",
+                body=body,
+                headers={"Content-Type": "application/json"},
+            )
+            response = connection.getresponse()
+            payload = json.loads(response.read())
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            self._local.connection = None
+            raise
+        if response.status != 200:  # noqa: PLR2004
+            raise InvalidOperationError(payload.get("message", "Request failed"))
+        return payload["result"]
+
+    def __str__(self) -> str:
+        """Describe the target for reports."""
+        return self.url
+
+
+class _Recorder:
+    """Thread-safe collector of per-operation latencies."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+
+    def record(self, operation: str, latency: float, *, failed: bool) -> None:
+        with self._lock:
+            self.latencies.setdefault(operation, []).append(latency)
+            if failed:
+                self.errors[operation] = self.errors.get(operation, 0) + 1
+
+
+def run(
+    target: Callable[[str, Sequence[Any]], Any],
+    mix: dict[str, float],
+    *,
+    rate: float,
+    duration: float,
+    workers: int = 8,
+    arrival: str = "poisson",
+    seed: int = 0,
+    workloads: dict[str, ArgsFactory] | None = None,
+) -> dict[str, Any]:
+    """
+    Replay an operation mix at an open-loop arrival rate.
+
+    Args:
+        target: Callable taking (operation, args), e.g. InProcessTarget
+        mix: Mapping of operation name to relative weight
+        rate: Requests per second to schedule
+        duration: Seconds over which requests are scheduled
+        workers: Threads executing requests
+        arrival: ``"poisson"`` for exponential gaps or ``"constant"``
+        seed: Random seed for operation choice and arrival gaps
+        workloads: Argument generators; default_workloads() by default
+
+    Returns:
+        JSON-serializable report
+
+    Raises:
+        InvalidOperationError: If the mix names an unknown operation or the
+            rate, duration or arrival process is invalid
+    """
+    workloads = workloads or default_workloads()
+    unknown = set(mix) - set(workloads)
+    if unknown:
+        raise InvalidOperationError(f"Unknown operation: {', '.join(sorted(unknown))}")
+    if rate <= 0 or duration <= 0:
+        raise InvalidOperationError("Rate and duration must be positive")
+    if arrival not in {"poisson", "constant"}:
+        raise InvalidOperationError(f"Unknown arrival process: {arrival}")
+
+    rng = random.Random(seed)
+    operations = list(mix)
+    weights = [mix[operation] for operation in operations]
+    recorder = _Recorder()
+
+    def execute(operation: str, args: tuple[Any, ...], scheduled: float) -> None:
+        failed = False
+        try:
+            target(operation, args)
+        except Exception:
+            failed = True
+        recorder.record(operation, time.perf_counter() - scheduled, failed=failed)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        scheduled_count = 0
+        offset = 0.0
+        while offset < duration:
+            operation = rng.choices(operations, weights)[0]
+            args = workloads[operation](rng)
+            scheduled = start + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(execute, operation, args, scheduled)
+            scheduled_count += 1
+            if arrival == "poisson":
+                offset += rng.expovariate(rate)
+            else:
+                offset = scheduled_count / rate
+    elapsed = time.perf_counter() - start
+
+    all_latencies = [
+        latency for latencies in recorder.latencies.values() for latency in latencies
+    ]
+    return {
+        "target": str(target),
+        "arrival": arrival,
+        "offered_rate": rate,
+        "elapsed_s": elapsed,
+        "requests": len(all_latencies),
+        "errors": sum(recorder.errors.values()),
+        "throughput_rps": len(all_latencies) / elapsed,
+        "latency_ms": _summarize(all_latencies),
+        "operations": {
+            operation: {
+                "requests": len(latencies),
+                "errors": recorder.errors.get(operation, 0),
+                "latency_ms": _summarize(latencies),
+            }
+            for operation, latencies in sorted(recorder.latencies.items())
+        },
+    }
+
+
+def _summarize(latencies: list[float]) -> dict[str, float]:
+    """Summarize latencies in milliseconds."""
+    if not latencies:
+        return {}
+    sample = SortedSample(latency * 1000 for latency in latencies)
+    summary = {name: sample.quantile(q) for name, q in PERCENTILES.items()}
+    summary["mean"] = sum(sample) / len(sample)
+    summary["max"] = sample[-1]
+    return summary
+
+
+def main() -> None:
+    """Run a load test from the command line and print or save the report."""
+    parser = argparse.ArgumentParser(description="Load test Calculator operations")
+    parser.add_argument("--mix", default="add=35,multiply=35,median=20,factorial=10")
+    parser.add_argument("--rate", type=float, default=200.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--arrival", choices=["poisson", "constant"], default="poisson")
+    parser.add_argument("--url", help="HTTP endpoint; in-process if omitted")
+    parser.add_argument("--list-size", type=int, default=10_000)
+    parser.add_argument("--factorial-n", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    target = HttpTarget(args.url) if args.url else InProcessTarget()
+    report = run(
+        target,
+        parse_mix(args.mix),
+        rate=args.rate,
+        duration=args.duration,
+        workers=args.workers,
+        arrival=args.arrival,
+        seed=args.seed,
+        workloads=default_workloads(args.list_size, args.factorial_n),
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
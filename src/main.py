@@ -0,0 +1,138 @@
+"""
+Command-line entry point (``modern-python``).
+
+Subcommands run a single Calculator operation or a Python job script that
+uses the library. With ``--profile`` the work runs under a profiler scoped
+to the library's own frames: collapsed stacks are written to
+``--profile-output`` for flamegraph tools and a per-Calculator-method time
+breakdown is printed to stderr.
+
+Example:
+    modern-python --profile --profile-output job.folded run job.py
+    modern-python --profile --profiler cprofile calc factorial 5000
+    flamegraph.pl job.folded > job.svg
+"""
+
+import argparse
+import runpy
+import sys
+from collections.abc import Callable, Sequence
+
+from src.example_calculator import Calculator, CalculatorError, Number
+from src.profiling import PROFILERS, profile_call
+from src.server import OPERATIONS
+
+
+# Operations taking one list argument rather than separate numbers
+_LIST_OPERATIONS = frozenset({"mean", "median", "mode", "describe"})
+
+
+def _number(text: str) -> Number:
+    """Parse a command-line number, keeping integers exact."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _calc(operation: str, args: Sequence[Number]) -> int:
+    """Run one Calculator operation and print its result."""
+    method = getattr(Calculator(), operation)
+    try:
+        result = method(list(args)) if operation in _LIST_OPERATIONS else method(*args)
+    except (CalculatorError, ArithmeticError, TypeError) as exc:
+        print(f"error: {exc}", file=sys.stderr)  # noqa: T201
+        return 1
+    # Results print in full, past the int-to-str digit limit (factorial of
+    # 5000 has 16326 digits); the limit is process-wide, so it is restored
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        print(result)  # noqa: T201
+    finally:
+        sys.set_int_max_str_digits(limit)
+    return 0
+
+
+def _run(script: str, args: Sequence[str]) -> int:
+    """Run a job script as ``__main__`` with its own argv."""
+    saved_argv = sys.argv
+    sys.argv = [script, *args]
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    finally:
+        sys.argv = saved_argv
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
+    parser = argparse.ArgumentParser(
+        prog="modern-python",
+        description="Run Calculator operations and jobs",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile library code",
+    )
+    parser.add_argument(
+        "--profiler",
+        choices=PROFILERS,
+        default="sample",
+        help="profiler used by --profile (default: sample)",
+    )
+    parser.add_argument(
+        "--profile-output",
+        default="profile.folded",
+        help="collapsed-stack output file (default: profile.folded)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.001,
+        help="seconds between samples for the sample profiler",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    calc = commands.add_parser("calc", help="run one Calculator operation")
+    calc.add_argument("operation", choices=sorted(OPERATIONS))
+    calc.add_argument("args", nargs="*", type=_number)
+    run = commands.add_parser("run", help="run a Python job script")
+    run.add_argument("script")
+    run.add_argument("args", nargs=argparse.REMAINDER)
+    return parser
+
+
+def app(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the command line.
+
+    Args:
+        argv: Arguments after the program name; sys.argv[1:] if None
+
+    Returns:
+        Process exit status
+    """
+    args = build_parser().parse_args(argv)
+    work: Callable[[], int]
+    if args.command == "calc":
+        work = lambda: _calc(args.operation, args.args)  # noqa: E731
+    else:
+        work = lambda: _run(args.script, args.args)  # noqa: E731
+    if not args.profile:
+        return work()
+    status, profile = profile_call(
+        work,
+        profiler=args.profiler,
+        interval=args.interval,
+    )
+    profile.write_collapsed(args.profile_output)
+    print(profile.format_breakdown(), file=sys.stderr)  # noqa: T201
+    print(f"collapsed stacks written to {args.profile_output}", file=sys.stderr)  # noqa: T201
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(app())
@@ -0,0 +1,422 @@
+"""
+Modular arithmetic on exact integers.
+
+This module provides modpow, modinv and mulmod for single values, and a
+Modulus context for batches sharing one modulus. The builtin ``pow`` already
+runs windowed exponentiation in C, so a single modpow, or a batch of bases
+raised to one exponent, calls it directly; re-implementing the window in
+Python only adds interpreter overhead. What a batch can share is
+precomputation:
+
+- Many exponents of one base use a fixed-base window table: powers
+  ``base**(d * 2**(w*i))`` for every w-bit digit d and window i, after
+  which each exponent costs one multiplication per non-zero digit and no
+  squarings at all.
+- Many inverses use batch inversion: one modular inverse of the product of
+  all values, then three multiplications per value.
+
+Results are Python ints, so moduli of any size are supported.
+"""
+
+from collections.abc import Sequence
+from itertools import repeat
+from typing import Any
+
+from src.example_calculator import InvalidOperationError
+
+
+# Largest fixed-base window; a table holds 2**w entries per window
+MAX_WINDOW = 8
+
+
+def modpow(base: int, exponent: int, modulus: int) -> int:
+    """
+    Calculate base**exponent modulo modulus.
+
+    Args:
+        base: Base
+        exponent: Exponent; negative exponents use the modular inverse
+        modulus: Positive modulus
+
+    Returns:
+        Result in range(modulus)
+
+    Raises:
+        TypeError: If arguments are not integers
+        InvalidOperationError: If the modulus is not positive, or the
+            exponent is negative and base is not invertible
+    """
+    return Modulus(modulus).pow(base, exponent)
+
+
+def modinv(value: int, modulus: int) -> int:
+    """
+    Calculate the inverse of value modulo modulus.
+
+    Args:
+        value: Value to invert
+        modulus: Positive modulus
+
+    Returns:
+        x in range(modulus) with value * x % modulus == 1 % modulus
+
+    Raises:
+        TypeError: If arguments are not integers
+        InvalidOperationError: If the modulus is not positive or value shares
+            a factor with it
+    """
+    return Modulus(modulus).inverse(value)
+
+
+def mulmod(a: int, b: int, modulus: int) -> int:
+    """
+    Calculate a * b modulo modulus.
+
+    Raises:
+        TypeError: If arguments are not integers
+        InvalidOperationError: If the modulus is not positive
+    """
+    return Modulus(modulus).multiply(a, b)
+
+
+class Modulus:
+    """
+    Arithmetic modulo a fixed modulus, with batch operations.
+
+    Attributes:
+        modulus: Modulus of every result
+    """
+
+    def __init__(self, modulus: int):
+        """
+        Initialize the context.
+
+        Args:
+            modulus: Positive modulus
+
+        Raises:
+            TypeError: If modulus is not an integer
+            InvalidOperationError: If modulus is not positive
+        """
+        modulus = _to_int(modulus)
+        if modulus < 1:
+            raise InvalidOperationError("Modulus must be positive")
+        self.modulus = modulus
+
+    def __repr__(self) -> str:
+        """Return a representation of the context."""
+        return f"Modulus({self.modulus})"
+
+    def pow(self, base: int, exponent: int) -> int:
+        """
+        Calculate base**exponent modulo the modulus.
+
+        Raises:
+            TypeError: If arguments are not integers
+            InvalidOperationError: If exponent is negative and base is not
+                invertible
+        """
+        base = _to_int(base)
+        exponent = _to_int(exponent)
+        if exponent < 0:
+            return pow(self.inverse(base), -exponent, self.modulus)
+        return pow(base, exponent, self.modulus)
+
+    def inverse(self, value: int) -> int:
+        """
+        Calculate the inverse of value modulo the modulus.
+
+        Raises:
+            TypeError: If value is not an integer
+            InvalidOperationError: If value shares a factor with the modulus
+        """
+        value = _to_int(value)
+        try:
+            return pow(value, -1, self.modulus)
+        except ValueError:
+            raise InvalidOperationError(
+                f"{value} is not invertible modulo {self.modulus}",
+            ) from None
+
+    def multiply(self, a: int, b: int) -> int:
+        """
+        Calculate a * b modulo the modulus.
+
+        Raises:
+            TypeError: If arguments are not integers
+        """
+        return _to_int(a) * _to_int(b) % self.modulus
+
+    def pow_bases(self, bases: Sequence[int], exponent: int) -> list[int]:
+        """
+        Raise many bases to one exponent.
+
+        Args:
+            bases: Bases
+            exponent: Exponent shared by every base
+
+        Returns:
+            base**exponent modulo the modulus for each base
+
+        Raises:
+            TypeError: If arguments are not integers
+            InvalidOperationError: If exponent is negative and a base is not
+                invertible
+        """
+        _check_ints(bases)
+        exponent = _to_int(exponent)
+        if exponent < 0:
+            bases = self.inverse_many(bases)
+            exponent = -exponent
+        return list(map(pow, bases, repeat(exponent), repeat(self.modulus)))
+
+    def pow_exponents(self, base: int, exponents: Sequence[int]) -> list[int]:
+        """
+        Raise one base to many exponents.
+
+        Uses a fixed-base window table when the batch is large enough to
+        repay building it, and the builtin pow otherwise.
+
+        Args:
+            base: Base shared by every exponent
+            exponents: Exponents
+
+        Returns:
+            base**exponent modulo the modulus for each exponent
+
+        Raises:
+            TypeError: If arguments are not integers
+            InvalidOperationError: If an exponent is negative and base is not
+                invertible
+        """
+        base = _to_int(base)
+        _check_ints(exponents)
+        if not exponents:
+            return []
+        if min(exponents) < 0:
+            return [self.pow(base, exponent) for exponent in exponents]
+        bits = max(exponents).bit_length()
+        window = _best_window(bits, len(exponents))
+        if window is None:
+            return list(map(pow, repeat(base), exponents, repeat(self.modulus)))
+        return FixedBase(self, base, bits, window).pow_many(exponents)
+
+    def inverse_many(self, values: Sequence[int]) -> list[int]:
+        """
+        Invert many values with one modular inverse.
+
+        Prefix products p[i] = v[0] * ... * v[i-1] are accumulated, the total
+        product is inverted once, and walking back down, inv * p[i] is the
+        inverse of v[i] before inv is multiplied by v[i].
+
+        Args:
+            values: Values to invert
+
+        Returns:
+            Inverse of each value
+
+        Raises:
+            TypeError: If values are not integers
+            InvalidOperationError: If a value shares a factor with the modulus
+        """
+        _check_ints(values)
+        m = self.modulus
+        prefixes = [1] * len(values)
+        product = 1
+        for index, value in enumerate(values):
+            prefixes[index] = product
+            product = product * value % m
+        try:
+            inverse = pow(product, -1, m)
+        except ValueError:
+            # Name the first value at fault
+            for value in values:
+                self.inverse(value)
+            raise
+        for index in range(len(values) - 1, -1, -1):
+            prefixes[index] = inverse * prefixes[index] % m
+            inverse = inverse * values[index] % m
+        return prefixes
+
+    def multiply_many(self, a: Sequence[int], b: Sequence[int]) -> list[int]:
+        """
+        Multiply pairs of values.
+
+        Args:
+            a: Left factors
+            b: Right factors
+
+        Returns:
+            a[i] * b[i] modulo the modulus
+
+        Raises:
+            TypeError: If values are not integers
+            InvalidOperationError: If lengths differ
+        """
+        if len(a) != len(b):
+            raise InvalidOperationError("a and b must have the same length")
+        _check_ints(a)
+        _check_ints(b)
+        m = self.modulus
+        return [x * y % m for x, y in zip(a, b, strict=True)]
+
+    def fixed_base(self, base: int, bits: int, window: int = 6) -> "FixedBase":
+        """
+        Precompute powers of base for exponents of up to bits bits.
+
+        Args:
+            base: Base
+            bits: Largest exponent bit length to support
+            window: Exponent bits consumed per table lookup, 1 to MAX_WINDOW
+
+        Returns:
+            Table answering pow(base, e) for 0 <= e < 2**bits
+
+        Raises:
+            TypeError: If arguments are not integers
+            InvalidOperationError: If bits is negative or window is out of
+                range
+        """
+        return FixedBase(self, _to_int(base), _to_int(bits), _to_int(window))
+
+
+class FixedBase:
+    """
+    Window table of one base's powers for fast repeated exponentiation.
+
+    Row i holds base**(d * 2**(window*i)) for each digit d in
+    range(2**window), so an exponent is processed window bits at a time with
+    one table multiplication per non-zero digit. The table costs
+    2**window * ceil(bits / window) multiplications to build and as many ints
+    to hold.
+
+    Attributes:
+        modulus: Modulus context
+        base: Base reduced modulo the modulus
+        bits: Largest supported exponent bit length
+        window: Exponent bits per table row
+    """
+
+    def __init__(self, modulus: Modulus, base: int, bits: int, window: int):
+        """
+        Build the table.
+
+        Raises:
+            InvalidOperationError: If bits is negative or window is out of
+                range
+        """
+        if bits < 0:
+            raise InvalidOperationError("Exponent bits must be non-negative")
+        if not 1 <= window <= MAX_WINDOW:
+            raise InvalidOperationError(f"Window must be between 1 and {MAX_WINDOW}")
+        m = modulus.modulus
+        self.modulus = modulus
+        self.base = base % m
+        self.bits = bits
+        self.window = window
+
+        rows = []
+        power = self.base
+        for _ in range(-(-bits // window)):
+            row = [1 % m] * (1 << window)
+            value = 1
+            for digit in range(1, 1 << window):
+                value = value * power % m
+                row[digit] = value
+            rows.append(row)
+            power = value * power % m
+        self._rows = rows
+
+    def pow(self, exponent: int) -> int:
+        """
+        Calculate base**exponent modulo the modulus.
+
+        Raises:
+            TypeError: If exponent is not an integer
+            InvalidOperationError: If exponent is negative or too large for
+                the table
+        """
+        exponent = _to_int(exponent)
+        self._check_range(exponent, exponent)
+        return self._pow(exponent)
+
+    def pow_many(self, exponents: Sequence[int]) -> list[int]:
+        """
+        Calculate base**e modulo the modulus for each exponent.
+
+        Raises:
+            TypeError: If exponents are not integers
+            InvalidOperationError: If an exponent is negative or too large
+                for the table
+        """
+        _check_ints(exponents)
+        if not exponents:
+            return []
+        self._check_range(min(exponents), max(exponents))
+        return list(map(self._pow, exponents))
+
+    def _pow(self, exponent: int) -> int:
+        """Multiply the table entries of each window digit of exponent."""
+        m = self.modulus.modulus
+        mask = (1 << self.window) - 1
+        shift = self.window
+        result = 1 % m
+        for row in self._rows:
+            if not exponent:
+                break
+            digit = exponent & mask
+            if digit:
+                result = result * row[digit] % m
+            exponent >>= shift
+        return result
+
+    def _check_range(self, low: int, high: int) -> None:
+        """Validate that exponents in [low, high] fit the table."""
+        if low < 0:
+            raise InvalidOperationError("Exponents must be non-negative")
+        if high.bit_length() > self.bits:
+            raise InvalidOperationError(
+                f"Exponents must be below 2**{self.bits} for this table",
+            )
+
+
+def _best_window(bits: int, count: int) -> int | None:
+    """
+    Choose the fixed-base window for count exponents of up to bits bits.
+
+    Building a w-bit table and answering count queries takes about
+    (2**w + count) * ceil(bits / w) Python-level multiplications; one builtin
+    pow costs about as much as bits of them.
+
+    Returns:
+        Cheapest window, or None if the builtin pow is cheaper
+    """
+    costs = {
+        window: ((1 << window) + count) * -(-bits // window)
+        for window in range(1, MAX_WINDOW + 1)
+    }
+    window = min(costs, key=costs.__getitem__)
+    return window if costs[window] < count * bits else None
+
+
+def _to_int(value: Any) -> int:
+    """
+    Validate an integer argument.
+
+    Raises:
+        TypeError: If value is not an int
+    """
+    if not isinstance(value, int):
+        raise TypeError(f"Expected integer, got {type(value).__name__}")
+    return value
+
+
+def _check_ints(values: Sequence[Any]) -> None:
+    """
+    Validate that every element is an int.
+
+    Raises:
+        TypeError: If an element is not an int
+    """
+    if not {int}.issuperset(map(type, values)):
+        raise TypeError("Expected integers")
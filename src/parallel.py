@@ -0,0 +1,91 @@
+"""
+Thread-parallel chunk execution for free-threaded Python builds.
+
+On the free-threaded build (``python3.13t``) threads run Python code on
+separate cores, so a large batch split into contiguous chunks, one thread per
+chunk, scales with core count. On the default build the GIL serialises that
+work and handing chunks to threads only adds overhead, so ``run_chunks``
+runs everything on the calling thread there. The GIL is checked on every
+call because a free-threaded interpreter re-enables it at runtime when an
+extension module that does not support free threading is imported.
+"""
+
+import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from src.example_calculator import InvalidOperationError
+
+
+# Chunks smaller than this are not worth a thread hand-off
+MIN_CHUNK_SIZE = 16_384
+
+
+def gil_enabled() -> bool:
+    """Return whether the GIL is enabled; always True before Python 3.13."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def default_workers() -> int:
+    """Return the number of CPUs this process may run on."""
+    cpu_count = getattr(os, "process_cpu_count", os.cpu_count)
+    return cpu_count() or 1
+
+
+def chunk_bounds(size: int, workers: int) -> list[tuple[int, int]]:
+    """
+    Split range(size) into at most workers contiguous chunks.
+
+    Chunks are kept at least MIN_CHUNK_SIZE long, so small inputs get fewer
+    chunks than workers.
+
+    Args:
+        size: Number of elements
+        workers: Maximum number of chunks
+
+    Returns:
+        (start, stop) pairs in order; a single (0, 0) chunk when size is 0
+    """
+    if not size:
+        return [(0, 0)]
+    count = max(1, min(workers, size // MIN_CHUNK_SIZE))
+    step = -(-size // count)
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def run_chunks(
+    func: Callable[[int, int], Any],
+    size: int,
+    workers: int | None = None,
+) -> list[Any]:
+    """
+    Call func(start, stop) over contiguous chunks of range(size).
+
+    Chunks run on a thread pool when the GIL is disabled and the input is
+    large enough to split, and on the calling thread otherwise.
+
+    Args:
+        func: Chunk function; must not share mutable state between chunks
+        size: Number of elements
+        workers: Maximum number of threads; CPUs available if None
+
+    Returns:
+        Chunk results in chunk order
+
+    Raises:
+        InvalidOperationError: If workers is not positive
+        Exception: The exception of the first failing chunk, in chunk order
+    """
+    if workers is None:
+        workers = default_workers()
+    if workers < 1:
+        raise InvalidOperationError("Workers must be positive")
+    bounds = chunk_bounds(size, 1 if gil_enabled() else workers)
+    if len(bounds) == 1:
+        return [func(*bounds[0])]
+    with ThreadPoolExecutor(max_workers=len(bounds)) as executor:
+        futures = [executor.submit(func, start, stop) for start, stop in bounds]
+        return [future.result() for future in futures]
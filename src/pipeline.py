@@ -0,0 +1,368 @@
+"""
+Lazy pipelines over Calculator operations.
+
+This module provides a Pipeline that chains element-wise steps, windows and
+aggregates over any iterable without building an intermediate list per
+step::
+
+    Pipeline(readings).map("divide", 10).window(5).aggregate("median")
+
+Building a pipeline only records its stages; data flows when a terminal
+operation (iteration, ``collect``, ``to_array``, ``chunks`` or ``reduce``)
+is called. Adjacent ``map`` and ``filter`` stages are fused into a single
+generated generator function, so each element passes through one Python
+loop, and arithmetic Calculator operations with a constant operand are
+inlined into it rather than called per element.
+"""
+
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from src.example_calculator import Calculator, InvalidOperationError, Number
+from src.kernels import group_aggregates
+from src.summation import Accumulator, sum_of
+
+
+# Binary Calculator operations inlined as ``float(x <operator> operand)``
+_INLINE_OPERATORS = {
+    "add": "+",
+    "subtract": "-",
+    "multiply": "*",
+    "divide": "/",
+    "power": "**",
+}
+_BINARY_OPERATIONS = frozenset(_INLINE_OPERATORS)
+_UNARY_OPERATIONS = frozenset({"sqrt", "factorial"})
+# Aggregates Calculator validates and computes itself
+_CALCULATOR_AGGREGATES = frozenset({"mean", "median", "mode"})
+
+
+class _Stage:
+    """One recorded pipeline stage."""
+
+    def __init__(self, kind: str, label: str, *, code: str = "", value: Any = None):
+        # kind is "inline", "call" or "filter" (element-wise, fusable) or
+        # "window"; code is the inline expression; value is the function,
+        # predicate, operand or window (size, step)
+        self.kind = kind
+        self.label = label
+        self.code = code
+        self.value = value
+
+
+class Pipeline:
+    """
+    A lazy sequence of steps over a source iterable.
+
+    Each method returns a new Pipeline, so a partly built pipeline can be
+    extended in several ways. A source that is a one-shot iterator can only
+    be evaluated once.
+
+    Attributes:
+        calculator: Calculator used for named operations and aggregates
+    """
+
+    def __init__(
+        self,
+        source: Iterable[Any],
+        calculator: Calculator | None = None,
+    ):
+        """
+        Create a pipeline over a source.
+
+        Args:
+            source: Values to process
+            calculator: Calculator for named operations; a new one by default
+        """
+        self.calculator = calculator or Calculator()
+        self._source = source
+        self._stages: tuple[_Stage, ...] = ()
+
+    def map(
+        self,
+        operation: str | Callable[[Any], Any],
+        *operands: Any,
+    ) -> "Pipeline":
+        """
+        Transform each element.
+
+        Args:
+            operation: A function, or the name of an element-wise Calculator
+                operation (add, subtract, multiply, divide, power, sqrt,
+                factorial), applied as ``operation(element, *operands)``
+            *operands: Constant second argument of a binary operation
+
+        Returns:
+            Extended pipeline
+
+        Raises:
+            InvalidOperationError: If the operation name is unknown or has
+                the wrong number of operands
+            TypeError: If an operand is not a number
+        """
+        if callable(operation):
+            name = getattr(operation, "__name__", "function")
+            return self._extend(_Stage("call", f"map {name}", value=operation))
+        if operation in _BINARY_OPERATIONS:
+            if len(operands) != 1:
+                raise InvalidOperationError(f"{operation} takes one operand")
+            (operand,) = operands
+            if not isinstance(operand, int | float):
+                raise TypeError(f"Expected number, got {type(operand).__name__}")
+            label = f"{operation} {operand!r}"
+            if operation == "divide" and operand == 0:
+                # Keep Calculator's per-element DivisionByZeroError
+                method = self.calculator.divide
+                return self._extend(
+                    _Stage("call", label, value=lambda x: method(x, operand)),
+                )
+            code = f"float(x {_INLINE_OPERATORS[operation]} {{operand}})"
+            return self._extend(_Stage("inline", label, code=code, value=operand))
+        if operation in _UNARY_OPERATIONS:
+            if operands:
+                raise InvalidOperationError(f"{operation} takes no operands")
+            method = getattr(self.calculator, operation)
+            return self._extend(_Stage("call", operation, value=method))
+        raise InvalidOperationError(f"Unknown operation: {operation}")
+
+    def filter(self, predicate: Callable[[Any], Any]) -> "Pipeline":
+        """
+        Keep elements for which predicate is true.
+
+        Args:
+            predicate: Test applied to each element
+
+        Returns:
+            Extended pipeline
+        """
+        name = getattr(predicate, "__name__", "predicate")
+        return self._extend(_Stage("filter", f"filter {name}", value=predicate))
+
+    def window(self, size: int, step: int = 1) -> "Pipeline":
+        """
+        Group elements into windows of size elements, starting every step.
+
+        Windows are tuples; step 1 gives sliding windows and step == size
+        gives non-overlapping ones. A trailing partial window is dropped.
+
+        Args:
+            size: Elements per window
+            step: Elements between window starts
+
+        Returns:
+            Extended pipeline
+
+        Raises:
+            InvalidOperationError: If size or step is not positive
+        """
+        if size <= 0 or step <= 0:
+            raise InvalidOperationError("Window size and step must be positive")
+        return self._extend(
+            _Stage("window", f"window {size} step {step}", value=(size, step)),
+        )
+
+    def aggregate(self, name: str) -> "Pipeline":
+        """
+        Reduce each window to one value.
+
+        Args:
+            name: count, sum, mean, min, max, median or mode
+
+        Returns:
+            Extended pipeline
+
+        Raises:
+            InvalidOperationError: If name is unknown or no window precedes
+                this stage
+        """
+        if not any(stage.kind == "window" for stage in self._stages):
+            raise InvalidOperationError(
+                "aggregate() needs a preceding window(); use reduce() instead",
+            )
+        return self._extend(
+            _Stage("call", f"aggregate {name}", value=self._aggregator(name)),
+        )
+
+    def __iter__(self) -> Iterator[Any]:
+        """Evaluate the pipeline lazily."""
+        stream: Iterable[Any] = self._source
+        for group in self._groups():
+            if group[0].kind == "window":
+                size, step = group[0].value
+                stream = _windows(stream, size, step)
+            else:
+                stream = _fuse(group)(stream)
+        return iter(stream)
+
+    def collect(self) -> list[Any]:
+        """Evaluate the pipeline into a list."""
+        return list(self)
+
+    def to_array(self) -> "array[float]":
+        """
+        Evaluate the pipeline into a float array.
+
+        Raises:
+            TypeError: If an element is not a number
+        """
+        return array("d", self)
+
+    def chunks(self, size: int) -> Iterator["array[float]"]:
+        """
+        Evaluate the pipeline in float arrays of at most size elements.
+
+        Only one chunk is held in memory at a time.
+
+        Args:
+            size: Elements per chunk
+
+        Returns:
+            Iterator of chunks
+
+        Raises:
+            InvalidOperationError: If size is not positive
+        """
+        if size <= 0:
+            raise InvalidOperationError("Chunk size must be positive")
+        return self._chunks(size)
+
+    def reduce(self, name: str) -> Number:
+        """
+        Evaluate the pipeline and reduce every element to one value.
+
+        count, sum, mean, min and max are computed chunk by chunk; median and
+        mode need all elements at once. Sums follow the calculator's
+        summation mode: naive and pairwise add one sum per chunk, while kahan
+        and exact add every element to the running total so that no
+        rounding error is lost between chunks.
+
+        Args:
+            name: count, sum, mean, min, max, median or mode
+
+        Returns:
+            Aggregate of all elements
+
+        Raises:
+            InvalidOperationError: If name is unknown or the pipeline is empty
+            TypeError: If an element is not a number
+        """
+        aggregator = self._aggregator(name)
+        if name in {"median", "mode"}:
+            return aggregator(self.collect())
+        mode = self.calculator.summation
+        count = 0
+        total = Accumulator(mode, 0.0)
+        lows: list[float] = []
+        highs: list[float] = []
+        for chunk in self._chunks(65_536):
+            count += len(chunk)
+            if mode in {"naive", "pairwise"}:
+                total.add(sum_of(chunk, mode))
+            else:
+                for value in chunk:
+                    total.add(value)
+            lows.append(min(chunk))
+            highs.append(max(chunk))
+        if name == "count":
+            return count
+        if name == "sum":
+            return total.value
+        if not count:
+            raise InvalidOperationError(f"Cannot calculate {name} of empty list")
+        if name == "mean":
+            return total.value / count
+        return min(lows) if name == "min" else max(highs)
+
+    def explain(self) -> list[str]:
+        """
+        Describe the passes evaluation will run, one line per generator.
+
+        Fused stages share a line, joined with ``|``.
+        """
+        return [" | ".join(stage.label for stage in group) for group in self._groups()]
+
+    def _extend(self, stage: _Stage) -> "Pipeline":
+        """Return a copy of this pipeline with one more stage."""
+        pipeline = Pipeline(self._source, self.calculator)
+        pipeline._stages = (*self._stages, stage)
+        return pipeline
+
+    def _groups(self) -> list[list[_Stage]]:
+        """Split stages into runs of fusable element-wise stages and windows."""
+        groups: list[list[_Stage]] = []
+        for stage in self._stages:
+            if stage.kind == "window" or not groups or groups[-1][0].kind == "window":
+                groups.append([stage])
+            else:
+                groups[-1].append(stage)
+        return groups
+
+    def _aggregator(self, name: str) -> Callable[[Any], Number]:
+        """Return the function computing a named aggregate of a sequence."""
+        if name in _CALCULATOR_AGGREGATES:
+            return getattr(self.calculator, name)
+        aggregates = group_aggregates(self.calculator.summation)
+        if name not in aggregates:
+            raise InvalidOperationError(f"Unknown aggregate: {name}")
+        return aggregates[name]
+
+    def _chunks(self, size: int) -> Iterator["array[float]"]:
+        """Yield float arrays of at most size elements."""
+        iterator = iter(self)
+        while chunk := array("d", islice(iterator, size)):
+            yield chunk
+
+
+def _fuse(stages: list[_Stage]) -> Callable[[Iterable[Any]], Iterator[Any]]:
+    """
+    Generate one generator function running element-wise stages in order.
+
+    Inline arithmetic is emitted as ``x = float(x op sN)``, preceded by a type
+    check whenever the previous step could have produced a non-number;
+    functions and predicates are called through names bound in the generated
+    function's namespace.
+    """
+    namespace: dict[str, Any] = {"number": (int, float), "type_error": _type_error}
+    lines = ["def run(source):", "    for x in source:"]
+    checked = False
+    for index, stage in enumerate(stages):
+        name = f"s{index}"
+        namespace[name] = stage.value
+        if stage.kind == "inline":
+            if not checked:
+                lines.append("        if not isinstance(x, number): type_error(x)")
+            lines.append(f"        x = {stage.code.format(operand=name)}")
+            checked = True
+        elif stage.kind == "call":
+            lines.append(f"        x = {name}(x)")
+            checked = False
+        else:
+            lines.append(f"        if not {name}(x): continue")
+    lines.append("        yield x")
+    exec("\n".join(lines), namespace)
+    return namespace["run"]
+
+
+def _type_error(value: Any) -> None:
+    """Raise the TypeError Calculator raises for a non-number."""
+    raise TypeError(f"Expected number, got {type(value).__name__}")
+
+
+def _windows(stream: Iterable[Any], size: int, step: int) -> Iterator[tuple[Any, ...]]:
+    """Yield full windows of size elements, starting every step elements."""
+    iterator = iter(stream)
+    window = deque(islice(iterator, size), maxlen=size)
+    if len(window) < size:
+        return
+    yield tuple(window)
+    while True:
+        advance = tuple(islice(iterator, step))
+        if len(advance) < step:
+            return
+        # With step > size the deque keeps only the last size elements,
+        # which skips the gap between windows
+        window.extend(advance)
+        yield tuple(window)
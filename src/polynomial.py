@@ -0,0 +1,174 @@
+"""
+Polynomial evaluation using Horner's scheme.
+
+This module provides a Polynomial class that is compiled once from its
+coefficients into straight-line Horner code, so evaluating it costs one
+Python function call with no loop over terms and no power computations.
+Batch evaluation maps the compiled function over a typed array in C, and the
+derivative is evaluated in the same Horner pass as the value.
+"""
+
+import math
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from src.example_calculator import Number
+
+
+class Polynomial:
+    """
+    A polynomial with float coefficients.
+
+    Coefficients are given lowest degree first, so ``Polynomial([1, 0, 2])``
+    is ``1 + 2x**2``. Trailing zero coefficients are dropped.
+
+    Attributes:
+        coefficients: Coefficients, lowest degree first
+    """
+
+    def __init__(self, coefficients: Iterable[Number]):
+        """
+        Compile a polynomial from its coefficients.
+
+        Args:
+            coefficients: Coefficients, lowest degree first
+
+        Raises:
+            TypeError: If coefficients contain non-numbers
+        """
+        values = array("d", coefficients)
+        while values and values[-1] == 0:
+            values.pop()
+        self.coefficients: tuple[float, ...] = tuple(values)
+        self._value: Callable[[Number], float] = _compile(
+            self.coefficients,
+            derivative=False,
+        )
+        self._value_and_derivative: Callable[[Number], tuple[float, float]] = _compile(
+            self.coefficients, derivative=True
+        )
+
+    @property
+    def degree(self) -> int:
+        """Return the degree; the zero polynomial has degree -1."""
+        return len(self.coefficients) - 1
+
+    def __call__(self, x: Number) -> float:
+        """Evaluate the polynomial at x."""
+        return self._value(x)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare coefficients."""
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        return self.coefficients == other.coefficients
+
+    def __hash__(self) -> int:
+        """Hash the coefficients."""
+        return hash(self.coefficients)
+
+    def __repr__(self) -> str:
+        """Return a developer representation."""
+        return f"Polynomial({list(self.coefficients)!r})"
+
+    def evaluate(self, x: Number) -> float:
+        """
+        Evaluate the polynomial at x.
+
+        Args:
+            x: Point
+
+        Returns:
+            Value at x
+        """
+        return self._value(x)
+
+    def evaluate_with_derivative(self, x: Number) -> tuple[float, float]:
+        """
+        Evaluate the polynomial and its first derivative in one Horner pass.
+
+        Args:
+            x: Point
+
+        Returns:
+            (value, derivative) at x
+        """
+        return self._value_and_derivative(x)
+
+    def evaluate_many(self, xs: Sequence[Number]) -> "array[float]":
+        """
+        Evaluate the polynomial at many points.
+
+        Args:
+            xs: Points, ideally an ``array('d')``
+
+        Returns:
+            Values at each point
+        """
+        return array("d", map(self._value, xs))
+
+    def evaluate_many_with_derivative(
+        self,
+        xs: Sequence[Number],
+    ) -> tuple["array[float]", "array[float]"]:
+        """
+        Evaluate the polynomial and its derivative at many points.
+
+        Args:
+            xs: Points, ideally an ``array('d')``
+
+        Returns:
+            (values, derivatives) at each point
+        """
+        values = array("d")
+        derivatives = array("d")
+        for value, derivative in map(self._value_and_derivative, xs):
+            values.append(value)
+            derivatives.append(derivative)
+        return values, derivatives
+
+    def derivative(self) -> "Polynomial":
+        """Return the derivative polynomial."""
+        return Polynomial(
+            power * coefficient
+            for power, coefficient in enumerate(self.coefficients)
+            if power
+        )
+
+
+def _compile(
+    coefficients: tuple[float, ...],
+    *,
+    derivative: bool,
+) -> Callable[[Number], Any]:
+    """
+    Generate straight-line Horner code for the coefficients.
+
+    Each step is ``p = p * x + c`` with the coefficient inlined as a literal;
+    with derivative, ``dp = dp * x + p`` is updated first in the same step.
+    Statements are emitted one per line rather than as one nested expression
+    so that high degrees do not hit the parser's nesting limit.
+    """
+    namespace: dict[str, Any] = {}
+    terms: list[str] = []
+    for power, value in enumerate(coefficients):
+        if math.isfinite(value):
+            terms.append(repr(value))
+        else:
+            terms.append(f"c{power}")
+            namespace[f"c{power}"] = value
+
+    lines = [
+        "def evaluate(x):",
+        f"    p = {terms[-1] if terms else 0.0}",
+        "    dp = 0.0",
+    ]
+    for term in reversed(terms[:-1]):
+        step = f"p = p * x + {term}"
+        lines.append(f"    dp = dp * x + p; {step}" if derivative else f"    {step}")
+    lines.append(
+        "    return float(p), float(dp)" if derivative else "    return float(p)"
+    )
+    exec("\n".join(lines), namespace)
+    return namespace["evaluate"]
@@ -0,0 +1,361 @@
+"""
+Profiling scoped to this library's own code.
+
+This module records where time goes inside the library and reports it two
+ways: collapsed stacks (``a;b;c <weight>`` lines, the input format of
+flamegraph.pl, speedscope and inferno) and a per-Calculator-method
+breakdown. Stacks keep only frames from the library's source files, so
+callers' code and the standard library do not drown out the library; time
+spent in code outside the library is charged to the library frame that
+called it.
+
+Two profilers are available:
+
+- ``sample``: a background thread reads the profiled thread's Python stack
+  about every ``interval`` seconds through ``sys._current_frames()``. Each
+  sample is weighted by the time since the previous one, since with the GIL
+  the sampler often wakes later than asked. Overhead is low and independent
+  of call counts, and stacks are exact.
+- ``cprofile``: deterministic cProfile tracing. It adds call counts but
+  slows call-heavy code, and stacks are rebuilt from caller/callee edges,
+  so time is split between callers in proportion to their share of calls.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any
+
+from src.example_calculator import InvalidOperationError
+
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+# The profiler and the command line that drives it are not library code
+_EXCLUDED = frozenset(str(PACKAGE_DIR / name) for name in ("profiling.py", "main.py"))
+
+PROFILERS = ("sample", "cprofile")
+
+# Stack weights are whole microseconds
+_UNIT = 1e-6
+
+
+class Profile:
+    """
+    Result of profiling: library-only stacks weighted by time.
+
+    Attributes:
+        stacks: Microseconds spent in each stack of frame labels, outermost
+            first
+        unit: Seconds represented by one unit of weight (one microsecond)
+        calls: Call count per frame label, when the profiler counts calls
+    """
+
+    def __init__(
+        self,
+        stacks: Counter[tuple[str, ...]],
+        unit: float = 1e-6,
+        calls: dict[str, int] | None = None,
+    ):
+        """Initialize a profile."""
+        self.stacks = stacks
+        self.unit = unit
+        self.calls = calls
+
+    @property
+    def total_seconds(self) -> float:
+        """Return the time covered by all stacks."""
+        return sum(self.stacks.values()) * self.unit
+
+    def collapsed(self) -> list[str]:
+        """Return collapsed-stack lines, heaviest first."""
+        return [
+            f"{';'.join(stack)} {weight}"
+            for stack, weight in self.stacks.most_common()
+            if weight > 0
+        ]
+
+    def write_collapsed(self, path: str | os.PathLike[str]) -> None:
+        """
+        Write collapsed stacks for flamegraph tools.
+
+        Args:
+            path: Output file path
+        """
+        Path(path).write_text("".join(f"{line}\n" for line in self.collapsed()))
+
+    def method_breakdown(self) -> list[tuple[str, float, float, int | None]]:
+        """
+        Break time down by Calculator method.
+
+        Inclusive time counts every stack the method appears in. Exclusive
+        time counts stacks where it is the innermost Calculator method, so
+        exclusive times add up to the total time spent in Calculator.
+
+        Returns:
+            (method, inclusive seconds, exclusive seconds, calls or None)
+            rows, most inclusive time first
+        """
+        inclusive: Counter[str] = Counter()
+        exclusive: Counter[str] = Counter()
+        for stack, weight in self.stacks.items():
+            methods = [label for label in stack if _is_calculator_method(label)]
+            for method in set(methods):
+                inclusive[method] += weight
+            if methods:
+                exclusive[methods[-1]] += weight
+        return [
+            (
+                method.partition(":")[2],
+                weight * self.unit,
+                exclusive[method] * self.unit,
+                None if self.calls is None else self.calls.get(method, 0),
+            )
+            for method, weight in inclusive.most_common()
+        ]
+
+    def format_breakdown(self) -> str:
+        """Return the Calculator method breakdown as a text table."""
+        lines = [
+            f"{'method':<32} {'inclusive':>10} {'exclusive':>10} {'calls':>8}",
+        ]
+        for method, inclusive, exclusive, calls in self.method_breakdown():
+            count = "-" if calls is None else str(calls)
+            lines.append(
+                f"{method:<32} {inclusive:>9.3f}s {exclusive:>9.3f}s {count:>8}",
+            )
+        lines.append(f"{'total in library':<32} {self.total_seconds:>9.3f}s")
+        return "\n".join(lines)
+
+
+class SamplingProfiler:
+    """
+    Samples one thread's library stack at a fixed interval.
+
+    Use as a context manager around the code to profile, on the thread that
+    runs it.
+
+    Attributes:
+        interval: Seconds between samples
+        samples: Samples taken, including ones outside the library
+    """
+
+    def __init__(self, interval: float = 0.001):
+        """
+        Initialize the profiler.
+
+        Args:
+            interval: Seconds between samples
+
+        Raises:
+            InvalidOperationError: If interval is not positive
+        """
+        if interval <= 0:
+            raise InvalidOperationError("Sampling interval must be positive")
+        self.interval = interval
+        self.samples = 0
+        self._stacks: Counter[tuple[str, ...]] = Counter()
+        self._labels: dict[CodeType, str | None] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._target = 0
+
+    def start(self) -> None:
+        """Start sampling the calling thread."""
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Profile:
+        """
+        Stop sampling.
+
+        Returns:
+            Profile of the sampled stacks
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return Profile(Counter(self._stacks), _UNIT)
+
+    def __enter__(self) -> "SamplingProfiler":
+        """Start sampling."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop sampling."""
+        self.stop()
+
+    def _run(self) -> None:
+        """Take samples until stopped."""
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)  # noqa: SLF001
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            if frame is None:
+                continue
+            self.samples += 1
+            stack = self._stack(frame)
+            if stack:
+                self._stacks[stack] += round(elapsed / _UNIT)
+
+    def _stack(self, frame: FrameType | None) -> tuple[str, ...]:
+        """Return the library frame labels of a stack, outermost first."""
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            if code not in self._labels:
+                self._labels[code] = (
+                    _label(code.co_filename, code.co_qualname)
+                    if _in_scope(code.co_filename)
+                    else None
+                )
+            label = self._labels[code]
+            if label is not None:
+                labels.append(label)
+            frame = frame.f_back
+        return tuple(reversed(labels))
+
+
+def profile_call(
+    func: Callable[..., Any],
+    *args: Any,
+    profiler: str = "sample",
+    interval: float = 0.001,
+    **kwargs: Any,
+) -> tuple[Any, Profile]:
+    """
+    Call a function under a profiler.
+
+    Args:
+        func: Function to profile
+        *args: Positional arguments for func
+        profiler: ``"sample"`` or ``"cprofile"``
+        interval: Seconds between samples for the sampling profiler
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        func's result and the profile; if func raises, the exception
+        propagates and the profile is lost
+
+    Raises:
+        InvalidOperationError: If profiler is unknown
+    """
+    if profiler == "sample":
+        sampler = SamplingProfiler(interval)
+        sampler.start()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            profile = sampler.stop()
+        return result, profile
+    if profiler == "cprofile":
+        tracer = cProfile.Profile(time.perf_counter)
+        result = tracer.runcall(func, *args, **kwargs)
+        return result, _from_cprofile(pstats.Stats(tracer).stats)  # type: ignore[attr-defined]
+    raise InvalidOperationError(f"Unknown profiler: {profiler}")
+
+
+# pstats keys functions as (filename, first line, name)
+_Function = tuple[str, int, str]
+
+
+def _from_cprofile(stats: dict[_Function, tuple[Any, ...]]) -> Profile:
+    """
+    Rebuild library stacks from cProfile's caller/callee statistics.
+
+    Starting from library functions with no library caller, each function's
+    own time is emitted on the current stack and its callees are visited
+    with the share of their time that came from this caller. Time in callees
+    outside the library is added to the caller's own time. Recursive edges
+    are not followed.
+    """
+    names = _qualified_names(function[0] for function in stats)
+    labels = {
+        function: _label(function[0], names.get(function[:2], function[2]))
+        for function in stats
+        if _in_scope(function[0])
+    }
+    callees: dict[_Function, list[tuple[_Function, float]]] = {}
+    for function, entry in stats.items():
+        for caller, edge in entry[4].items():
+            callees.setdefault(caller, []).append((function, edge[3]))
+
+    stacks: Counter[tuple[str, ...]] = Counter()
+
+    def visit(function: _Function, path: tuple[str, ...], fraction: float) -> None:
+        stack = (*path, labels[function])
+        own = stats[function][2] * fraction
+        for callee, edge_cumulative in callees.get(function, ()):
+            share = edge_cumulative * fraction
+            if callee not in labels:
+                own += share
+            elif labels[callee] not in stack and stats[callee][3]:
+                visit(callee, stack, share / stats[callee][3])
+        stacks[stack] += round(own / _UNIT)
+
+    for function in labels:
+        if not any(caller in labels for caller in stats[function][4]):
+            visit(function, (), 1.0)
+    calls = {label: stats[function][1] for function, label in labels.items()}
+    return Profile(stacks, _UNIT, calls)
+
+
+def _qualified_names(filenames: Iterable[str]) -> dict[tuple[str, int], str]:
+    """
+    Map (filename, first line) of library functions to qualified names.
+
+    cProfile only records bare function names; qualified names such as
+    ``Calculator.mean`` are recovered from the code objects of the loaded
+    library modules.
+    """
+    wanted = {filename for filename in filenames if _in_scope(filename)}
+    pending: list[CodeType] = []
+    for module in list(sys.modules.values()):
+        if getattr(module, "__file__", None) not in wanted:
+            continue
+        for value in vars(module).values():
+            members = vars(value).values() if isinstance(value, type) else [value]
+            for member in members:
+                func = getattr(member, "__func__", getattr(member, "fget", member))
+                code = getattr(func, "__code__", None)
+                if isinstance(code, CodeType):
+                    pending.append(code)
+    names: dict[tuple[str, int], str] = {}
+    while pending:
+        code = pending.pop()
+        names[code.co_filename, code.co_firstlineno] = code.co_qualname
+        pending.extend(const for const in code.co_consts if isinstance(const, CodeType))
+    return names
+
+
+def _in_scope(filename: str) -> bool:
+    """Return whether a source file belongs to the profiled library."""
+    return filename.startswith(str(PACKAGE_DIR)) and filename not in _EXCLUDED
+
+
+def _label(filename: str, qualname: str) -> str:
+    """Return a frame label such as ``example_calculator:Calculator.mean``."""
+    return f"{Path(filename).stem}:{qualname}"
+
+
+def _is_calculator_method(label: str) -> bool:
+    """Return whether a frame label is a public Calculator method."""
+    module, _, qualname = label.partition(":")
+    return (
+        module == "example_calculator"
+        and qualname.startswith("Calculator.")
+        and not qualname.startswith("Calculator._")
+        and "<" not in qualname
+    )
@@ -0,0 +1,155 @@
+"""
+Minimal JSON-over-HTTP service exposing Calculator operations.
+
+This module provides a small localhost stand-in for a Calculator-backed
+service, used to exercise HTTP clients and load tests. Each operation is a
+``POST /<operation>`` request with a JSON body ``{"args": [...]}``; the
+response is ``{"result": ...}`` or, on failure, HTTP 400 with
+``{"error": "<exception type>", "message": "..."}``; a result JSON cannot
+represent, such as an int past Python's int-to-str digit limit, is reported
+as a ValueError. ``POST /batch`` with
+``{"calls": [{"operation": ..., "args": [...]}, ...]}`` runs several
+operations in one request and answers ``{"results": [...]}`` holding one
+success or error object per call, in order. Connections are kept alive
+between requests (HTTP/1.1), and pipelined requests on a connection are
+answered in order.
+"""
+
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from src.example_calculator import Calculator, CalculatorError
+
+
+OPERATIONS = frozenset(
+    {
+        "add",
+        "subtract",
+        "multiply",
+        "divide",
+        "power",
+        "sqrt",
+        "factorial",
+        "mean",
+        "median",
+        "mode",
+        "describe",
+    },
+)
+
+
+class CalculatorRequestHandler(BaseHTTPRequestHandler):
+    """Handle ``POST /<operation>`` requests against a shared Calculator."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; with Nagle's algorithm the
+    # body waits for the client's delayed ACK of the headers (~40ms)
+    disable_nagle_algorithm = True
+    # Shared by all handler threads; safe because OPERATIONS are stateless
+    calculator = Calculator()
+
+    def do_POST(self) -> None:
+        """Run one operation, or a batch, and write its JSON response."""
+        operation = self.path.strip("/")
+        try:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            request = json.loads(body or b"{}")
+            if operation == "batch":
+                # Each call is encoded on its own, so one unencodable result
+                # becomes that call's error object rather than failing all
+                results = [
+                    self._execute(call["operation"], call.get("args", []))[1]
+                    for call in request["calls"]
+                ]
+                self._respond(200, b'{"results": [' + b", ".join(results) + b"]}")
+                return
+            args = request.get("args", [])
+        except (TypeError, ValueError, AttributeError, KeyError) as exc:
+            self._respond(400, _error_body(type(exc).__name__, str(exc)))
+            return
+        self._respond(*self._execute(operation, args))
+
+    def _execute(self, operation: str, args: Any) -> tuple[int, bytes]:
+        """Run one operation and return its HTTP status and encoded JSON payload."""
+        if operation not in OPERATIONS:
+            return 404, _error_body("NotFound", f"Unknown operation: {operation}")
+        try:
+            result = getattr(self.calculator, operation)(*args)
+            return 200, json.dumps({"result": result}).encode()
+        except (
+            CalculatorError,
+            ArithmeticError,
+            TypeError,
+            ValueError,
+            AttributeError,
+        ) as exc:
+            return 400, _error_body(type(exc).__name__, str(exc))
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+
+    def _respond(self, status: int, data: bytes) -> None:
+        """Write an encoded JSON response."""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _error_body(error: str, message: str) -> bytes:
+    """Encode an error payload."""
+    return json.dumps({"error": error, "message": message}).encode()
+
+
+def create_server(host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """
+    Create a calculator server; port 0 picks a free port.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+
+    Returns:
+        Server, not yet serving
+    """
+    server = ThreadingHTTPServer((host, port), CalculatorRequestHandler)
+    server.daemon_threads = True
+    return server
+
+
+def start_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> tuple[ThreadingHTTPServer, str]:
+    """
+    Start a calculator server on a background thread.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind; 0 picks a free port
+
+    Returns:
+        The running server (stop it with ``shutdown()``) and its base URL
+    """
+    server = create_server(host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    bound_host, bound_port = server.server_address[:2]
+    return server, f"http://{bound_host}:{bound_port}"
+
+
+def main() -> None:
+    """Serve until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve Calculator over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    with create_server(args.host, args.port) as server:
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Sorted sample index for repeated quantile and rank queries.
+
+This module provides a SortedSample class that sorts a dataset once into a
+compact ``array('d')`` buffer and then answers quantile, rank and count
+queries without re-sorting. Values can be inserted and removed incrementally;
+each update shifts the buffer in place instead of sorting it again.
+"""
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from src.example_calculator import InvalidOperationError, Number
+from src.kernels import quantile_sorted
+
+
+class SortedSample:
+    """
+    An ordered, typed-array backed sample of numbers.
+
+    Quantile lookups are O(1) and rank/count queries are O(log n). Inserts and
+    removals locate their position in O(log n) and shift the buffer with a
+    single memmove. NaN values are rejected because they have no order.
+    """
+
+    def __init__(self, values: Iterable[Number] = ()):
+        """
+        Build the index from an iterable of numbers.
+
+        Args:
+            values: Numbers to index
+
+        Raises:
+            TypeError: If values contain non-numbers
+            ValueError: If values contain NaN
+        """
+        buffer = array("d", values)
+        if any(map(math.isnan, buffer)):
+            raise ValueError("NaN values cannot be ordered")
+        self._values = array("d", sorted(buffer))
+
+    def __len__(self) -> int:
+        """Return the number of values in the sample."""
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the values in ascending order."""
+        return iter(self._values)
+
+    def __getitem__(self, index: int) -> float:
+        """Return the value at the given position in ascending order."""
+        return self._values[index]
+
+    def insert(self, value: Number) -> None:
+        """
+        Insert a value, keeping the sample sorted.
+
+        Args:
+            value: Value to insert
+
+        Raises:
+            TypeError: If value is not a number
+            ValueError: If value is NaN
+        """
+        self._validate_number(value)
+        if math.isnan(value):
+            raise ValueError("NaN values cannot be ordered")
+        insort(self._values, value)
+
+    def remove(self, value: Number) -> None:
+        """
+        Remove one occurrence of a value.
+
+        Args:
+            value: Value to remove
+
+        Raises:
+            TypeError: If value is not a number
+            InvalidOperationError: If value is not in the sample
+        """
+        self._validate_number(value)
+        index = bisect_left(self._values, value)
+        if index == len(self._values) or self._values[index] != value:
+            raise InvalidOperationError(f"Value not in sample: {value}")
+        del self._values[index]
+
+    def quantile(self, q: float) -> float:
+        """
+        Calculate a quantile with linear interpolation between closest ranks.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Value at quantile q
+
+        Raises:
+            InvalidOperationError: If sample is empty or q is out of range
+        """
+        if not self._values:
+            raise InvalidOperationError("Cannot calculate quantile of empty sample")
+        if not 0 <= q <= 1:
+            raise InvalidOperationError("Quantile must be between 0 and 1")
+        return quantile_sorted(self._values, q)
+
+    def percentile(self, p: float) -> float:
+        """
+        Calculate a percentile.
+
+        Args:
+            p: Percentile between 0 and 100
+
+        Returns:
+            Value at percentile p
+
+        Raises:
+            InvalidOperationError: If sample is empty or p is out of range
+        """
+        return self.quantile(p / 100)
+
+    def median(self) -> float:
+        """
+        Calculate the median, matching Calculator.median.
+
+        Returns:
+            Median value
+
+        Raises:
+            InvalidOperationError: If sample is empty
+        """
+        return self.quantile(0.5)
+
+    def count_below(self, value: Number) -> int:
+        """
+        Count values strictly less than value.
+
+        Args:
+            value: Upper bound (exclusive)
+
+        Returns:
+            Number of values below value
+        """
+        return bisect_left(self._values, value)
+
+    def count_between(self, low: Number, high: Number) -> int:
+        """
+        Count values in the closed interval [low, high].
+
+        Args:
+            low: Lower bound (inclusive)
+            high: Upper bound (inclusive)
+
+        Returns:
+            Number of values between low and high
+        """
+        if high < low:
+            return 0
+        return bisect_right(self._values, high) - bisect_left(self._values, low)
+
+    def rank(self, value: Number) -> float:
+        """
+        Calculate the fraction of values less than or equal to value.
+
+        Args:
+            value: Value to rank
+
+        Returns:
+            Percentile rank between 0 and 1
+
+        Raises:
+            InvalidOperationError: If sample is empty
+        """
+        if not self._values:
+            raise InvalidOperationError("Cannot calculate rank in empty sample")
+        return bisect_right(self._values, value) / len(self._values)
+
+    def _validate_number(self, value: Any) -> None:
+        """
+        Validate that a value is a number.
+
+        Args:
+            value: Value to validate
+
+        Raises:
+            TypeError: If value is not a number
+        """
+        if not isinstance(value, int | float):
+            raise TypeError(f"Expected number, got {type(value).__name__}")
@@ -0,0 +1,118 @@
+"""
+Allocation-regression tests for Calculator hot paths.
+
+Each operation is run at a fixed input size under ``tracemalloc``. The peak
+bytes allocated during the call and the net bytes still held afterwards are
+compared against the budgets stored in ``allocation_budgets.json``; a test
+fails when an operation allocates more than its budget.
+
+After an intentional change, regenerate the budgets with
+``UPDATE_ALLOCATION_BUDGETS=1 python -m pytest tests/test_allocations.py``.
+"""
+
+import json
+import os
+import random
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.example_calculator import Calculator
+
+
+BUDGETS_PATH = Path(__file__).with_name("allocation_budgets.json")
+UPDATE = os.environ.get("UPDATE_ALLOCATION_BUDGETS") == "1"
+
+SIZE = 10_000
+# Budgets allow this much growth over the recorded measurement
+HEADROOM = 1.25
+SLACK_BYTES = 1024
+
+_rng = random.Random(0)
+FLOATS = [_rng.uniform(-1000, 1000) for _ in range(SIZE)]
+SMALL_INTS = [_rng.randrange(100) for _ in range(SIZE)]
+
+CASES: dict[str, tuple[str, tuple[Any, ...]]] = {
+    "add": ("add", (1.5, 2)),
+    "multiply": ("multiply", (3, 4.5)),
+    "divide": ("divide", (10, 4)),
+    "power": ("power", (2, 10)),
+    "sqrt": ("sqrt", (2,)),
+    "factorial_1000": ("factorial", (1000,)),
+    "memory_add": ("memory_add", (5,)),
+    "chain_add": ("chain_add", (5,)),
+    "mean_floats": ("mean", (FLOATS,)),
+    "median_floats": ("median", (FLOATS,)),
+    "median_small_ints": ("median", (SMALL_INTS,)),
+    "mode_floats": ("mode", (FLOATS,)),
+    "mode_small_ints": ("mode", (SMALL_INTS,)),
+    "describe_floats": ("describe", (FLOATS,)),
+}
+
+
+def measure(func: Callable[..., Any], *args: Any) -> dict[str, int]:
+    """Return peak and net bytes allocated by one call."""
+    func(*args)  # warm up caches so they are not charged to the call
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func(*args)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"peak": peak - before, "net": after - before}
+
+
+def load_budgets() -> dict[str, dict[str, int]]:
+    """Load stored budgets."""
+    return json.loads(BUDGETS_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def budgets() -> dict[str, dict[str, int]]:
+    """Provide stored budgets, rewriting them first when updating."""
+    if UPDATE:
+        measured: dict[str, dict[str, int]] = {}
+        for name, (method, args) in CASES.items():
+            calc = Calculator().chain(1)
+            usage = measure(getattr(calc, method), *args)
+            measured[name] = {
+                key: int(value * HEADROOM) + SLACK_BYTES for key, value in usage.items()
+            }
+        BUDGETS_PATH.write_text(
+            json.dumps(measured, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+    return load_budgets()
+
+
+class TestAllocationBudgets:
+    """Test each hot path stays within its allocation budget."""
+
+    def test_every_case_has_a_budget(self, budgets: dict[str, dict[str, int]]):
+        """Test budgets cover exactly the measured cases."""
+        assert set(budgets) == set(CASES)
+
+    @pytest.mark.parametrize("name", list(CASES))
+    def test_allocations_within_budget(
+        self,
+        name: str,
+        budgets: dict[str, dict[str, int]],
+    ):
+        """Test peak and net allocations do not exceed the budget."""
+        method, args = CASES[name]
+        calc = Calculator().chain(1)
+        usage = measure(getattr(calc, method), *args)
+        budget = budgets[name]
+        assert usage["peak"] <= budget["peak"], (
+            f"{name} peak allocation {usage['peak']} B exceeds budget "
+            f"{budget['peak']} B"
+        )
+        assert usage["net"] <= budget["net"], (
+            f"{name} net allocation {usage['net']} B exceeds budget {budget['net']} B"
+        )
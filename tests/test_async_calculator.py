@@ -0,0 +1,144 @@
+"""
+Test cases for the asyncio Calculator front end.
+"""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from src.async_calculator import AsyncCalculator
+from src.example_calculator import (
+    BudgetExceededError,
+    Calculator,
+    DivisionByZeroError,
+    InvalidOperationError,
+)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool that counts submitted calls."""
+
+    def __init__(self):
+        """Initialize with a single worker."""
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        """Count and submit a call."""
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class TestAsyncCalculator:
+    """Test awaitable operations and offloading."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.executor = CountingExecutor()
+        self.calc = AsyncCalculator(
+            executor=self.executor,
+            factorial_threshold=100,
+            list_threshold=10,
+        )
+
+    def teardown_method(self):
+        """Shut down the executor."""
+        self.executor.shutdown()
+
+    def test_cheap_operations_run_inline(self):
+        """Test cheap operations do not use the executor."""
+
+        async def scenario() -> list[Any]:
+            return [
+                await self.calc.add(2, 3),
+                await self.calc.factorial(5),
+                await self.calc.median([3, 1, 2]),
+                await self.calc.power(2, 10),
+            ]
+
+        assert asyncio.run(scenario()) == [5, 120, 2, 1024]
+        assert self.executor.submitted == 0
+
+    def test_expensive_operations_are_offloaded(self):
+        """Test operations above the thresholds use the executor."""
+        numbers = list(range(11))
+
+        async def scenario() -> list[Any]:
+            return [
+                await self.calc.factorial(101),
+                await self.calc.mean(numbers),
+                await self.calc.describe(numbers),
+                await self.calc.group_stats([0] * 11, numbers),
+            ]
+
+        factorial, mean, description, groups = asyncio.run(scenario())
+        assert factorial % 10**20 == 0
+        assert mean == 5
+        assert description["median"] == 5
+        assert groups[0]["mode"] == 0
+        assert self.executor.submitted == 4
+
+    def test_negative_powers_run_inline(self):
+        """Test integer powers with negative exponents are not offloaded."""
+        calc = AsyncCalculator(executor=self.executor, power_bits_threshold=64)
+        assert asyncio.run(calc.power(2, -1000)) == 2.0**-1000
+        assert self.executor.submitted == 0
+        asyncio.run(calc.power(2, 1000))
+        assert self.executor.submitted == 1
+
+    def test_memory_and_chain(self):
+        """Test memory and chain state live on the wrapped calculator."""
+
+        async def scenario() -> tuple[float, float]:
+            await self.calc.memory_store(10)
+            await self.calc.memory_add(5)
+            chain = await self.calc.chain(2)
+            await (await chain.chain_power(3)).chain_add(1)
+            return await self.calc.memory_recall(), await self.calc.get_result()
+
+        assert asyncio.run(scenario()) == (15, 9)
+        assert self.calc.calculator.memory == 15
+
+    def test_errors_propagate(self):
+        """Test inline and offloaded errors reach the caller."""
+        with pytest.raises(DivisionByZeroError):
+            asyncio.run(self.calc.divide(1, 0))
+        with pytest.raises(InvalidOperationError):
+            asyncio.run(self.calc.factorial(1000.5))
+        with pytest.raises(TypeError, match="Expected number, got str"):
+            asyncio.run(self.calc.factorial("5"))  # type: ignore[arg-type]
+        assert self.executor.submitted == 1
+
+    def test_budget(self):
+        """Test budgets are enforced inline and before offloading."""
+        assert asyncio.run(self.calc.factorial(5, budget=1.0)) == 120
+        assert asyncio.run(self.calc.mean(list(range(11)), budget=1.0)) == 5
+        assert self.executor.submitted == 1
+        with pytest.raises(BudgetExceededError):
+            asyncio.run(self.calc.factorial(10**400, budget=1.0))
+        with pytest.raises(BudgetExceededError):
+            asyncio.run(self.calc.power(3, 10**9, budget=0.01))
+        with pytest.raises(BudgetExceededError):
+            asyncio.run(self.calc.describe(list(range(11)), budget=0.0))
+        assert self.executor.submitted == 1
+
+    def test_process_pool(self):
+        """Test offloading to a process pool."""
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            calc = AsyncCalculator(executor=executor, list_threshold=2)
+            assert asyncio.run(calc.median([5, 1, 3, 2])) == 2.5
+
+    def test_process_pool_keeps_settings(self):
+        """Test offloaded operations use the wrapped calculator's settings."""
+        # Neumaier compensation rounds this sum differently from fsum
+        values = [1e16, 1.0, 1e-16]
+        exact = Calculator(summation="exact")
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            calc = AsyncCalculator(exact, executor=executor, list_threshold=2)
+            assert asyncio.run(calc.mean(values)) == exact.mean(values)
+        assert exact.mean(values) != Calculator().mean(values)
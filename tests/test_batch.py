@@ -0,0 +1,201 @@
+"""
+Test cases for batch operations with error policies.
+"""
+
+import math
+import random
+import statistics
+
+import pytest
+
+from src import parallel
+from src.batch import (
+    ErrorCode,
+    ErrorPolicy,
+    divide,
+    factorial,
+    mean,
+    median,
+    mode,
+    sqrt,
+)
+from src.example_calculator import DivisionByZeroError, InvalidOperationError
+
+
+class TestBatchElementWise:
+    """Test element-wise batch operations."""
+
+    def test_divide_valid_input(self):
+        """Test dividing valid input records no errors."""
+        result = divide([10, 9, 1], [2, 3, 4])
+        assert list(result.values) == [5, 3, 0.25]
+        assert len(result.errors) == 0
+        assert result.mask is None
+
+    def test_divide_raise_policy(self):
+        """Test the raise policy raises the usual error with its index."""
+        with pytest.raises(DivisionByZeroError) as exc_info:
+            divide([1, 2, 3], [1, 0, 1])
+        assert "index 1" in str(exc_info.value)
+
+    def test_divide_nan_policy(self):
+        """Test the nan policy fills failed positions with NaN."""
+        result = divide([1, 2, "x"], [1, 0, 1], policy="nan")
+        assert result.values[0] == 1
+        assert math.isnan(result.values[1])
+        assert math.isnan(result.values[2])
+        assert list(result.errors) == [
+            (1, ErrorCode.DIVISION_BY_ZERO),
+            (2, ErrorCode.INVALID_TYPE),
+        ]
+
+    def test_divide_skip_policy(self):
+        """Test the skip policy leaves failed elements out."""
+        result = divide([1, 2, 6], [1, 0, 3], policy=ErrorPolicy.SKIP)
+        assert list(result.values) == [1, 2]
+        assert list(result.errors.indices) == [1]
+
+    def test_sqrt_mask_policy(self):
+        """Test the mask policy marks failed positions."""
+        result = sqrt([4, -1, 9], policy="mask")
+        assert result.mask == bytearray([0, 1, 0])
+        assert result.values[2] == 3
+        assert list(result.errors) == [(1, ErrorCode.NEGATIVE_SQRT)]
+
+    def test_sqrt_mask_policy_valid_input(self):
+        """Test the mask policy returns an all-clear mask for valid input."""
+        result = sqrt([0, 1], policy="mask")
+        assert result.mask == bytearray(2)
+
+    def test_factorial_policies(self):
+        """Test factorial errors for negative and non-integer elements."""
+        result = factorial([5, -1, 2.5, 3.0], policy="skip")
+        assert result.values == [120, 6]
+        assert list(result.errors) == [
+            (1, ErrorCode.NEGATIVE_FACTORIAL),
+            (2, ErrorCode.NON_INTEGER_FACTORIAL),
+        ]
+        with pytest.raises(InvalidOperationError):
+            factorial([-1])
+
+    def test_length_mismatch(self):
+        """Test mismatched lengths raise error."""
+        with pytest.raises(InvalidOperationError):
+            divide([1], [1, 2])
+
+    def test_unknown_policy(self):
+        """Test an unknown policy raises ValueError."""
+        with pytest.raises(ValueError, match="ignore"):
+            sqrt([1], policy="ignore")
+
+
+class TestBatchStatistics:
+    """Test statistics under error policies."""
+
+    def test_valid_input(self):
+        """Test statistics of valid input."""
+        assert mean([1, 2, 3]).value == 2
+        assert median([3, 1, 2, 4]).value == 2.5
+        assert mode([1, 2, 2]).value == 2
+
+    def test_raise_policy(self):
+        """Test the raise policy raises on bad elements."""
+        with pytest.raises(TypeError):
+            mean([1, "2"])
+        with pytest.raises(InvalidOperationError):
+            median([1, math.nan])
+        with pytest.raises(InvalidOperationError):
+            mode([])
+
+    def test_skip_policy(self):
+        """Test the skip policy ignores bad elements."""
+        result = mean([1, None, 3, math.nan], policy="skip")
+        assert result.value == 2
+        assert list(result.errors) == [
+            (1, ErrorCode.INVALID_TYPE),
+            (3, ErrorCode.NAN_VALUE),
+        ]
+
+    def test_nan_policy(self):
+        """Test the nan policy returns NaN when any element is bad."""
+        assert math.isnan(median([1, "x", 3], policy="nan").value)
+        assert median([1, 3], policy="nan").value == 2
+
+    def test_mask_policy(self):
+        """Test the mask policy computes on valid elements with a mask."""
+        result = mode([1, "x", 1, 2], policy="mask")
+        assert result.value == 1
+        assert result.mask == bytearray([0, 1, 0, 0])
+
+    def test_no_valid_elements(self):
+        """Test NaN is returned when nothing is valid and not raising."""
+        assert math.isnan(mean(["a", "b"], policy="skip").value)
+
+
+class TestBatchChunked:
+    """Test chunked execution matches serial execution."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        rng = random.Random(0)
+        self.numbers = [
+            rng.choice([rng.randrange(20), rng.uniform(-5, 5)]) for _ in range(103)
+        ]
+        self.divisors = [rng.randrange(-2, 3) for _ in range(103)]
+        self.dirty = [*self.numbers]
+        for index in (4, 50, 97):
+            self.dirty[index] = "x"
+        self.dirty[60] = math.nan
+
+    @pytest.fixture(autouse=True)
+    def free_threaded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Split into small chunks on threads, as on a free-threaded build."""
+        monkeypatch.setattr(parallel, "gil_enabled", lambda: False)
+        monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 10)
+
+    @pytest.mark.parametrize("policy", ["nan", "skip", "mask"])
+    def test_element_wise_matches_serial(self, policy):
+        """Test chunked element-wise results, errors and masks match serial."""
+        cases = [
+            (divide, (self.numbers, self.divisors)),
+            (sqrt, (self.dirty,)),
+            (factorial, (self.dirty,)),
+        ]
+        for func, args in cases:
+            serial = func(*args, policy=policy)
+            chunked = func(*args, policy=policy, workers=4)
+            assert repr(list(chunked.values)) == repr(list(serial.values))
+            assert list(chunked.errors) == list(serial.errors)
+            assert chunked.mask == serial.mask
+
+    @pytest.mark.parametrize("policy", ["nan", "skip", "mask"])
+    def test_statistics_match_serial(self, policy):
+        """Test chunked statistics, errors and masks match serial."""
+        for func in (mean, median, mode):
+            serial = func(self.dirty, policy=policy)
+            chunked = func(self.dirty, policy=policy, workers=4)
+            if policy == "nan":
+                assert math.isnan(chunked.value)
+            else:
+                assert chunked.value == pytest.approx(serial.value)
+            assert list(chunked.errors) == list(serial.errors)
+            assert chunked.mask == serial.mask
+
+    def test_raise_reports_global_index(self):
+        """Test errors in later chunks report their input index."""
+        with pytest.raises(TypeError, match="index 50"):
+            sqrt([*range(50), "x", *range(50)], workers=4)
+        with pytest.raises(DivisionByZeroError, match="index 33"):
+            divide([1] * 60, [1] * 33 + [0] * 27, workers=4)
+
+    @pytest.mark.parametrize("size", [95, 96, 200])
+    def test_median_selection(self, size):
+        """Test the cross-chunk median matches statistics.median."""
+        rng = random.Random(size)
+        numbers = [rng.randrange(30) for _ in range(size)]
+        assert median(numbers, workers=7).value == statistics.median(numbers)
+
+    def test_mode_keeps_first_seen_tie(self):
+        """Test ties across chunks resolve to the first value seen."""
+        numbers = [7] + list(range(20, 60)) + [3] * 2 + [7] + list(range(60, 100))
+        assert mode(numbers, workers=4).value == 7
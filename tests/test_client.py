@@ -0,0 +1,219 @@
+"""
+Test cases for client module.
+"""
+
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future
+from typing import Any
+
+import pytest
+
+from src.client import CalculatorClient
+from src.example_calculator import (
+    CalculatorError,
+    DivisionByZeroError,
+    InvalidOperationError,
+)
+from src.server import CalculatorRequestHandler, start_server
+
+
+Requests = list[tuple[str, Any]]
+
+
+@pytest.fixture()
+def service(monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[str, Requests]]:
+    """
+    Start a stand-in server.
+
+    Yields its URL and a list recording the path and client address of
+    every request it receives.
+    """
+    seen: Requests = []
+    do_post = CalculatorRequestHandler.do_POST
+
+    def recording_do_post(handler: CalculatorRequestHandler) -> None:
+        seen.append((handler.path, handler.client_address))
+        do_post(handler)
+
+    monkeypatch.setattr(CalculatorRequestHandler, "do_POST", recording_do_post)
+    server, base_url = start_server()
+    yield base_url, seen
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def url(service: tuple[str, Requests]) -> str:
+    """Return the stand-in server's URL."""
+    return service[0]
+
+
+def submit_until_closed(calc: CalculatorClient, futures: list[Future[Any]]) -> None:
+    """Submit calls until the client rejects one as closed."""
+    while True:
+        try:
+            futures.append(calc.submit("add", 1, 1))
+        except InvalidOperationError:
+            return
+
+
+class TestCalculatorClient:
+    """Test the Calculator-like interface."""
+
+    def test_operations(self, url: str):
+        """Test methods return the service's results."""
+        with CalculatorClient(url) as calc:
+            assert calc.add(2, 3) == 5
+            assert calc.subtract(2, 3) == -1
+            assert calc.multiply(2, 3) == 6
+            assert calc.divide(3, 2) == 1.5
+            assert calc.power(2, 10) == 1024
+            assert calc.sqrt(16) == 4
+            assert calc.factorial(25) == 15511210043330985984000000
+            assert calc.mean([1, 2, 3, 4]) == 2.5
+            assert calc.median((3, 1, 2)) == 2
+            assert calc.mode([1, 2, 2]) == 2
+            assert calc.describe([1, 2, 3])["max"] == 3
+
+    def test_errors_map_to_calculator_exceptions(self, url: str):
+        """Test reported errors are raised as the matching exception."""
+        with CalculatorClient(url) as calc:
+            with pytest.raises(DivisionByZeroError):
+                calc.divide(1, 0)
+            with pytest.raises(InvalidOperationError, match="empty"):
+                calc.mean([])
+            with pytest.raises(TypeError, match="Expected number"):
+                calc.add("a", 1)  # type: ignore[arg-type]
+            with pytest.raises(InvalidOperationError, match="Unknown operation"):
+                calc.call("memory_clear")
+            with pytest.raises(CalculatorError):
+                calc.sqrt(-1)
+
+    def test_connections_are_reused(self, service: tuple[str, Requests]):
+        """Test sequential calls share a pooled keep-alive connection."""
+        url, requests = service
+        with CalculatorClient(url, connections=2) as calc:
+            for i in range(20):
+                assert calc.add(i, 1) == i + 1
+        assert len(requests) == 20
+        assert len({address for _, address in requests}) <= 2
+
+    def test_unreachable_service(self, url: str):
+        """Test connection failures surface as OSError subclasses."""
+        with CalculatorClient(url) as calc:
+            assert calc.add(1, 1) == 2
+        closed_server, closed_url = start_server()
+        closed_server.shutdown()
+        closed_server.server_close()
+        with (
+            CalculatorClient(closed_url) as calc,
+            pytest.raises(ConnectionError),
+        ):
+            calc.add(1, 1)
+
+    def test_invalid_arguments(self, url: str):
+        """Test non-positive pool settings are rejected."""
+        with pytest.raises(InvalidOperationError):
+            CalculatorClient(url, connections=0)
+        with pytest.raises(InvalidOperationError):
+            CalculatorClient(url, max_batch=0)
+
+    def test_closed_client(self, url: str):
+        """Test a closed client finishes queued calls and rejects new ones."""
+        calc = CalculatorClient(url)
+        future = calc.submit("add", 1, 2)
+        calc.close()
+        calc.close()
+        assert future.result() == 3
+        with pytest.raises(InvalidOperationError, match="closed"):
+            calc.submit("add", 1, 2)
+
+    def test_close_races_submit(self, url: str):
+        """Test every call accepted while closing still resolves."""
+        for _ in range(20):
+            calc = CalculatorClient(url, connections=2)
+            futures: list[Future[Any]] = []
+            submitter = threading.Thread(
+                target=submit_until_closed,
+                args=(calc, futures),
+            )
+            submitter.start()
+            calc.close()
+            submitter.join()
+            assert all(future.result(timeout=5) == 2 for future in futures)
+
+
+class TestBatching:
+    """Test automatic batching and pipelining."""
+
+    def test_map_batches_queued_calls(self, service: tuple[str, Requests]):
+        """Test many queued calls travel in few batch requests."""
+        url, requests = service
+        with CalculatorClient(url, connections=1, max_batch=100) as calc:
+            results = calc.map("multiply", [(i, 2) for i in range(1_000)])
+        assert results == [i * 2 for i in range(1_000)]
+        assert ("/batch", requests[-1][1]) in requests
+        assert len(requests) < 100
+
+    def test_pipelined_batches(self, url: str):
+        """Test several batch requests in flight on one connection."""
+        with CalculatorClient(
+            url,
+            connections=1,
+            max_batch=7,
+            pipeline_depth=5,
+        ) as calc:
+            futures = [calc.submit("add", i, i) for i in range(500)]
+            assert [future.result() for future in futures] == [
+                2 * i for i in range(500)
+            ]
+
+    def test_errors_inside_a_batch(self, url: str):
+        """Test one failing call does not fail the rest of its batch."""
+        with CalculatorClient(url, connections=1) as calc:
+            futures = [calc.submit("divide", 6, d) for d in (1, 0, 2, 0, 3)]
+            results = [future.exception() or future.result() for future in futures]
+        assert results[0::2] == [6, 3, 2]
+        assert all(isinstance(error, DivisionByZeroError) for error in results[1::2])
+
+    def test_arithmetic_error_inside_a_batch(self, url: str):
+        """Test an overflowing call fails alone, keeping the connection."""
+        with CalculatorClient(url, connections=1) as calc:
+            futures = [
+                calc.submit("power", *args) for args in ((2, 3), (10.0, 400), (3, 2))
+            ]
+            assert isinstance(futures[1].exception(), OverflowError)
+            assert [futures[0].result(), futures[2].result()] == [8, 9]
+            assert calc.add(1, 1) == 2
+
+    def test_unencodable_arguments(self, url: str):
+        """Test a call that cannot be encoded fails alone."""
+        with CalculatorClient(url, connections=1) as calc:
+            futures = [
+                calc.submit("add", *args) for args in ((1, 2), (1 + 2j, 1), (3, 4))
+            ]
+            with pytest.raises(TypeError, match="not JSON serializable"):
+                futures[1].result(timeout=5)
+            assert [futures[0].result(timeout=5), futures[2].result(timeout=5)] == [
+                3,
+                7,
+            ]
+            assert calc.submit("add", 1, 1).result(timeout=5) == 2
+
+    def test_unencodable_result_inside_a_batch(self, url: str):
+        """Test a result the service cannot encode fails alone."""
+        with CalculatorClient(url, connections=1) as calc:
+            futures = [calc.submit("add", i, 1) for i in range(5)]
+            futures.append(calc.submit("factorial", 2000))
+            futures += [calc.submit("add", i, 2) for i in range(5)]
+            with pytest.raises(ValueError, match="digits"):
+                futures[5].result(timeout=5)
+            results = [future.result(timeout=5) for future in futures[:5]]
+            results += [future.result(timeout=5) for future in futures[6:]]
+        assert results == [i + 1 for i in range(5)] + [i + 2 for i in range(5)]
+
+    def test_map_raises_first_error(self, url: str):
+        """Test map raises the first failing call's error."""
+        with CalculatorClient(url) as calc, pytest.raises(DivisionByZeroError):
+            calc.map("divide", [(1, 1), (1, 0), (1, 2)])
@@ -0,0 +1,201 @@
+"""
+Test cases for columnar module.
+"""
+
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+from src.columnar import (
+    HISTOGRAM_BINS,
+    MAGIC,
+    ChunkSummary,
+    ColumnReader,
+    ColumnWriter,
+    write_column,
+)
+from src.example_calculator import Calculator, InvalidOperationError
+
+
+class TestColumnWriter:
+    """Test writing column files."""
+
+    def test_round_trip(self, tmp_path: Path):
+        """Test values read back in order across chunk boundaries."""
+        path = tmp_path / "values.col"
+        values = [float(i) * 1.5 for i in range(25)]
+        with ColumnWriter(path, chunk_size=10) as writer:
+            writer.extend(values[:7])
+            writer.append(values[7])
+            writer.extend(values[8:])
+
+        with ColumnReader(path) as reader:
+            assert reader.chunk_size == 10
+            assert [chunk.count for chunk in reader.chunks] == [10, 10, 5]
+            assert list(reader) == values
+            assert len(reader) == 25
+
+    def test_empty_column(self, tmp_path: Path):
+        """Test an empty column has no chunks."""
+        path = tmp_path / "empty.col"
+        write_column(path, [])
+        with ColumnReader(path) as reader:
+            assert len(reader) == 0
+            assert reader.sum() == 0
+            with pytest.raises(InvalidOperationError):
+                reader.mean()
+
+    def test_rejects_nan(self, tmp_path: Path):
+        """Test NaN cannot be stored since it breaks min/max summaries."""
+        with (
+            ColumnWriter(tmp_path / "nan.col") as writer,
+            pytest.raises(InvalidOperationError),
+        ):
+            writer.extend([1.0, float("nan")])
+
+    def test_rejects_non_numbers(self, tmp_path: Path):
+        """Test non-numeric values raise TypeError."""
+        with (
+            ColumnWriter(tmp_path / "bad.col") as writer,
+            pytest.raises(TypeError),
+        ):
+            writer.extend([1, "2"])
+
+    def test_invalid_chunk_size(self, tmp_path: Path):
+        """Test chunk size must be positive."""
+        with pytest.raises(InvalidOperationError):
+            ColumnWriter(tmp_path / "values.col", chunk_size=0)
+
+    def test_write_after_close(self, tmp_path: Path):
+        """Test a closed writer rejects values."""
+        writer = ColumnWriter(tmp_path / "values.col")
+        writer.close()
+        with pytest.raises(InvalidOperationError):
+            writer.append(1)
+
+
+class TestChunkSummary:
+    """Test per-chunk zone maps."""
+
+    def test_summary_fields(self):
+        """Test count, sum, min, max and histogram of a chunk."""
+        summary = ChunkSummary.of([0.0, 1.0, 2.0, 16.0], 8)
+        assert summary.count == 4
+        assert summary.total == 19.0
+        assert (summary.minimum, summary.maximum) == (0.0, 16.0)
+        assert len(summary.histogram) == HISTOGRAM_BINS
+        assert sum(summary.histogram) == 4
+        assert summary.histogram[0] == 1
+        assert summary.histogram[-1] == 1
+
+    def test_constant_chunk(self):
+        """Test a chunk of identical values falls in the first bin."""
+        summary = ChunkSummary.of([3.0] * 5, 8)
+        assert summary.histogram[0] == 5
+        assert summary.may_contain(3, 3)
+        assert not summary.may_contain(4, 5)
+
+    def test_histogram_prunes_gaps(self):
+        """Test a range inside an empty stretch of the chunk is skipped."""
+        summary = ChunkSummary.of([0.0, 1.0, 99.0, 100.0], 8)
+        assert not summary.may_contain(40, 60)
+        assert summary.may_contain(40, 99)
+        assert summary.may_contain(100, 200)
+        assert not summary.may_contain(101, 200)
+
+    def test_infinite_values(self):
+        """Test chunks holding infinities are summarized without binning."""
+        summary = ChunkSummary.of([1.0, math.inf, 2.0], 8)
+        assert (summary.minimum, summary.maximum) == (1.0, math.inf)
+        assert summary.histogram[0] == 3
+        assert summary.may_contain(1.5, 1.7)
+        assert summary.may_contain(10**400, 10**400)
+        assert not summary.may_contain(-5, 0)
+
+    def test_overflowing_range(self):
+        """Test finite values whose range overflows are binned at half scale."""
+        summary = ChunkSummary.of([-1e308, 0.0, 1e308], 8)
+        assert summary.histogram[0] == 1
+        assert summary.histogram[HISTOGRAM_BINS // 2] == 1
+        assert summary.histogram[-1] == 1
+        assert not summary.may_contain(2e307, 5e307)
+        assert summary.may_contain(-1.0, 1.0)
+
+
+class TestColumnReader:
+    """Test queries over column files."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        rng = random.Random(0)
+        self.values = sorted(rng.uniform(0, 1000) for _ in range(1_000))
+        self.calc = Calculator()
+
+    def write(self, path: Path, values: list[float]) -> ColumnReader:
+        """Write values with small chunks and open a reader."""
+        write_column(path, values, chunk_size=100)
+        return ColumnReader(path)
+
+    def test_aggregates_from_summaries(self, tmp_path: Path):
+        """Test count/sum/mean/min/max without reading any chunk."""
+        with self.write(tmp_path / "v.col", self.values) as reader:
+            assert len(reader) == 1_000
+            assert reader.sum() == pytest.approx(sum(self.values))
+            assert reader.mean() == pytest.approx(self.calc.mean(self.values))
+            assert reader.min() == min(self.values)
+            assert reader.max() == max(self.values)
+            assert reader.chunks_read == 0
+
+    def test_mode_scans_chunks(self, tmp_path: Path):
+        """Test mode matches Calculator.mode, including first-seen ties."""
+        values = [5.0, 1.0, 1.0, 2.0] * 30 + [5.0] * 30
+        with self.write(tmp_path / "v.col", values) as reader:
+            assert reader.mode() == self.calc.mode(values) == 5.0
+            assert reader.chunks_read == len(reader.chunks)
+
+    def test_range_query_skips_chunks(self, tmp_path: Path):
+        """Test sorted data only reads the chunks at the range edges."""
+        low, high = 250.0, 400.0
+        expected = [v for v in self.values if low <= v <= high]
+        with self.write(tmp_path / "v.col", self.values) as reader:
+            assert reader.count_between(low, high) == len(expected)
+            assert reader.chunks_read <= 2
+            assert list(reader.values_between(low, high)) == expected
+
+    def test_range_query_unsorted(self, tmp_path: Path):
+        """Test range queries are exact on unsorted data."""
+        values = random.Random(1).sample(self.values, len(self.values))
+        with self.write(tmp_path / "v.col", values) as reader:
+            expected = [v for v in values if 100 <= v <= 120]
+            assert reader.count_between(100, 120) == len(expected)
+            assert list(reader.values_between(100, 120)) == expected
+            assert reader.count_between(2_000, 3_000) == 0
+            assert reader.count_between(5, 1) == 0
+
+    def test_extreme_values_round_trip(self, tmp_path: Path):
+        """Test infinities and huge finite values are stored and queried."""
+        values = [-1e308, 1e308, 5.0, -math.inf, math.inf, 7.0]
+        with self.write(tmp_path / "v.col", values) as reader:
+            assert (reader.min(), reader.max()) == (-math.inf, math.inf)
+            assert reader.count_between(0, 10) == 2
+            assert list(reader.values_between(1e300, math.inf)) == [1e308, math.inf]
+
+    def test_rejects_foreign_file(self, tmp_path: Path):
+        """Test files without the column header are rejected."""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a column file at all, really")
+        with pytest.raises(InvalidOperationError):
+            ColumnReader(path)
+
+    def test_rejects_truncated_file(self, tmp_path: Path):
+        """Test a file missing its trailer is rejected."""
+        path = tmp_path / "v.col"
+        write_column(path, self.values)
+        path.write_bytes(path.read_bytes()[:-4])
+        with pytest.raises(InvalidOperationError):
+            ColumnReader(path)
+        path.write_bytes(MAGIC)
+        with pytest.raises(InvalidOperationError):
+            ColumnReader(path)
@@ -0,0 +1,102 @@
+"""
+Test cases for combinatorics module.
+"""
+
+import math
+
+import pytest
+
+from src.combinatorics import (
+    ModularCombinatorics,
+    combinations,
+    multinomial,
+    permutations,
+)
+from src.example_calculator import InvalidOperationError
+
+
+MOD = 1_000_000_007
+
+
+class TestExactCombinatorics:
+    """Test exact counting functions."""
+
+    def test_combinations(self):
+        """Test binomial coefficients."""
+        assert combinations(5, 2) == 10
+        assert combinations(10, 0) == 1
+        assert combinations(3, 5) == 0
+        assert combinations(6.0, 3) == 20
+
+    def test_permutations(self):
+        """Test permutation counts."""
+        assert permutations(5, 2) == 20
+        assert permutations(4, 4) == 24
+        assert permutations(3, 5) == 0
+
+    def test_multinomial(self):
+        """Test multinomial coefficients."""
+        assert multinomial(2, 1, 1) == 12
+        assert multinomial(3) == 1
+        assert multinomial() == 1
+
+    @pytest.mark.parametrize(("n", "k"), [(-1, 2), (5, -1), (5.5, 2)])
+    def test_invalid_counts(self, n: float, k: float):
+        """Test negative or non-integer counts raise error."""
+        with pytest.raises(InvalidOperationError):
+            combinations(n, k)  # type: ignore
+
+    def test_invalid_type(self):
+        """Test non-numbers raise TypeError."""
+        with pytest.raises(TypeError):
+            permutations("5", 2)  # type: ignore
+
+
+class TestModularCombinatorics:
+    """Test table-backed modular combinatorics."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mod = ModularCombinatorics(MOD, 1000)
+
+    def test_matches_exact_values(self):
+        """Test modular results agree with exact results."""
+        for n, k in [(0, 0), (10, 3), (1000, 500), (999, 1)]:
+            assert self.mod.combinations(n, k) == math.comb(n, k) % MOD
+            assert self.mod.permutations(n, k) == math.perm(n, k) % MOD
+        assert self.mod.factorial(1000) == math.factorial(1000) % MOD
+        assert self.mod.multinomial(300, 200, 100) == multinomial(300, 200, 100) % MOD
+
+    def test_k_greater_than_n(self):
+        """Test k > n gives 0."""
+        assert self.mod.combinations(3, 4) == 0
+        assert self.mod.permutations(3, 4) == 0
+
+    def test_combinations_many(self):
+        """Test batched queries agree with single queries."""
+        ns = [10, 20, 5, 1000]
+        ks = [3, 20, 7, 250]
+        result = self.mod.combinations_many(ns, ks)
+        assert list(result) == [
+            self.mod.combinations(n, k) for n, k in zip(ns, ks, strict=True)
+        ]
+
+    def test_combinations_many_validation(self):
+        """Test batched queries reject bad input up front."""
+        with pytest.raises(InvalidOperationError):
+            self.mod.combinations_many([1001], [1])
+        with pytest.raises(InvalidOperationError):
+            self.mod.combinations_many([-1], [0])
+        with pytest.raises(TypeError):
+            self.mod.combinations_many([1.5], [0])  # type: ignore
+
+    def test_n_above_table(self):
+        """Test queries beyond max_n raise error."""
+        with pytest.raises(InvalidOperationError):
+            self.mod.combinations(1001, 1)
+
+    def test_non_invertible_modulus(self):
+        """Test a modulus sharing factors with the table raises error."""
+        with pytest.raises(InvalidOperationError):
+            ModularCombinatorics(12, 5)
+        assert ModularCombinatorics(7, 6).combinations(6, 3) == 20 % 7
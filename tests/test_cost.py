@@ -0,0 +1,72 @@
+"""
+Test cases for cost module.
+"""
+
+import math
+
+import pytest
+
+from src.cost import DEFAULT_SECONDS_PER_UNIT, CostModel
+from src.example_calculator import Calculator
+
+
+class TestCostModel:
+    """Test run time estimates."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.model = CostModel()
+
+    def test_defaults(self):
+        """Test the model starts from the default coefficients."""
+        assert self.model.seconds_per_unit == DEFAULT_SECONDS_PER_UNIT
+
+    def test_override(self):
+        """Test coefficients can be overridden per operation."""
+        model = CostModel({"factorial": 1.0})
+        assert model.seconds_per_unit["factorial"] == 1.0
+        assert model.seconds_per_unit["mean"] == DEFAULT_SECONDS_PER_UNIT["mean"]
+
+    def test_constant_operations(self):
+        """Test scalar arithmetic costs one unit regardless of arguments."""
+        assert self.model.units("add", 1, 2) == 1.0
+        assert self.model.units("add", 10**100, 2) == 1.0
+        assert self.model.units("unknown") == 1.0
+
+    def test_factorial_grows_superlinearly(self):
+        """Test factorial cost grows faster than n."""
+        small = self.model.estimate("factorial", 1_000)
+        large = self.model.estimate("factorial", 10_000)
+        assert large > 10 * small
+        assert self.model.units("factorial", 0) == 1.0
+
+    def test_power(self):
+        """Test only integer powers scale with the result size."""
+        assert self.model.units("power", 2.0, 1_000) == 1.0
+        assert self.model.units("power", 2, -5) == 1.0
+        assert self.model.units("power", 3, 1_000) > self.model.units("power", 3, 10)
+
+    def test_huge_arguments(self):
+        """Test work beyond the float range is estimated as infinite."""
+        assert self.model.units("factorial", 10**400) == math.inf
+        assert self.model.units("power", 2, 10**400) == math.inf
+        assert self.model.estimate("power", 3, 10**200) == math.inf
+
+    def test_list_operations(self):
+        """Test list statistics scale with list length."""
+        numbers = list(range(1_000))
+        assert self.model.units("mean", numbers) == 1_000
+        assert self.model.units("median", numbers) > 1_000
+        assert self.model.units("mean", []) == 1
+
+    def test_estimate_is_units_times_coefficient(self):
+        """Test estimates combine units and coefficients."""
+        model = CostModel({"mean": 2.0})
+        assert model.estimate("mean", [1, 2, 3]) == pytest.approx(6.0)
+
+    @pytest.mark.slow()
+    def test_calibrate(self):
+        """Test calibration replaces coefficients with positive measurements."""
+        model = CostModel({"factorial": 1.0}).calibrate(Calculator())
+        assert 0 < model.seconds_per_unit["factorial"] < 1.0
+        assert all(value > 0 for value in model.seconds_per_unit.values())
@@ -0,0 +1,149 @@
+"""
+Test cases for dataset module.
+"""
+
+import random
+import statistics
+from array import array
+
+import pytest
+
+from src import example_calculator
+from src.dataset import DTYPES, Dataset
+from src.example_calculator import Calculator, InvalidOperationError
+
+
+class TestDataset:
+    """Test typed storage."""
+
+    @pytest.mark.parametrize(
+        ("dtype", "itemsize"),
+        [("float64", 8), ("float32", 4), ("int32", 4), ("int16", 2)],
+    )
+    def test_itemsize(self, dtype, itemsize):
+        """Test each dtype stores values at its width."""
+        dataset = Dataset(range(100), dtype)
+        assert dataset.dtype == dtype
+        assert dataset.itemsize == itemsize
+        assert dataset.nbytes == 100 * itemsize
+        assert len(dataset) == 100
+
+    def test_sequence_protocol(self):
+        """Test len, iteration, indexing and slicing."""
+        dataset = Dataset([1.5, 2.5, 3.5])
+        assert list(dataset) == [1.5, 2.5, 3.5]
+        assert dataset[-1] == 3.5
+        assert dataset[:2] == array("d", [1.5, 2.5])
+        assert repr(dataset) == "Dataset(<3 values>, dtype='float64')"
+
+    def test_float32_rounds(self):
+        """Test float32 keeps about 7 significant digits."""
+        dataset = Dataset([0.1, 2**24 + 1], "float32")
+        assert dataset[0] != 0.1
+        assert dataset[0] == pytest.approx(0.1, rel=1e-7)
+        assert dataset[1] == 2**24
+
+    def test_extend_from_iterables(self):
+        """Test extending from generators and arrays of other typecodes."""
+        dataset = Dataset(dtype="float32")
+        dataset.extend(x / 2 for x in range(3))
+        dataset.extend(array("d", [5.0]))
+        dataset.append(6)
+        assert list(dataset) == [0.0, 0.5, 1.0, 5.0, 6.0]
+
+    def test_rejected_values_leave_no_partial_extend(self):
+        """Test a failed extend appends nothing."""
+        dataset = Dataset([1, 2], "int16")
+        with pytest.raises(TypeError, match="Expected number, got str"):
+            dataset.extend([3, "4"])
+        with pytest.raises(TypeError, match="int16 dataset stores integers"):
+            dataset.extend([3, 4.5])
+        with pytest.raises(OverflowError):
+            dataset.extend([3, 40_000])
+        assert list(dataset) == [1, 2]
+
+    def test_int32_range(self):
+        """Test int32 accepts its full range and rejects beyond it."""
+        dataset = Dataset([-(2**31), 2**31 - 1], "int32")
+        assert list(dataset) == [-(2**31), 2**31 - 1]
+        with pytest.raises(OverflowError):
+            dataset.append(2**31)
+
+    def test_from_array_shares_buffer(self):
+        """Test from_array wraps without copying."""
+        values = array("h", [1, 2, 3])
+        dataset = Dataset.from_array(values)
+        assert dataset.dtype == "int16"
+        assert dataset.values is values
+        with pytest.raises(ValueError, match="Unsupported"):
+            Dataset.from_array(array("b", [1]))
+
+    def test_unknown_dtype(self):
+        """Test unknown dtypes are rejected."""
+        with pytest.raises(ValueError, match="Unknown dtype"):
+            Dataset([1], "float16")
+        assert set(DTYPES) == {"float64", "float32", "int32", "int16"}
+
+
+class TestCalculatorWithDataset:
+    """Test Calculator statistics on Datasets and typed arrays."""
+
+    @pytest.mark.parametrize("dtype", list(DTYPES))
+    def test_statistics_match_lists(self, dtype):
+        """Test results equal those for the same values in a list."""
+        rng = random.Random(0)
+        values = [rng.randint(-1000, 1000) for _ in range(2_001)]
+        dataset = Dataset(values, dtype)
+        calc = Calculator()
+        assert calc.mean(dataset) == pytest.approx(calc.mean(values))
+        assert calc.median(dataset) == calc.median(values)
+        assert calc.mode(dataset) == calc.mode(values)
+        assert calc.describe(dataset) == pytest.approx(calc.describe(values))
+
+    def test_plain_arrays(self):
+        """Test typed arrays are accepted like Datasets."""
+        calc = Calculator()
+        assert calc.mean(array("f", [1.0, 2.0])) == 1.5  # type: ignore[arg-type]
+        assert calc.median(array("i", [3, 1, 2])) == 2  # type: ignore[arg-type]
+
+    def test_non_numeric_array(self):
+        """Test arrays of non-numeric typecodes are checked element by element."""
+        calc = Calculator()
+        with pytest.raises(TypeError):
+            calc.mode(array("u", "abca"))  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            calc.median(array("u", "cab"))  # type: ignore[arg-type]
+        assert calc.mode(array("B", [2, 1, 2])) == 2  # type: ignore[arg-type]
+
+    def test_empty_dataset(self):
+        """Test an empty Dataset is rejected like an empty list."""
+        with pytest.raises(InvalidOperationError):
+            Calculator().mean(Dataset())
+
+    @pytest.mark.parametrize("size", [999, 1_000, 1_001, 4_321])
+    def test_compact_median(self, monkeypatch, size):
+        """Test median of long typed data sorted in chunks."""
+        monkeypatch.setattr(example_calculator, "_COMPACT_SORT_CHUNK", 100)
+        rng = random.Random(size)
+        values = [rng.uniform(-1e6, 1e6) for _ in range(size)]
+        values[::7] = [5.0] * len(values[::7])
+        assert Calculator().median(Dataset(values)) == statistics.median(values)
+
+    def test_compact_median_float32(self, monkeypatch):
+        """Test chunked median returns the stored float32 values."""
+        monkeypatch.setattr(example_calculator, "_COMPACT_SORT_CHUNK", 64)
+        dataset = Dataset([x / 10 for x in range(1_001)], "float32")
+        assert Calculator().median(dataset) == dataset[500]
+
+    @pytest.mark.parametrize("size", [1_000, 1_001])
+    def test_compact_describe(self, monkeypatch, size):
+        """Test describe of long typed data sorted in chunks."""
+        monkeypatch.setattr(example_calculator, "_COMPACT_SORT_CHUNK", 100)
+        rng = random.Random(size)
+        values = [float(rng.randint(-500, 500)) for _ in range(size)]
+        calc = Calculator()
+        stats = calc.describe(Dataset(values))
+        expected = calc.describe(values)
+        for key in ("count", "min", "q1", "median", "q3", "max", "mode"):
+            assert stats[key] == expected[key]
+        assert stats == pytest.approx(expected)
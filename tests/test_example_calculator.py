@@ -3,12 +3,16 @@ Test cases for Calculator module following TDD approach.
 """
 
 import math
+import random
 from typing import Any
 
 import pytest
 
+from src.cost import CostModel
 from src.example_calculator import (
+    BudgetExceededError,
     Calculator,
+    CalculatorError,
     DivisionByZeroError,
     InvalidOperationError,
 )
@@ -302,6 +306,196 @@ class TestCalculatorStatistics:
         assert self.calc.mode([1, 1, 2, 2]) in [1, 2]  # Both are valid
         assert self.calc.mode([5]) == 5
 
+    def test_mode_ties_return_first_seen(self):
+        """Test the first value to reach the highest count wins ties."""
+        assert self.calc.mode([3, 1, 1, 3, 2]) == 3
+        assert self.calc.mode([2.5, 1.0, 1.0, 2.5]) == 2.5
+
+    @pytest.mark.parametrize("size", [1_000, 1_001, 5_000])
+    @pytest.mark.parametrize("value_range", [1, 10, 200])
+    def test_median_counting_path_matches_sort(self, size, value_range):
+        """Test bounded-range integer medians match a sorted selection."""
+        rng = random.Random(size + value_range)
+        numbers = [rng.randrange(-value_range, value_range) for _ in range(size)]
+        ordered = sorted(numbers)
+        if size % 2:
+            expected = ordered[size // 2]
+        else:
+            expected = (ordered[size // 2 - 1] + ordered[size // 2]) / 2
+        result = self.calc.median(numbers)
+        assert result == expected
+        assert type(result) is type(expected)
+
+    def test_median_wide_range_integers(self):
+        """Test integers too spread out for counting still get the median."""
+        numbers = [i * 1_000_003 % 10**9 for i in range(2_001)]
+        assert self.calc.median(numbers) == sorted(numbers)[1_000]
+
+    def test_median_mixed_types_large(self):
+        """Test mixed int/float lists skip the integer-only counting path."""
+        numbers = [1, 2.5] * 1_000
+        assert self.calc.median(numbers) == 1.75
+
+
+class TestCalculatorDescribe:
+    """Test single-pass summary statistics."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calc = Calculator()
+
+    def test_describe(self):
+        """Test all summary statistics of a small list."""
+        result = self.calc.describe([4, 1, 3, 2, 5, 3])
+        assert result == {
+            "count": 6,
+            "sum": 18,
+            "mean": 3,
+            "variance": pytest.approx(10 / 6),
+            "min": 1,
+            "q1": 2.25,
+            "median": 3,
+            "q3": 3.75,
+            "max": 5,
+            "mode": 3,
+        }
+
+    def test_describe_matches_individual_methods(self):
+        """Test describe agrees with mean, median and mode."""
+        numbers = [2.5, 1, 1, 7, 2.5, 9, -3]
+        result = self.calc.describe(numbers)
+        assert result["mean"] == pytest.approx(self.calc.mean(numbers))
+        assert result["median"] == self.calc.median(numbers)
+        assert result["mode"] == self.calc.mode(numbers)
+
+    def test_describe_single_value(self):
+        """Test describe of a single value."""
+        result = self.calc.describe([5])
+        assert result["variance"] == 0
+        assert result["q1"] == result["median"] == result["q3"] == 5
+
+    def test_describe_empty_list(self):
+        """Test describe of empty list raises error."""
+        with pytest.raises(InvalidOperationError):
+            self.calc.describe([])
+
+    def test_describe_invalid_value(self):
+        """Test describe of list with non-numbers raises TypeError."""
+        with pytest.raises(TypeError):
+            self.calc.describe([1, "2"])
+
+
+class TestCalculatorGroupStats:
+    """Test grouped statistical operations."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calc = Calculator()
+
+    def test_group_stats_default_aggregates(self):
+        """Test mean, median and mode per group."""
+        keys = ["a", "b", "a", "b", "a"]
+        values = [1, 10, 2, 20, 2]
+        result = self.calc.group_stats(keys, values)
+        assert list(result) == ["a", "b"]
+        assert result["a"] == {"mean": pytest.approx(5 / 3), "median": 2, "mode": 2}
+        assert result["b"] == {"mean": 15, "median": 15, "mode": 10}
+
+    def test_group_stats_matches_per_group_methods(self):
+        """Test aggregates agree with the single-list statistics methods."""
+        keys = [i % 3 for i in range(30)]
+        values = [(i * 7) % 11 for i in range(30)]
+        aggs = ["count", "sum", "mean", "min", "max", "median", "mode"]
+        result = self.calc.group_stats(keys, values, aggs=aggs)
+        for key, stats in result.items():
+            group = [v for k, v in zip(keys, values, strict=True) if k == key]
+            assert stats["count"] == len(group)
+            assert stats["sum"] == sum(group)
+            assert stats["min"] == min(group)
+            assert stats["max"] == max(group)
+            assert stats["mean"] == pytest.approx(self.calc.mean(group))
+            assert stats["median"] == self.calc.median(group)
+            assert stats["mode"] == self.calc.mode(group)
+
+    def test_group_stats_empty(self):
+        """Test grouping no rows returns no groups."""
+        assert self.calc.group_stats([], []) == {}
+
+    def test_group_stats_length_mismatch(self):
+        """Test mismatched keys and values raise error."""
+        with pytest.raises(InvalidOperationError):
+            self.calc.group_stats(["a"], [1, 2])
+
+    def test_group_stats_unknown_aggregate(self):
+        """Test unknown aggregate names raise error."""
+        with pytest.raises(InvalidOperationError) as exc_info:
+            self.calc.group_stats(["a"], [1], aggs=["stddev"])
+        assert "Unknown aggregate: stddev" in str(exc_info.value)
+
+    def test_group_stats_invalid_value(self):
+        """Test non-numeric values raise TypeError."""
+        with pytest.raises(TypeError):
+            self.calc.group_stats(["a", "b"], [1, "2"])
+
+
+class TestCalculatorBudget:
+    """Test cost-based admission control."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.calc = Calculator()
+
+    def test_within_budget(self):
+        """Test operations estimated under budget run normally."""
+        assert self.calc.factorial(10, budget=1.0) == 3628800
+        assert self.calc.power(2, 10, budget=1.0) == 1024
+        assert self.calc.mean([1, 2, 3], budget=1.0) == 2.0
+        assert self.calc.median([3, 1, 2], budget=1.0) == 2.0
+        assert self.calc.mode([1, 1, 2], budget=1.0) == 1
+        assert self.calc.describe([1, 2, 3], budget=1.0)["count"] == 3
+
+    def test_factorial_over_budget(self):
+        """Test a huge factorial is rejected before any work is done."""
+        with pytest.raises(BudgetExceededError) as exc_info:
+            self.calc.factorial(10**9, budget=0.01)
+        assert exc_info.value.operation == "factorial"
+        assert exc_info.value.estimate > exc_info.value.budget == 0.01
+
+    def test_power_over_budget(self):
+        """Test a huge integer power is rejected."""
+        with pytest.raises(BudgetExceededError):
+            self.calc.power(3, 10**9, budget=0.01)
+
+    @pytest.mark.parametrize(
+        ("operation", "args"),
+        [("factorial", (10**400,)), ("power", (2, 10**400)), ("power", (3, 10**200))],
+    )
+    def test_estimates_beyond_float_range(self, operation, args):
+        """Test arguments too large to estimate in floats are still rejected."""
+        with pytest.raises(BudgetExceededError) as exc_info:
+            getattr(self.calc, operation)(*args, budget=1.0)
+        assert exc_info.value.estimate == math.inf
+
+    def test_statistics_over_budget(self):
+        """Test list statistics are rejected using a strict cost model."""
+        calc = Calculator(cost_model=CostModel({"median": 1.0, "mean": 1.0}))
+        with pytest.raises(BudgetExceededError):
+            calc.median([1, 2, 3], budget=0.5)
+        with pytest.raises(BudgetExceededError):
+            calc.mean([1, 2, 3], budget=0.5)
+
+    def test_budget_error_is_calculator_error(self):
+        """Test budget rejections can be caught as CalculatorError."""
+        with pytest.raises(CalculatorError):
+            self.calc.factorial(10**9, budget=0.0)
+
+    def test_validation_precedes_budget(self):
+        """Test invalid arguments are reported rather than budget rejections."""
+        with pytest.raises(InvalidOperationError):
+            self.calc.factorial(-1, budget=0.0)
+        with pytest.raises(InvalidOperationError):
+            self.calc.mean([], budget=0.0)
+
 
 @pytest.mark.unit()
 class TestCalculatorUnitTests:
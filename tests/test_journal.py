@@ -0,0 +1,164 @@
+"""
+Test cases for the operation journal module.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.example_calculator import Calculator, InvalidOperationError
+from src.journal import MAGIC, Opcode, OperationJournal, read_journal, replay
+
+
+class TestOperationJournal:
+    """Test recording calculator operations."""
+
+    def test_records_memory_and_chain_operations(self, tmp_path: Path):
+        """Test every memory and chain operation is journaled."""
+        path = tmp_path / "ops.jnl"
+        with OperationJournal(path) as journal:
+            calc = Calculator(journal=journal)
+            calc.memory_store(10)
+            calc.memory_add(5)
+            calc.chain(2).chain_power(3).chain_divide(4)
+            calc.reset_chain()
+
+        records = list(read_journal(path))
+        assert [opcode for opcode, _, _ in records] == [
+            Opcode.MEMORY_STORE,
+            Opcode.MEMORY_ADD,
+            Opcode.CHAIN,
+            Opcode.CHAIN_POWER,
+            Opcode.CHAIN_DIVIDE,
+            Opcode.RESET_CHAIN,
+        ]
+        assert records[1][1:] == (5, 15)
+        assert records[4][1:] == (4, 2)
+
+    def test_buffer_flushes_when_full(self, tmp_path: Path):
+        """Test records are written once the buffer capacity is reached."""
+        path = tmp_path / "ops.jnl"
+        journal = OperationJournal(path, capacity=2, flush_interval=3600)
+        calc = Calculator(journal=journal)
+        calc.memory_store(1)
+        assert path.stat().st_size == len(MAGIC)
+        calc.memory_add(1)
+        assert len(list(read_journal(path))) == 2
+        journal.close()
+
+    def test_idle_records_flush_after_interval(self, tmp_path: Path):
+        """Test buffered records are committed without further activity."""
+        path = tmp_path / "ops.jnl"
+        with OperationJournal(path, flush_interval=0.05) as journal:
+            Calculator(journal=journal).memory_store(1)
+            deadline = time.monotonic() + 5
+            while path.stat().st_size == len(MAGIC) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert [result for _, _, result in read_journal(path)] == [1]
+
+    def test_invalid_flush_interval(self, tmp_path: Path):
+        """Test a non-positive flush interval is rejected."""
+        with pytest.raises(InvalidOperationError, match="flush interval"):
+            OperationJournal(tmp_path / "ops.jnl", flush_interval=0)
+
+    def test_appends_to_existing_journal(self, tmp_path: Path):
+        """Test reopening a journal appends after existing records."""
+        path = tmp_path / "ops.jnl"
+        for value in (1, 2):
+            with OperationJournal(path) as journal:
+                Calculator(journal=journal).memory_store(value)
+        assert [result for _, _, result in read_journal(path)] == [1, 2]
+
+    def test_rejects_foreign_file(self, tmp_path: Path):
+        """Test opening a non-journal file raises error."""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a journal")
+        with pytest.raises(InvalidOperationError):
+            OperationJournal(path)
+        with pytest.raises(InvalidOperationError):
+            list(read_journal(path))
+
+    def test_concurrent_recording(self, tmp_path: Path):
+        """Test calculators on several threads can share one journal."""
+        path = tmp_path / "ops.jnl"
+
+        def work(journal: OperationJournal) -> None:
+            calc = Calculator(journal=journal)
+            for _ in range(500):
+                calc.memory_add(1)
+
+        with OperationJournal(path, capacity=64) as journal:
+            threads = [threading.Thread(target=work, args=(journal,)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        records = list(read_journal(path))
+        assert len(records) == 2_000
+        assert all(opcode == Opcode.MEMORY_ADD for opcode, _, _ in records)
+
+    def test_unknown_operation(self, tmp_path: Path):
+        """Test recording an unknown operation raises error."""
+        with (
+            OperationJournal(tmp_path / "ops.jnl") as journal,
+            pytest.raises(InvalidOperationError),
+        ):
+            journal.record("add", 1, 2)
+
+
+class TestJournalReplay:
+    """Test rebuilding calculator state from a journal."""
+
+    def test_replay_restores_state(self, tmp_path: Path):
+        """Test replay rebuilds memory and chain values."""
+        path = tmp_path / "ops.jnl"
+        with OperationJournal(path) as journal:
+            calc = Calculator(journal=journal)
+            calc.memory_store(10)
+            calc.memory_subtract(3)
+            calc.chain(10).chain_add(5).chain_multiply(2)
+
+        restored = replay(path)
+        assert restored.memory_recall() == 7
+        assert restored.get_result() == 30
+
+    def test_replay_reset_chain(self, tmp_path: Path):
+        """Test replay honours chain resets and memory clears."""
+        path = tmp_path / "ops.jnl"
+        with OperationJournal(path) as journal:
+            calc = Calculator(journal=journal)
+            calc.memory_store(4)
+            calc.memory_clear()
+            calc.chain(1).chain_subtract(2)
+            calc.reset_chain()
+
+        restored = replay(path)
+        assert restored.memory_recall() == 0
+        assert restored.chain_value is None
+
+    def test_replay_ignores_partial_record(self, tmp_path: Path):
+        """Test a torn trailing record is skipped."""
+        path = tmp_path / "ops.jnl"
+        with OperationJournal(path) as journal:
+            Calculator(journal=journal).memory_store(8)
+        with path.open("ab") as file:
+            file.write(b"\x02\x00")
+        assert replay(path).memory_recall() == 8
+
+    def test_reopen_after_partial_record(self, tmp_path: Path):
+        """Test appending after a torn record keeps later records aligned."""
+        path = tmp_path / "ops.jnl"
+        with OperationJournal(path) as journal:
+            Calculator(journal=journal).memory_store(8)
+        with path.open("ab") as file:
+            file.write(b"\x02\x00")
+        with OperationJournal(path) as journal:
+            Calculator(journal=journal).chain(3)
+        assert list(read_journal(path)) == [
+            (Opcode.MEMORY_STORE, 8, 8),
+            (Opcode.CHAIN, 3, 3),
+        ]
+        assert replay(path).get_result() == 3
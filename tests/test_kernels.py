@@ -0,0 +1,77 @@
+"""
+Test cases for kernels module.
+"""
+
+import random
+import statistics
+from array import array
+
+import pytest
+
+from src.kernels import (
+    group_aggregates,
+    median_of_runs,
+    quantile_sorted,
+    select,
+    sorted_runs,
+)
+
+
+class TestRuns:
+    """Test order statistics over sorted runs."""
+
+    def test_sorted_runs(self):
+        """Test chunks are sorted into runs of the input typecode."""
+        runs = sorted_runs(array("i", [5, 3, 4, 1, 2]), 2)
+        assert runs == [array("i", [3, 5]), array("i", [1, 4]), array("i", [2])]
+
+    @pytest.mark.parametrize("chunk", [1, 7, 100, 1_000])
+    def test_select_matches_sorted(self, chunk):
+        """Test every rank across runs matches a full sort, with duplicates."""
+        rng = random.Random(chunk)
+        values = array("d", [float(rng.randint(-20, 20)) for _ in range(300)])
+        runs = sorted_runs(values, chunk)
+        assert [select(runs, k) for k in range(len(values))] == sorted(values)
+        assert median_of_runs(runs, len(values)) == statistics.median(values)
+
+
+class TestQuantileSorted:
+    """Test quantile interpolation."""
+
+    def test_interpolates_between_ranks(self):
+        """Test quantiles interpolate linearly between closest ranks."""
+        ordered = [1, 2, 3, 4]
+        assert quantile_sorted(ordered, 0.0) == 1
+        assert quantile_sorted(ordered, 0.5) == 2.5
+        assert quantile_sorted(ordered, 0.75) == 3.25
+        assert quantile_sorted(ordered, 1.0) == 4
+
+
+class TestGroupAggregates:
+    """Test per-group aggregates."""
+
+    def test_aggregates(self):
+        """Test each aggregate over one group's values."""
+        values = array("d", [3.0, 1.0, 3.0, 2.0])
+        aggregates = group_aggregates()
+        results = {name: agg(values) for name, agg in aggregates.items()}
+        assert results == {
+            "count": 4,
+            "sum": 9.0,
+            "mean": 2.25,
+            "min": 1.0,
+            "max": 3.0,
+            "median": 2.5,
+            "mode": 3.0,
+        }
+
+    def test_summation_mode(self):
+        """Test sum and mean follow the summation mode."""
+        values = array("d", [1e100, 1.0, -1e100, 3.0])
+        assert group_aggregates("exact")["sum"](values) == 4.0
+        assert group_aggregates("kahan")["mean"](values) == 1.0
+
+    def test_unknown_summation_mode(self):
+        """Test an unknown summation mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown summation mode"):
+            group_aggregates("fast")
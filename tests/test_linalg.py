@@ -0,0 +1,117 @@
+"""
+Test cases for the linear algebra module.
+"""
+
+import random
+
+import pytest
+
+from src.example_calculator import InvalidOperationError
+from src.linalg import Matrix, dot, matmul, matvec
+
+
+def naive_matmul(a: list[list[float]], b: list[list[float]]) -> list[list[float]]:
+    """Reference triple-loop product."""
+    return [
+        [sum(a[i][k] * b[k][j] for k in range(len(b))) for j in range(len(b[0]))]
+        for i in range(len(a))
+    ]
+
+
+def random_rows(rows: int, cols: int, seed: int) -> list[list[float]]:
+    """Generate a random matrix as a list of rows."""
+    rng = random.Random(seed)
+    return [[rng.uniform(-1, 1) for _ in range(cols)] for _ in range(rows)]
+
+
+class TestMatrix:
+    """Test matrix construction and access."""
+
+    def test_from_rows(self):
+        """Test rows are stored row-major."""
+        m = Matrix.from_rows([[1, 2, 3], [4, 5, 6]])
+        assert m.shape == (2, 3)
+        assert list(m.data) == [1, 2, 3, 4, 5, 6]
+        assert m[1, 0] == 4
+        assert m.to_rows() == [[1, 2, 3], [4, 5, 6]]
+
+    def test_zeros_and_identity(self):
+        """Test default and identity construction."""
+        assert Matrix(2, 2).to_rows() == [[0, 0], [0, 0]]
+        assert Matrix.identity(3).to_rows() == [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+
+    def test_transpose(self):
+        """Test transposition."""
+        m = Matrix.from_rows([[1, 2, 3], [4, 5, 6]])
+        assert m.transpose().to_rows() == [[1, 4], [2, 5], [3, 6]]
+
+    def test_setitem(self):
+        """Test element assignment."""
+        m = Matrix(2, 2)
+        m[0, 1] = 7
+        assert m.to_rows() == [[0, 7], [0, 0]]
+
+    def test_invalid_construction(self):
+        """Test bad shapes and values raise errors."""
+        with pytest.raises(InvalidOperationError):
+            Matrix(2, 2, [1, 2, 3])
+        with pytest.raises(InvalidOperationError):
+            Matrix.from_rows([[1, 2], [3]])
+        with pytest.raises(TypeError):
+            Matrix(1, 2, [1, "2"])  # type: ignore
+
+
+class TestProducts:
+    """Test vector and matrix products."""
+
+    def test_dot(self):
+        """Test dot product."""
+        assert dot([1, 2, 3], [4, 5, 6]) == 32
+
+    def test_matvec(self):
+        """Test matrix-vector product."""
+        m = Matrix.from_rows([[1, 2], [3, 4], [5, 6]])
+        assert list(matvec(m, [1, -1])) == [-1, -1, -1]
+
+    @pytest.mark.parametrize("block_size", [1, 3, 64])
+    def test_matmul_matches_naive(self, block_size: int):
+        """Test tiled product agrees with the naive product."""
+        a = random_rows(7, 5, seed=1)
+        b = random_rows(5, 9, seed=2)
+        result = matmul(Matrix.from_rows(a), Matrix.from_rows(b), block_size=block_size)
+        expected = naive_matmul(a, b)
+        for row, expected_row in zip(result.to_rows(), expected, strict=True):
+            assert row == pytest.approx(expected_row)
+
+    @pytest.mark.parametrize("parallel", ["thread", "process"])
+    def test_matmul_parallel(self, parallel: str):
+        """Test parallel product agrees with the serial product."""
+        a = Matrix.from_rows(random_rows(70, 64, seed=3))
+        b = Matrix.from_rows(random_rows(64, 60, seed=4))
+        serial = matmul(a, b, block_size=16)
+        assert matmul(a, b, block_size=16, parallel=parallel, workers=2) == serial
+
+    def test_matmul_identity(self):
+        """Test multiplying by the identity."""
+        m = Matrix.from_rows([[1, 2], [3, 4]])
+        assert matmul(m, Matrix.identity(2)) == m
+
+    def test_shape_mismatch(self):
+        """Test mismatched shapes raise InvalidOperationError."""
+        with pytest.raises(InvalidOperationError):
+            dot([1, 2], [1])
+        with pytest.raises(InvalidOperationError):
+            matvec(Matrix(2, 3), [1, 2])
+        with pytest.raises(InvalidOperationError):
+            matmul(Matrix(2, 3), Matrix(2, 3))
+
+    def test_invalid_options(self):
+        """Test invalid block size and parallel mode raise errors."""
+        with pytest.raises(InvalidOperationError):
+            matmul(Matrix(1, 1), Matrix(1, 1), block_size=0)
+        with pytest.raises(InvalidOperationError):
+            matmul(Matrix(1, 1), Matrix(1, 1), parallel="gpu")
+
+    def test_matmul_empty_inner_dimension(self):
+        """Test an empty inner dimension gives a zero matrix."""
+        assert matmul(Matrix(2, 0), Matrix(0, 3)) == Matrix(2, 3)
@@ -0,0 +1,99 @@
+"""
+Test cases for the load generator.
+"""
+
+import pytest
+
+from src.example_calculator import InvalidOperationError
+from src.loadtest import (
+    HttpTarget,
+    InProcessTarget,
+    default_workloads,
+    parse_mix,
+    run,
+)
+from src.server import start_server
+
+
+class TestParseMix:
+    """Test operation mix parsing."""
+
+    def test_parse_mix(self):
+        """Test weights are parsed per operation."""
+        assert parse_mix("add=70, median=20,factorial=10") == {
+            "add": 70,
+            "median": 20,
+            "factorial": 10,
+        }
+
+    def test_default_weight(self):
+        """Test operations without a weight default to 1."""
+        assert parse_mix("add,multiply") == {"add": 1, "multiply": 1}
+
+    @pytest.mark.parametrize("spec", ["", "add=x", "add=0"])
+    def test_invalid_mix(self, spec: str):
+        """Test malformed mixes raise error."""
+        with pytest.raises(InvalidOperationError):
+            parse_mix(spec)
+
+
+class TestRun:
+    """Test open-loop runs."""
+
+    def setup_method(self):
+        """Set up small workloads for fast runs."""
+        self.workloads = default_workloads(list_size=100, factorial_n=50)
+
+    def test_in_process_report(self):
+        """Test an in-process run reports throughput and percentiles."""
+        report = run(
+            InProcessTarget(),
+            {"add": 7, "median": 2, "factorial": 1},
+            rate=400,
+            duration=0.25,
+            arrival="constant",
+            workloads=self.workloads,
+        )
+        assert report["target"] == "in-process"
+        assert report["requests"] == 100
+        assert report["errors"] == 0
+        assert report["throughput_rps"] > 0
+        latency = report["latency_ms"]
+        assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["p999"]
+        assert set(report["operations"]) <= {"add", "median", "factorial"}
+
+    def test_errors_are_counted(self):
+        """Test failing operations are counted, not raised."""
+        report = run(
+            InProcessTarget(),
+            {"divide": 1},
+            rate=200,
+            duration=0.05,
+            arrival="constant",
+            workloads={"divide": lambda _rng: (1, 0)},
+        )
+        assert report["errors"] == report["requests"] == 10
+
+    def test_http_target(self):
+        """Test a run against the localhost stand-in server."""
+        server, url = start_server()
+        try:
+            report = run(
+                HttpTarget(url),
+                {"add": 1, "mean": 1},
+                rate=200,
+                duration=0.1,
+                workers=2,
+                workloads=self.workloads,
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert report["target"] == url
+        assert report["requests"] > 0
+        assert report["errors"] == 0
+
+    def test_unknown_operation(self):
+        """Test unknown operations in the mix raise error."""
+        with pytest.raises(InvalidOperationError):
+            run(InProcessTarget(), {"teleport": 1}, rate=1, duration=1)
@@ -0,0 +1,137 @@
+"""
+Test cases for main module.
+"""
+
+import math
+import sys
+
+import pytest
+
+from src.main import app
+
+
+def assert_factorial_5000(out: str) -> None:
+    """Check printed output is 5000! in full: 16326 digits."""
+    digits = out.removesuffix("\n")
+    assert digits.isdigit()
+    assert len(digits) == 16326
+    assert int(digits[:20]) == math.factorial(5000) // 10**16306
+
+
+class TestCalc:
+    """Test the calc command."""
+
+    def test_binary_operation(self, capsys):
+        """Test a binary operation prints its result."""
+        assert app(["calc", "add", "2", "3"]) == 0
+        assert capsys.readouterr().out == "5.0\n"
+
+    def test_list_operation(self, capsys):
+        """Test list operations take all arguments as one list."""
+        assert app(["calc", "median", "3", "1.5", "2"]) == 0
+        assert capsys.readouterr().out == "2\n"
+
+    def test_error_exit_status(self, capsys):
+        """Test calculator errors print a message and exit with status 1."""
+        assert app(["calc", "divide", "1", "0"]) == 1
+        assert "Cannot divide by zero" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        ("args", "message"),
+        [(["0", "-1"], "negative power"), (["10.0", "400"], "out of range")],
+    )
+    def test_arithmetic_error_exit_status(self, capsys, args, message):
+        """Test arithmetic errors print a message instead of a traceback."""
+        assert app(["calc", "power", *args]) == 1
+        assert message in capsys.readouterr().err
+
+    def test_result_past_digit_limit(self, capsys):
+        """Test large int results print in full and the limit is restored."""
+        limit = sys.get_int_max_str_digits()
+        assert app(["calc", "factorial", "5000"]) == 0
+        assert_factorial_5000(capsys.readouterr().out)
+        assert sys.get_int_max_str_digits() == limit
+
+    def test_unknown_operation(self):
+        """Test unknown operations are rejected by the parser."""
+        with pytest.raises(SystemExit):
+            app(["calc", "modulo", "1", "2"])
+
+
+class TestRun:
+    """Test the run command."""
+
+    def test_runs_script_with_argv(self, tmp_path, capsys):
+        """Test a script runs as __main__ with its own arguments."""
+        script = tmp_path / "job.py"
+        script.write_text(
+            "import sys\n"
+            "from src.example_calculator import Calculator\n"
+            "if __name__ == '__main__':\n"
+            "    print(Calculator().add(*map(int, sys.argv[1:])))\n",
+        )
+        assert app(["run", str(script), "4", "5"]) == 0
+        assert capsys.readouterr().out == "9.0\n"
+
+    def test_exit_status(self, tmp_path):
+        """Test a script's sys.exit status is returned."""
+        script = tmp_path / "job.py"
+        script.write_text("import sys\nsys.exit(3)\n")
+        assert app(["run", str(script)]) == 3
+
+
+class TestProfileOption:
+    """Test --profile."""
+
+    @pytest.mark.parametrize("profiler", ["sample", "cprofile"])
+    def test_writes_collapsed_stacks(self, tmp_path, capsys, profiler):
+        """Test profiling writes stacks and prints the method breakdown."""
+        script = tmp_path / "job.py"
+        script.write_text(
+            "import time\n"
+            "from src.example_calculator import Calculator\n"
+            "numbers = [float(i % 997) for i in range(20_000)]\n"
+            "deadline = time.perf_counter() + 0.2\n"
+            "while time.perf_counter() < deadline:\n"
+            "    Calculator().median(numbers)\n",
+        )
+        output = tmp_path / "job.folded"
+        status = app(
+            [
+                "--profile",
+                "--profiler",
+                profiler,
+                "--profile-output",
+                str(output),
+                "--interval",
+                "0.0005",
+                "run",
+                str(script),
+            ],
+        )
+        assert status == 0
+        lines = output.read_text().splitlines()
+        assert lines
+        stack, _, weight = lines[0].rpartition(" ")
+        assert int(weight) > 0
+        assert stack.split(";")[0] == "example_calculator:Calculator.median"
+        err = capsys.readouterr().err
+        assert "Calculator.median" in err
+        assert str(output) in err
+
+    def test_docstring_example(self, tmp_path, capsys, monkeypatch):
+        """Test the documented cprofile example prints its large result."""
+        monkeypatch.chdir(tmp_path)
+        args = ["--profile", "--profiler", "cprofile", "calc", "factorial", "5000"]
+        assert app(args) == 0
+        assert_factorial_5000(capsys.readouterr().out)
+        assert (tmp_path / "profile.folded").exists()
+
+    def test_flag_before_command(self, tmp_path, capsys, monkeypatch):
+        """Test --profile directly before the command uses the sample profiler."""
+        monkeypatch.chdir(tmp_path)
+        assert app(["--profile", "calc", "add", "1", "2"]) == 0
+        captured = capsys.readouterr()
+        assert captured.out == "3.0\n"
+        assert "profile.folded" in captured.err
+        assert (tmp_path / "profile.folded").exists()
@@ -0,0 +1,165 @@
+"""
+Test cases for modular module.
+"""
+
+import random
+from array import array
+
+import pytest
+
+from src.example_calculator import InvalidOperationError
+from src.modular import FixedBase, Modulus, modinv, modpow, mulmod
+
+
+P = 2**61 - 1
+RSA_LIKE = (2**127 - 1) * (2**89 - 1)
+
+
+class TestScalar:
+    """Test single-value functions."""
+
+    def test_modpow(self):
+        """Test modpow matches the builtin three-argument pow."""
+        assert modpow(3, 200, P) == pow(3, 200, P)
+        assert modpow(-5, 3, 7) == (-125) % 7
+        assert modpow(10, 0, 1) == 0
+
+    def test_negative_exponent(self):
+        """Test negative exponents use the modular inverse."""
+        assert modpow(3, -2, 11) * 9 % 11 == 1
+        with pytest.raises(InvalidOperationError):
+            modpow(2, -1, 8)
+
+    def test_modinv(self):
+        """Test modinv returns the inverse."""
+        assert modinv(3, 11) == 4
+        assert modinv(-3, 11) == 7
+        assert modinv(12345, P) * 12345 % P == 1
+
+    def test_modinv_not_invertible(self):
+        """Test values sharing a factor with the modulus are rejected."""
+        with pytest.raises(InvalidOperationError, match="not invertible"):
+            modinv(6, 9)
+        with pytest.raises(InvalidOperationError):
+            modinv(0, 7)
+
+    def test_mulmod(self):
+        """Test mulmod on values far beyond 64 bits."""
+        a, b = 2**200 + 3, 3**150
+        assert mulmod(a, b, RSA_LIKE) == a * b % RSA_LIKE
+
+    def test_invalid_arguments(self):
+        """Test non-integers and non-positive moduli are rejected."""
+        with pytest.raises(TypeError, match="Expected integer, got float"):
+            modpow(2.0, 3, 5)  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            mulmod(2, "3", 5)  # type: ignore[arg-type]
+        with pytest.raises(InvalidOperationError, match="positive"):
+            Modulus(0)
+        with pytest.raises(InvalidOperationError):
+            Modulus(-7)
+
+
+class TestModulusBatch:
+    """Test batch operations on a Modulus context."""
+
+    def test_pow_bases(self):
+        """Test many bases raised to one exponent."""
+        modulus = Modulus(P)
+        bases = [random.Random(0).getrandbits(64) for _ in range(50)]
+        assert modulus.pow_bases(bases, 65_537) == [pow(b, 65_537, P) for b in bases]
+        assert modulus.pow_bases(array("q", [2, 3]), 10) == [1024, 59049]
+        assert modulus.pow_bases([], 3) == []
+
+    def test_pow_bases_negative_exponent(self):
+        """Test a negative shared exponent inverts every base."""
+        assert Modulus(11).pow_bases([2, 3], -1) == [6, 4]
+        with pytest.raises(InvalidOperationError):
+            Modulus(10).pow_bases([3, 5], -1)
+
+    @pytest.mark.parametrize("modulus", [2, 97, P, RSA_LIKE])
+    @pytest.mark.parametrize("count", [1, 5, 500])
+    def test_pow_exponents(self, modulus, count):
+        """Test one base raised to many exponents, with and without a table."""
+        rng = random.Random(count)
+        base = rng.getrandbits(200)
+        exponents = [rng.getrandbits(rng.choice([1, 8, 64, 160])) for _ in range(count)]
+        exponents[0] = 0
+        expected = [pow(base, e, modulus) for e in exponents]
+        assert Modulus(modulus).pow_exponents(base, exponents) == expected
+
+    def test_pow_exponents_negative(self):
+        """Test negative exponents fall back to per-value inversion."""
+        assert Modulus(11).pow_exponents(2, [-1, 0, 3]) == [6, 1, 8]
+        assert Modulus(11).pow_exponents(2, []) == []
+
+    def test_inverse_many(self):
+        """Test batch inversion matches one inverse per value."""
+        rng = random.Random(1)
+        values = [rng.randrange(1, P) for _ in range(300)]
+        assert Modulus(P).inverse_many(values) == [pow(v, -1, P) for v in values]
+        assert Modulus(P).inverse_many([]) == []
+
+    def test_inverse_many_reports_bad_value(self):
+        """Test a non-invertible value is named in the error."""
+        with pytest.raises(InvalidOperationError, match=r"^6 is not invertible"):
+            Modulus(9).inverse_many([2, 4, 6, 7])
+
+    def test_multiply_many(self):
+        """Test pairwise products."""
+        modulus = Modulus(RSA_LIKE)
+        a = [2**130, 5, -1]
+        b = [3**90, 7, 2]
+        assert modulus.multiply_many(a, b) == [
+            x * y % RSA_LIKE for x, y in zip(a, b, strict=True)
+        ]
+        with pytest.raises(InvalidOperationError):
+            modulus.multiply_many([1], [1, 2])
+
+    def test_batch_type_errors(self):
+        """Test non-integer elements are rejected."""
+        modulus = Modulus(P)
+        with pytest.raises(TypeError, match="Expected integers"):
+            modulus.pow_bases([1, 2.0], 3)  # type: ignore[list-item]
+        with pytest.raises(TypeError):
+            modulus.inverse_many([1, "2"])  # type: ignore[list-item]
+
+
+class TestFixedBase:
+    """Test fixed-base window tables."""
+
+    @pytest.mark.parametrize("window", [1, 3, 6, 8])
+    def test_matches_pow(self, window):
+        """Test every window size gives the builtin result."""
+        table = Modulus(RSA_LIKE).fixed_base(7, 100, window)
+        rng = random.Random(window)
+        exponents = [0, 1, 2**100 - 1, *(rng.getrandbits(100) for _ in range(50))]
+        assert table.pow_many(exponents) == [pow(7, e, RSA_LIKE) for e in exponents]
+        assert table.pow(12345) == pow(7, 12345, RSA_LIKE)
+
+    def test_modulus_one(self):
+        """Test everything is zero modulo one."""
+        table = Modulus(1).fixed_base(5, 8)
+        assert table.pow_many([0, 3, 255]) == [0, 0, 0]
+
+    def test_attributes(self):
+        """Test the table records its reduced base and shape."""
+        table = Modulus(11).fixed_base(25, 64, 6)
+        assert isinstance(table, FixedBase)
+        assert (table.base, table.bits, table.window) == (3, 64, 6)
+        assert repr(table.modulus) == "Modulus(11)"
+
+    def test_range_checks(self):
+        """Test exponents outside the table and bad windows are rejected."""
+        modulus = Modulus(P)
+        table = modulus.fixed_base(3, 16)
+        with pytest.raises(InvalidOperationError):
+            table.pow(2**16)
+        with pytest.raises(InvalidOperationError):
+            table.pow_many([1, -1])
+        with pytest.raises(InvalidOperationError):
+            modulus.fixed_base(3, 16, 0)
+        with pytest.raises(InvalidOperationError):
+            modulus.fixed_base(3, 16, 9)
+        with pytest.raises(InvalidOperationError):
+            modulus.fixed_base(3, -1)
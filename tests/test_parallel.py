@@ -0,0 +1,89 @@
+"""
+Test cases for parallel module.
+"""
+
+import itertools
+import threading
+
+import pytest
+
+from src import parallel
+from src.example_calculator import InvalidOperationError
+from src.parallel import chunk_bounds, default_workers, gil_enabled, run_chunks
+
+
+@pytest.fixture()
+def free_threaded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Take the threaded path with small chunks, as on a free-threaded build."""
+    monkeypatch.setattr(parallel, "gil_enabled", lambda: False)
+    monkeypatch.setattr(parallel, "MIN_CHUNK_SIZE", 10)
+
+
+class TestChunking:
+    """Test splitting work into chunks."""
+
+    def test_gil_enabled(self):
+        """Test GIL detection returns a bool on every build."""
+        assert isinstance(gil_enabled(), bool)
+
+    def test_default_workers(self):
+        """Test at least one worker is available."""
+        assert default_workers() >= 1
+
+    def test_small_input_is_one_chunk(self):
+        """Test inputs under the minimum chunk size are not split."""
+        assert chunk_bounds(100, 8) == [(0, 100)]
+        assert chunk_bounds(0, 8) == [(0, 0)]
+
+    def test_chunks_cover_input(self):
+        """Test chunks are contiguous and cover every index."""
+        size = parallel.MIN_CHUNK_SIZE * 5 + 3
+        bounds = chunk_bounds(size, 4)
+        assert len(bounds) == 4
+        assert bounds[0][0] == 0
+        assert bounds[-1][1] == size
+        assert all(a[1] == b[0] for a, b in itertools.pairwise(bounds))
+
+    def test_workers_cap_chunks(self):
+        """Test no more chunks are made than workers."""
+        assert len(chunk_bounds(parallel.MIN_CHUNK_SIZE * 100, 3)) == 3
+
+
+class TestRunChunks:
+    """Test running chunk functions."""
+
+    def test_serial_with_gil(self, monkeypatch: pytest.MonkeyPatch):
+        """Test the GIL build runs one chunk on the calling thread."""
+        monkeypatch.setattr(parallel, "gil_enabled", lambda: True)
+        callers = []
+
+        def chunk(start: int, stop: int) -> tuple[int, int]:
+            callers.append(threading.current_thread())
+            return start, stop
+
+        size = parallel.MIN_CHUNK_SIZE * 8
+        assert run_chunks(chunk, size, workers=8) == [(0, size)]
+        assert callers == [threading.current_thread()]
+
+    @pytest.mark.usefixtures("free_threaded")
+    def test_results_in_chunk_order(self):
+        """Test chunk results come back in input order."""
+        results = run_chunks(lambda start, stop: list(range(start, stop)), 95, 4)
+        assert len(results) == 4
+        assert [n for chunk in results for n in chunk] == list(range(95))
+
+    @pytest.mark.usefixtures("free_threaded")
+    def test_first_failing_chunk_raises(self):
+        """Test the earliest failing chunk's exception propagates."""
+
+        def chunk(start: int, _stop: int) -> None:
+            if start:
+                raise ValueError(f"chunk at {start}")
+
+        with pytest.raises(ValueError, match="chunk at 25"):
+            run_chunks(chunk, 100, 4)
+
+    def test_invalid_workers(self):
+        """Test workers must be positive."""
+        with pytest.raises(InvalidOperationError):
+            run_chunks(lambda _start, _stop: None, 10, 0)
@@ -0,0 +1,205 @@
+"""
+Test cases for pipeline module.
+"""
+
+import math
+import statistics
+
+import pytest
+
+from src.example_calculator import (
+    Calculator,
+    DivisionByZeroError,
+    InvalidOperationError,
+)
+from src.pipeline import Pipeline
+
+
+def is_even(n: float) -> bool:
+    """Return whether n is even."""
+    return n % 2 == 0
+
+
+class TestPipelineStages:
+    """Test map, filter and window stages."""
+
+    def test_map_calculator_operations(self):
+        """Test named operations match Calculator results."""
+        calc = Calculator()
+        values = [1, 2.5, -3, 4]
+        result = (
+            Pipeline(values)
+            .map("multiply", 3)
+            .map("add", 1)
+            .map("subtract", 0.5)
+            .map("divide", 2)
+            .map("power", 2)
+            .collect()
+        )
+        expected = [
+            calc.power(
+                calc.divide(calc.subtract(calc.add(calc.multiply(v, 3), 1), 0.5), 2), 2
+            )
+            for v in values
+        ]
+        assert result == expected
+
+    def test_map_unary_operations(self):
+        """Test sqrt and factorial use Calculator methods."""
+        assert Pipeline([4, 9]).map("sqrt").collect() == [2.0, 3.0]
+        assert Pipeline([3, 5]).map("factorial").collect() == [6, 120]
+        with pytest.raises(InvalidOperationError):
+            Pipeline([-1]).map("sqrt").collect()
+
+    def test_map_function(self):
+        """Test arbitrary functions can be mapped."""
+        assert Pipeline([1, 2]).map(str).collect() == ["1", "2"]
+
+    def test_filter(self):
+        """Test filter keeps matching elements."""
+        result = Pipeline(range(10)).filter(is_even).map("multiply", 10).collect()
+        assert result == [0, 20, 40, 60, 80]
+
+    def test_sliding_window(self):
+        """Test step-1 windows slide one element at a time."""
+        assert Pipeline(range(5)).window(3).collect() == [
+            (0, 1, 2),
+            (1, 2, 3),
+            (2, 3, 4),
+        ]
+
+    def test_tumbling_and_hopping_windows(self):
+        """Test step == size and step > size windows; partial windows drop."""
+        assert Pipeline(range(7)).window(3, 3).collect() == [(0, 1, 2), (3, 4, 5)]
+        assert Pipeline(range(9)).window(2, 4).collect() == [(0, 1), (4, 5)]
+        assert Pipeline(range(2)).window(3).collect() == []
+
+    def test_window_aggregate(self):
+        """Test each window is reduced to one value."""
+        values = [5, 1, 4, 2, 3, 9]
+        result = Pipeline(values).window(3).aggregate("median").collect()
+        expected = [statistics.median(values[i : i + 3]) for i in range(4)]
+        assert result == expected
+        assert Pipeline(values).window(2, 2).aggregate("sum").collect() == [6, 6, 12]
+
+    def test_aggregate_needs_window(self):
+        """Test aggregate without a window is rejected."""
+        with pytest.raises(InvalidOperationError):
+            Pipeline([1]).aggregate("mean")
+
+    def test_invalid_stages(self):
+        """Test unknown operations and bad arguments are rejected up front."""
+        with pytest.raises(InvalidOperationError):
+            Pipeline([1]).map("modulo", 2)
+        with pytest.raises(InvalidOperationError):
+            Pipeline([1]).map("add")
+        with pytest.raises(InvalidOperationError):
+            Pipeline([1]).map("sqrt", 2)
+        with pytest.raises(TypeError):
+            Pipeline([1]).map("add", "2")
+        with pytest.raises(InvalidOperationError):
+            Pipeline([1]).window(0)
+        with pytest.raises(InvalidOperationError):
+            Pipeline([1]).window(2).aggregate("range")
+
+
+class TestPipelineEvaluation:
+    """Test laziness, fusion and terminal operations."""
+
+    def test_lazy_until_terminal(self):
+        """Test no element is pulled before a terminal operation."""
+        pulled = []
+
+        def source():
+            for n in range(3):
+                pulled.append(n)
+                yield n
+
+        pipeline = Pipeline(source()).map("add", 1).filter(is_even)
+        assert pulled == []
+        assert next(iter(pipeline)) == 2
+        assert pulled == [0, 1]
+
+    def test_adjacent_stages_fuse(self):
+        """Test map/filter runs fuse into one pass, split only by windows."""
+        pipeline = (
+            Pipeline(range(10))
+            .map("multiply", 2)
+            .filter(is_even)
+            .map("add", 1)
+            .window(2)
+            .aggregate("mean")
+            .map("sqrt")
+        )
+        assert pipeline.explain() == [
+            "multiply 2 | filter is_even | add 1",
+            "window 2 step 1",
+            "aggregate mean | sqrt",
+        ]
+
+    def test_pipelines_are_immutable(self):
+        """Test extending a pipeline leaves the original unchanged."""
+        base = Pipeline([1, 2, 3]).map("add", 1)
+        doubled = base.map("multiply", 2)
+        assert base.collect() == [2, 3, 4]
+        assert doubled.collect() == [4, 6, 8]
+
+    def test_type_errors_match_calculator(self):
+        """Test non-numbers raise the Calculator TypeError."""
+        with pytest.raises(TypeError, match="Expected number, got str"):
+            Pipeline([1, "x"]).map("add", 1).collect()
+        with pytest.raises(TypeError, match="Expected number, got str"):
+            Pipeline([1]).map(str).map("add", 1).collect()
+
+    def test_divide_by_zero(self):
+        """Test dividing by a zero operand raises per element, lazily."""
+        pipeline = Pipeline([1, 2]).map("divide", 0)
+        with pytest.raises(DivisionByZeroError):
+            pipeline.collect()
+        assert Pipeline([]).map("divide", 0).collect() == []
+
+    def test_chunks(self):
+        """Test chunked evaluation yields bounded float arrays."""
+        chunks = list(Pipeline(range(10)).map("multiply", 2).chunks(4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert [v for chunk in chunks for v in chunk] == [
+            float(2 * n) for n in range(10)
+        ]
+        with pytest.raises(InvalidOperationError):
+            Pipeline([1]).chunks(0)
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("count", 5),
+            ("sum", 15.0),
+            ("mean", 3.0),
+            ("min", 1.0),
+            ("max", 5.0),
+            ("median", 3),
+            ("mode", 1),
+        ],
+    )
+    def test_reduce(self, name, expected):
+        """Test whole-stream reductions."""
+        assert Pipeline(iter([1, 2, 3, 4, 5])).reduce(name) == expected
+
+    def test_reduce_empty(self):
+        """Test reducing an empty pipeline."""
+        assert Pipeline([]).reduce("count") == 0
+        for name in ("mean", "min", "median"):
+            with pytest.raises(InvalidOperationError):
+                Pipeline([]).reduce(name)
+
+    def test_to_array(self):
+        """Test evaluation into a float array."""
+        result = Pipeline([1, 4]).map("sqrt").to_array()
+        assert result.typecode == "d"
+        assert list(result) == [1.0, 2.0]
+
+    def test_non_finite_operands(self):
+        """Test infinite and NaN operands are bound, not inlined as text."""
+        result = (
+            Pipeline([1.0]).map("add", math.inf).map("multiply", math.nan).collect()
+        )
+        assert math.isnan(result[0])
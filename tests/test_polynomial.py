@@ -0,0 +1,81 @@
+"""
+Test cases for the polynomial module.
+"""
+
+import math
+from array import array
+
+import pytest
+
+from src.polynomial import Polynomial
+
+
+class TestPolynomialEvaluation:
+    """Test single and batch evaluation."""
+
+    def setup_method(self):
+        """Set up 1 - 2x + 3x**3."""
+        self.poly = Polynomial([1, -2, 0, 3])
+
+    def test_evaluate(self):
+        """Test evaluation against the expanded formula."""
+        for x in (-2, 0, 0.5, 3):
+            assert self.poly(x) == pytest.approx(1 - 2 * x + 3 * x**3)
+            assert self.poly.evaluate(x) == self.poly(x)
+
+    def test_evaluate_with_derivative(self):
+        """Test value and derivative come from the same pass."""
+        value, derivative = self.poly.evaluate_with_derivative(2)
+        assert value == 21
+        assert derivative == -2 + 9 * 4
+
+    def test_evaluate_many(self):
+        """Test batch evaluation over a typed array."""
+        xs = array("d", [-1, 0, 1, 2])
+        assert list(self.poly.evaluate_many(xs)) == [self.poly(x) for x in xs]
+
+    def test_evaluate_many_with_derivative(self):
+        """Test batch evaluation with derivatives."""
+        values, derivatives = self.poly.evaluate_many_with_derivative([0, 1])
+        assert list(values) == [1, 2]
+        assert list(derivatives) == [-2, 7]
+
+    def test_derivative_polynomial(self):
+        """Test the derivative polynomial."""
+        assert self.poly.derivative() == Polynomial([-2, 0, 9])
+
+    def test_high_degree(self):
+        """Test a high-degree polynomial compiles and evaluates."""
+        poly = Polynomial([1] * 2000)
+        assert poly(0.5) == pytest.approx(2)
+        assert poly.degree == 1999
+
+    def test_non_finite_coefficient(self):
+        """Test non-finite coefficients are supported."""
+        assert Polynomial([math.inf, 1])(1) == math.inf
+
+
+class TestPolynomialConstruction:
+    """Test coefficient handling."""
+
+    def test_trailing_zeros_dropped(self):
+        """Test trailing zero coefficients do not change the degree."""
+        poly = Polynomial([1, 2, 0, 0])
+        assert poly.coefficients == (1, 2)
+        assert poly.degree == 1
+
+    def test_zero_polynomial(self):
+        """Test the zero polynomial."""
+        poly = Polynomial([])
+        assert poly(5) == 0
+        assert poly.evaluate_with_derivative(5) == (0, 0)
+        assert poly.degree == -1
+
+    def test_constant_polynomial(self):
+        """Test a constant polynomial has zero derivative."""
+        assert Polynomial([4]).evaluate_with_derivative(3) == (4, 0)
+
+    def test_invalid_coefficients(self):
+        """Test non-numeric coefficients raise TypeError."""
+        with pytest.raises(TypeError):
+            Polynomial([1, "2"])  # type: ignore
@@ -0,0 +1,115 @@
+"""
+Test cases for profiling module.
+"""
+
+import time
+from collections import Counter
+
+import pytest
+
+from src.example_calculator import Calculator, InvalidOperationError
+from src.profiling import Profile, SamplingProfiler, profile_call
+
+
+def busy_median(seconds: float) -> int:
+    """Call Calculator.median repeatedly for about the given time."""
+    calculator = Calculator()
+    numbers = [float((i * 7919) % 10_007) for i in range(20_000)]
+    calls = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        calculator.median(numbers)
+        calls += 1
+    return calls
+
+
+class TestProfile:
+    """Test reporting of recorded stacks."""
+
+    def test_collapsed_lines(self, tmp_path):
+        """Test collapsed output is one 'a;b weight' line per stack."""
+        profile = Profile(Counter({("m:f", "m:g"): 5, ("m:f",): 7, ("m:h",): 0}))
+        path = tmp_path / "out.folded"
+        profile.write_collapsed(path)
+        assert path.read_text() == "m:f 7\nm:f;m:g 5\n"
+
+    def test_method_breakdown(self):
+        """Test inclusive and exclusive time per public Calculator method."""
+        describe = "example_calculator:Calculator.describe"
+        median = "example_calculator:Calculator.median"
+        helper = "example_calculator:Calculator._validate_sequence"
+        profile = Profile(
+            Counter(
+                {
+                    (describe,): 100,
+                    (describe, median): 300,
+                    (describe, median, helper): 50,
+                    ("batch:batch_median", median): 200,
+                },
+            ),
+            calls={describe: 2, median: 3},
+        )
+        rows = {row[0]: row[1:] for row in profile.method_breakdown()}
+        assert set(rows) == {"Calculator.describe", "Calculator.median"}
+        assert rows["Calculator.describe"] == pytest.approx((450e-6, 100e-6, 2))
+        assert rows["Calculator.median"] == pytest.approx((550e-6, 550e-6, 3))
+        assert profile.total_seconds == pytest.approx(650e-6)
+
+    def test_format_breakdown(self):
+        """Test the breakdown table lists methods and the library total."""
+        profile = Profile(Counter({("example_calculator:Calculator.mean",): 2_000}))
+        text = profile.format_breakdown()
+        assert "Calculator.mean" in text
+        assert "0.002s" in text
+        assert "total in library" in text
+
+
+class TestProfilers:
+    """Test collecting stacks from running code."""
+
+    @pytest.mark.parametrize("profiler", ["sample", "cprofile"])
+    def test_profile_call(self, profiler):
+        """Test library frames are recorded and the result is returned."""
+        calls, profile = profile_call(
+            busy_median,
+            0.2,
+            profiler=profiler,
+            interval=0.0005,
+        )
+        assert calls > 0
+        methods = {row[0]: row for row in profile.method_breakdown()}
+        assert "Calculator.median" in methods
+        assert methods["Calculator.median"][1] > 0
+        if profiler == "cprofile":
+            assert methods["Calculator.median"][3] == calls
+        else:
+            assert methods["Calculator.median"][3] is None
+
+    @pytest.mark.parametrize("profiler", ["sample", "cprofile"])
+    def test_only_library_frames(self, profiler):
+        """Test caller, profiler and standard library frames are left out."""
+        _, profile = profile_call(busy_median, 0.1, profiler=profiler)
+        modules = {
+            label.partition(":")[0] for stack in profile.stacks for label in stack
+        }
+        assert "example_calculator" in modules
+        assert not modules & {"test_profiling", "profiling", "threading", "random"}
+
+    def test_sampling_context_manager(self):
+        """Test SamplingProfiler collects samples around a block."""
+        with SamplingProfiler(interval=0.0005) as sampler:
+            busy_median(0.1)
+        assert sampler.samples > 0
+
+    def test_exception_propagates(self):
+        """Test an exception in the profiled call stops sampling and is raised."""
+        calculator = Calculator()
+        with pytest.raises(InvalidOperationError):
+            profile_call(calculator.median, [])
+
+    def test_invalid_arguments(self):
+        """Test unknown profilers and non-positive intervals are rejected."""
+        with pytest.raises(InvalidOperationError):
+            profile_call(sum, [1], profiler="perf")
+        with pytest.raises(InvalidOperationError):
+            SamplingProfiler(interval=0)
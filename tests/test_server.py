@@ -0,0 +1,131 @@
+"""
+Test cases for the calculator HTTP stand-in server.
+"""
+
+import http.client
+import json
+from collections.abc import Iterator
+from typing import Any
+from urllib.parse import urlsplit
+
+import pytest
+
+from src.server import start_server
+
+
+@pytest.fixture()
+def connection() -> Iterator[http.client.HTTPConnection]:
+    """Start a server and open a keep-alive connection to it."""
+    server, url = start_server()
+    parts = urlsplit(url)
+    conn = http.client.HTTPConnection(parts.hostname or "", parts.port)
+    yield conn
+    conn.close()
+    server.shutdown()
+    server.server_close()
+
+
+def post(
+    conn: http.client.HTTPConnection,
+    operation: str,
+    args: list[Any],
+) -> tuple[int, dict[str, Any]]:
+    """Send one operation, or a batch of calls, and decode the response."""
+    key = "calls" if operation == "batch" else "args"
+    conn.request("POST", f"/{operation}", body=json.dumps({key: args}))
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class TestCalculatorServer:
+    """Test the JSON-over-HTTP protocol."""
+
+    def test_operations_over_one_connection(
+        self, connection: http.client.HTTPConnection
+    ):
+        """Test several operations reuse one keep-alive connection."""
+        assert post(connection, "add", [2, 3]) == (200, {"result": 5})
+        assert post(connection, "median", [[3, 1, 2]]) == (200, {"result": 2})
+        assert post(connection, "factorial", [20]) == (
+            200,
+            {"result": 2432902008176640000},
+        )
+
+    def test_calculator_error(self, connection: http.client.HTTPConnection):
+        """Test calculator errors map to HTTP 400."""
+        status, payload = post(connection, "divide", [1, 0])
+        assert status == 400
+        assert payload["error"] == "DivisionByZeroError"
+
+    @pytest.mark.parametrize(
+        ("operation", "args", "error"),
+        [
+            ("power", [0, -1], "ZeroDivisionError"),
+            ("power", [10.0, 400], "OverflowError"),
+        ],
+    )
+    def test_arithmetic_error(
+        self,
+        connection: http.client.HTTPConnection,
+        operation: str,
+        args: list[Any],
+        error: str,
+    ):
+        """Test arithmetic errors map to HTTP 400 on a live connection."""
+        status, payload = post(connection, operation, args)
+        assert status == 400
+        assert payload["error"] == error
+        assert post(connection, "add", [1, 1]) == (200, {"result": 2})
+
+    def test_unencodable_result(self, connection: http.client.HTTPConnection):
+        """Test a result past the int-to-str digit limit maps to HTTP 400."""
+        status, payload = post(connection, "factorial", [2000])
+        assert status == 400
+        assert payload["error"] == "ValueError"
+        assert post(connection, "add", [1, 1]) == (200, {"result": 2})
+
+    def test_unknown_operation(self, connection: http.client.HTTPConnection):
+        """Test unknown operations map to HTTP 404."""
+        status, _ = post(connection, "memory_clear", [])
+        assert status == 404
+
+    def test_batch(self, connection: http.client.HTTPConnection):
+        """Test a batch returns one result or error per call, in order."""
+        calls = [
+            {"operation": "add", "args": [1, 2]},
+            {"operation": "divide", "args": [1, 0]},
+            {"operation": "nope", "args": []},
+            {"operation": "sqrt", "args": [16]},
+            {"operation": "power", "args": [10.0, 400]},
+        ]
+        status, payload = post(connection, "batch", calls)
+        assert status == 200
+        results = payload["results"]
+        assert results[0] == {"result": 3}
+        assert results[1]["error"] == "DivisionByZeroError"
+        assert results[2]["error"] == "NotFound"
+        assert results[3] == {"result": 4}
+        assert results[4]["error"] == "OverflowError"
+
+    def test_unencodable_result_inside_a_batch(
+        self, connection: http.client.HTTPConnection
+    ):
+        """Test an unencodable result fails only its own call in a batch."""
+        calls = [
+            {"operation": "add", "args": [1, 2]},
+            {"operation": "factorial", "args": [2000]},
+            {"operation": "add", "args": [3, 4]},
+        ]
+        status, payload = post(connection, "batch", calls)
+        assert status == 200
+        results = payload["results"]
+        assert results[0] == {"result": 3}
+        assert results[1]["error"] == "ValueError"
+        assert results[2] == {"result": 7}
+
+    def test_malformed_batch(self, connection: http.client.HTTPConnection):
+        """Test a batch without calls maps to HTTP 400."""
+        connection.request("POST", "/batch", body=json.dumps({"args": []}))
+        response = connection.getresponse()
+        assert response.status == 400
+        assert json.loads(response.read())["error"] == "KeyError"
@@ -0,0 +1,100 @@
+"""
+Test cases for SortedSample module.
+"""
+
+import math
+
+import pytest
+
+from src.example_calculator import Calculator, InvalidOperationError
+from src.sorted_sample import SortedSample
+
+
+class TestSortedSampleQueries:
+    """Test quantile, rank and count queries."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.sample = SortedSample([5, 1, 4, 2, 3])
+
+    def test_values_are_sorted(self):
+        """Test values are kept in ascending order."""
+        assert list(self.sample) == [1, 2, 3, 4, 5]
+        assert len(self.sample) == 5
+        assert self.sample[0] == 1
+        assert self.sample[-1] == 5
+
+    def test_quantile(self):
+        """Test quantiles interpolate between closest ranks."""
+        assert self.sample.quantile(0) == 1
+        assert self.sample.quantile(1) == 5
+        assert self.sample.quantile(0.25) == 2
+        assert self.sample.percentile(90) == pytest.approx(4.6)
+
+    def test_median_matches_calculator(self):
+        """Test median agrees with Calculator.median."""
+        calc = Calculator()
+        for values in ([1, 2, 3, 4], [7], [3.5, -1, 2, 2, 10]):
+            assert SortedSample(values).median() == calc.median(values)
+
+    def test_counts_and_rank(self):
+        """Test count and rank queries."""
+        assert self.sample.count_below(3) == 2
+        assert self.sample.count_below(0) == 0
+        assert self.sample.count_between(2, 4) == 3
+        assert self.sample.count_between(4, 2) == 0
+        assert self.sample.rank(3) == 0.6
+        assert self.sample.rank(10) == 1
+
+    def test_quantile_out_of_range(self):
+        """Test quantile outside [0, 1] raises error."""
+        with pytest.raises(InvalidOperationError):
+            self.sample.quantile(1.5)
+
+    def test_empty_sample(self):
+        """Test queries on empty sample raise error."""
+        sample = SortedSample()
+        with pytest.raises(InvalidOperationError):
+            sample.median()
+        with pytest.raises(InvalidOperationError):
+            sample.rank(1)
+        assert sample.count_below(1) == 0
+
+
+class TestSortedSampleUpdates:
+    """Test incremental inserts and removals."""
+
+    def test_insert(self):
+        """Test inserted values land in order."""
+        sample = SortedSample([1, 3])
+        sample.insert(2)
+        sample.insert(0.5)
+        assert list(sample) == [0.5, 1, 2, 3]
+
+    def test_remove(self):
+        """Test removing one occurrence of a value."""
+        sample = SortedSample([1, 2, 2, 3])
+        sample.remove(2)
+        assert list(sample) == [1, 2, 3]
+
+    def test_remove_missing_value(self):
+        """Test removing a missing value raises error."""
+        sample = SortedSample([1, 2])
+        with pytest.raises(InvalidOperationError):
+            sample.remove(5)
+
+    def test_invalid_types(self):
+        """Test non-numbers raise TypeError."""
+        with pytest.raises(TypeError):
+            SortedSample([1, "2"])  # type: ignore
+        with pytest.raises(TypeError):
+            SortedSample().insert("2")  # type: ignore
+
+    def test_nan_rejected(self):
+        """Test NaN values are rejected on build and insert."""
+        with pytest.raises(ValueError, match="NaN"):
+            SortedSample([1.0, math.nan, 2.0])
+        sample = SortedSample([1.0, 2.0])
+        with pytest.raises(ValueError, match="NaN"):
+            sample.insert(math.nan)
+        assert list(sample) == [1.0, 2.0]
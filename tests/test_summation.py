@@ -0,0 +1,245 @@
+"""
+Test cases for summation module.
+"""
+
+import math
+import random
+from array import array
+
+import pytest
+
+from src.dataset import Dataset
+from src.example_calculator import Calculator
+from src.journal import OperationJournal, replay
+from src.pipeline import Pipeline
+from src.summation import MODES, PAIRWISE_BLOCK, Accumulator, sum_of
+
+
+_rng = random.Random(0)
+# Mixed signs and magnitudes: the sum is far smaller than its terms
+ILL_CONDITIONED = [
+    _rng.choice((-1, 1)) * _rng.random() * 10.0 ** _rng.randint(-8, 8)
+    for _ in range(20_000)
+]
+
+
+class TestSumOf:
+    """Test whole-input summation."""
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_simple_sums(self, mode):
+        """Test every mode sums small inputs exactly."""
+        assert sum_of([1, 2, 3.5], mode) == 6.5
+        assert sum_of([], mode) == 0
+
+    @pytest.mark.parametrize(
+        ("mode", "ulps"),
+        [("pairwise", 16), ("kahan", 1), ("exact", 0)],
+    )
+    def test_accuracy(self, mode, ulps):
+        """Test accurate modes stay within a few ulps of the exact sum."""
+        exact = math.fsum(ILL_CONDITIONED)
+        total = sum_of(ILL_CONDITIONED, mode)
+        assert abs(total - exact) <= ulps * math.ulp(exact)
+
+    @pytest.mark.parametrize("mode", ["kahan", "exact"])
+    def test_cancellation(self, mode):
+        """Test compensated modes keep values a naive loop rounds away."""
+        assert sum_of([1e100, 1.0, -1e100], mode) == 1.0
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_input_types(self, mode):
+        """Test lists, typed arrays, Datasets and iterators give one sum."""
+        values = [x / 8 for x in range(3 * PAIRWISE_BLOCK + 5)]
+        expected = math.fsum(values)
+        assert sum_of(values, mode) == expected
+        assert sum_of(tuple(values), mode) == expected
+        assert sum_of(array("d", values), mode) == expected
+        assert sum_of(Dataset(values, "float32"), mode) == expected
+        assert sum_of(iter(values), mode) == expected
+
+    def test_pairwise_keeps_ints_exact(self):
+        """Test pairwise sums of ints stay ints."""
+        assert sum_of(range(10**4), "pairwise") == sum(range(10**4))
+        assert sum_of([10**30, 1], "pairwise") == 10**30 + 1
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_infinity(self, mode):
+        """Test infinities propagate instead of turning into NaN."""
+        assert sum_of([1.0, math.inf, 2.0], mode) == math.inf
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_out_of_range(self, mode):
+        """Test overflow and opposite infinities follow float arithmetic."""
+        assert sum_of([1e308, 1e308], mode) == math.inf
+        assert sum_of(iter([-1e308, -1e308, 1.0]), mode) == -math.inf
+        assert math.isnan(sum_of([math.inf, -math.inf], mode))
+        assert math.isnan(sum_of([1.0, math.nan], mode))
+
+    def test_unknown_mode(self):
+        """Test an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown summation mode: fast"):
+            sum_of([1.0], "fast")
+
+    def test_non_numbers(self):
+        """Test non-numbers raise TypeError."""
+        with pytest.raises(TypeError):
+            sum_of([1, "2"], "kahan")
+
+
+class TestAccumulator:
+    """Test running totals."""
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_matches_exact_sum(self, mode):
+        """Test accurate running totals match the exact sum."""
+        accumulator = Accumulator(mode, 1.5)
+        for value in ILL_CONDITIONED[:1000]:
+            accumulator.add(value)
+        exact = math.fsum([1.5, *ILL_CONDITIONED[:1000]])
+        if mode == "naive":
+            assert accumulator.value == pytest.approx(exact)
+        else:
+            assert abs(accumulator.value - exact) <= 4 * math.ulp(1e8)
+
+    @pytest.mark.parametrize("mode", ["kahan", "exact"])
+    def test_compensation(self, mode):
+        """Test compensated running totals recover cancelled values."""
+        accumulator = Accumulator(mode)
+        for _ in range(10):
+            accumulator.add(0.1)
+        assert accumulator.value == 1.0
+        accumulator.add(1e100)
+        accumulator.add(1.0)
+        accumulator.add(-1e100)
+        assert accumulator.value == 2.0
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_reset(self, mode):
+        """Test reset discards the running sum."""
+        accumulator = Accumulator(mode)
+        accumulator.add(5)
+        accumulator.reset(2)
+        accumulator.add(3)
+        assert accumulator.value == 5
+        assert repr(accumulator) == f"Accumulator({mode!r}, {accumulator.value!r})"
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_special_values(self, mode):
+        """Test infinities and NaN propagate."""
+        accumulator = Accumulator(mode, 1.0)
+        accumulator.add(math.inf)
+        accumulator.add(1.0)
+        assert accumulator.value == math.inf
+        accumulator.add(math.nan)
+        assert math.isnan(accumulator.value)
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_overflow(self, mode):
+        """Test an overflowing running total becomes infinite and stays usable."""
+        accumulator = Accumulator(mode, 1e308)
+        accumulator.add(1e308)
+        assert accumulator.value == math.inf
+        accumulator.add(-1.0)
+        assert accumulator.value == math.inf
+        accumulator.reset(1.0)
+        accumulator.add(2.0)
+        assert accumulator.value == 3.0
+
+    def test_naive_keeps_ints(self):
+        """Test naive running totals of ints stay ints."""
+        accumulator = Accumulator()
+        accumulator.add(10**30)
+        accumulator.add(1)
+        assert accumulator.value == 10**30 + 1
+
+    def test_unknown_mode(self):
+        """Test an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown summation mode"):
+            Accumulator("fast")
+
+
+class TestCalculatorSummation:
+    """Test Calculator operations under each summation mode."""
+
+    def test_default_mode(self):
+        """Test calculators sum naively by default."""
+        assert Calculator().summation == "naive"
+
+    def test_unknown_mode(self):
+        """Test an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown summation mode"):
+            Calculator(summation="fast")
+
+    @pytest.mark.parametrize("mode", ["kahan", "exact"])
+    def test_mean_and_describe(self, mode):
+        """Test mean and describe use the chosen mode."""
+        calc = Calculator(summation=mode)
+        values = [1e100, 1.0, -1e100, 3.0]
+        assert calc.mean(values) == 1.0
+        assert calc.mean(Dataset(values)) == 1.0
+        stats = calc.describe(values)
+        assert stats["sum"] == 4.0
+        assert stats["mean"] == 1.0
+
+    @pytest.mark.parametrize("mode", ["kahan", "exact"])
+    def test_group_stats_and_pipeline_match_mean(self, mode):
+        """Test grouped and pipelined sums and means use the chosen mode."""
+        calc = Calculator(summation=mode)
+        expected = calc.mean(ILL_CONDITIONED)
+        stats = calc.group_stats([0] * len(ILL_CONDITIONED), ILL_CONDITIONED)
+        assert stats[0]["mean"] == expected
+        pipeline = Pipeline(ILL_CONDITIONED, calc)
+        assert pipeline.reduce("mean") == expected
+        assert pipeline.reduce("sum") == sum_of(ILL_CONDITIONED, mode)
+
+    @pytest.mark.parametrize("mode", ["kahan", "exact"])
+    def test_memory_accumulates_accurately(self, mode):
+        """Test memory_add and memory_subtract compensate rounding."""
+        calc = Calculator(summation=mode)
+        for _ in range(10):
+            calc.memory_add(0.1)
+        calc.memory_subtract(0.5)
+        assert calc.memory_recall() == 0.5
+        calc.memory_store(2)
+        calc.memory_add(1)
+        assert calc.memory_recall() == 3
+        calc.memory_clear()
+        assert calc.memory == 0
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_overflow(self, mode, tmp_path):
+        """Test overflow gives infinity in every mode, with or without a journal."""
+        assert Calculator(summation=mode).mean([1e308, 1e308]) == math.inf
+        with OperationJournal(tmp_path / "calc.journal") as journal:
+            calc = Calculator(journal=journal, summation=mode)
+            calc.memory_store(1e308)
+            calc.memory_add(1e308)
+            assert calc.memory_recall() == math.inf
+            calc.memory_store(1)
+            assert calc.memory_recall() == 1
+
+    @pytest.mark.parametrize("mode", ["pairwise", "kahan", "exact"])
+    def test_chain_accumulates_accurately(self, mode):
+        """Test chain_add and chain_subtract compensate rounding."""
+        calc = Calculator(summation=mode).chain(0)
+        for _ in range(1000):
+            calc.chain_add(0.1)
+        assert calc.get_result() == pytest.approx(100.0, abs=1e-12)
+        calc.chain_subtract(50).chain_multiply(2).chain_add(0.5)
+        assert calc.get_result() == pytest.approx(100.5, abs=1e-12)
+        calc.reset_chain()
+        assert calc.chain_value is None
+
+    def test_journal_replay(self, tmp_path):
+        """Test replayed state carries over to an accurate calculator."""
+        path = tmp_path / "calc.journal"
+        with OperationJournal(path) as journal:
+            calc = Calculator(journal=journal, summation="kahan")
+            calc.memory_store(1)
+            calc.memory_add(0.25)
+            calc.chain(2).chain_add(3)
+        restored = Calculator(summation="kahan")
+        replay(path, restored)
+        assert restored.memory == 1.25
+        assert restored.chain_value == 5